@@ -0,0 +1,59 @@
+from django.core.cache import caches
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+
+_MISSING = object()
+
+
+class AppCache:
+    """
+    Wrapper over one of the CACHES aliases which counts hits and misses of the current process.
+    """
+
+    def __init__(self, alias):
+        self.alias = alias
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def backend(self):
+        return caches[self.alias]
+
+    def get(self, key, default=None):
+        value = self.backend.get(key, _MISSING)
+        if value is _MISSING:
+            self.misses += 1
+            return default
+
+        self.hits += 1
+        return value
+
+    def get_or_set(self, key, default, timeout=DEFAULT_TIMEOUT):
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = default() if callable(default) else default
+            self.backend.set(key, value, timeout)
+        return value
+
+    def set(self, key, value, timeout=DEFAULT_TIMEOUT):
+        self.backend.set(key, value, timeout)
+
+    def delete(self, *keys):
+        self.backend.delete_many(keys)
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 4) if total else 0,
+        }
+
+
+default_cache = AppCache('default')
+user_cache = AppCache('user')
+task_cache = AppCache('task')
+bid_cache = AppCache('bid')
+
+
+def get_cache_stats():
+    return {cache.alias: cache.stats() for cache in (default_cache, user_cache, task_cache, bid_cache)}
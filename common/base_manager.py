@@ -0,0 +1,10 @@
+from django.db import models
+
+
+class AliveManager(models.Manager):
+    """
+    Default manager of BaseModel, hides soft deleted rows. Use all_objects to reach them.
+    """
+
+    def get_queryset(self):
+        return super().get_queryset().filter(is_delete=False)
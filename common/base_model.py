@@ -4,7 +4,9 @@ import secrets
 from django.core.files.base import ContentFile
 from django.db import models
 
-from utils.custom_datetime import get_formatted_current_time
+from common.base_manager import AliveManager
+
+from utils.custom_datetime import get_current_datetime
 
 
 class BaseModel(models.Model):
@@ -13,22 +15,25 @@ class BaseModel(models.Model):
     created_by = models.ForeignKey(
         "user.User", related_name='created_%(class)s_set', on_delete=models.DO_NOTHING, null=True, blank=True
     )
-    created_on = models.CharField(max_length=100, null=True, blank=True)
+    created_on = models.DateTimeField(null=True, blank=True)
     updated_by = models.ForeignKey(
         "user.User", related_name='updated_%(class)s_set', on_delete=models.DO_NOTHING, null=True, blank=True
     )
-    updated_on = models.CharField(max_length=100, null=True, blank=True)
+    updated_on = models.DateTimeField(null=True, blank=True)
     deleted_by = models.ForeignKey(
         "user.User", related_name='deleted_%(class)s_set', on_delete=models.DO_NOTHING, null=True, blank=True
     )
-    deleted_on = models.CharField(max_length=100, null=True, blank=True)
+    deleted_on = models.DateTimeField(null=True, blank=True)
+
+    objects = AliveManager()
+    all_objects = models.Manager()
 
     class Meta:
         abstract = True
 
     def save(self, *args, **kwargs):
         if not self.created_on:
-            self.created_on = get_formatted_current_time()
+            self.created_on = get_current_datetime()
         super(BaseModel, self).save(*args, **kwargs)
 
     def update(self, validated_data):
@@ -37,7 +42,7 @@ class BaseModel(models.Model):
         for field, value in validated_data.items():
             setattr(self, field, value)
 
-        self.updated_on = get_formatted_current_time()
+        self.updated_on = get_current_datetime()
         self.updated_by = validated_data.get('updated_by', None)
         self.save()
 
@@ -45,7 +50,7 @@ class BaseModel(models.Model):
 
     def delete(self, **kwargs):
         self.deleted_by = kwargs.get('deleted_by', None)
-        self.deleted_on = get_formatted_current_time()
+        self.deleted_on = get_current_datetime()
         self.is_delete = True
         self.save()
 
@@ -1,25 +1,216 @@
-from pymongo import MongoClient, DESCENDING
-from pymongo.errors import ConnectionFailure
+import asyncio
+import base64
+import binascii
+import os
+import threading
+
+from bson import json_util
+from pymongo import AsyncMongoClient, MongoClient, ASCENDING, DESCENDING
 from django.conf import settings
+from django.core.handlers.asgi import ASGIRequest
+from rest_framework.exceptions import ValidationError
+
+_lock = threading.Lock()
+_client = None
+_client_pid = None
+_async_client = None
+_async_client_loop = None
+
+
+def get_mongo_client():
+    """
+    Process wide MongoClient, created on first use and shared by all threads of the process. MongoClient keeps its
+    own connection pool, so requests reuse pooled sockets instead of connecting and pinging every time.
+
+    A client must not be used across fork (gunicorn/celery prefork workers), the child drops the inherited one and
+    lazily creates its own. connect=False defers any network I/O to the first operation.
+    """
+    global _client, _client_pid
+
+    pid = os.getpid()
+    if _client is not None and _client_pid == pid:
+        return _client
+
+    with _lock:
+        if _client is None or _client_pid != pid:
+            _client = MongoClient(settings.MONGO_DB_HOST, connect=False, **_client_options())
+            _client_pid = pid
+        return _client
+
+
+def get_async_mongo_client():
+    """
+    Process wide AsyncMongoClient for async views. An async client belongs to the event loop it runs on; under
+    ASGI every request of a worker runs on the same loop, so they all share one pool. Only call it from such a
+    long lived loop: a WSGI server runs each async view in a fresh loop, and the client made for it could not be
+    closed once that loop is gone (chat_history uses the sync client there, see is_asgi_request).
+    """
+    global _async_client, _async_client_loop
+
+    loop = asyncio.get_running_loop()
+    if _async_client is None or _async_client_loop is not loop:
+        _async_client = AsyncMongoClient(settings.MONGO_DB_HOST, connect=False, **_client_options())
+        _async_client_loop = loop
+    return _async_client
+
+
+def is_asgi_request(request):
+    """
+    Whether the request is served by an ASGI server, whose event loop outlives it.
+    """
+    return isinstance(request, ASGIRequest)
+
+
+def _client_options():
+    return {
+        'maxPoolSize': settings.MONGO_MAX_POOL_SIZE,
+        'minPoolSize': settings.MONGO_MIN_POOL_SIZE,
+        'serverSelectionTimeoutMS': settings.MONGO_SERVER_SELECTION_TIMEOUT_MS,
+        'connectTimeoutMS': settings.MONGO_CONNECT_TIMEOUT_MS,
+        'socketTimeoutMS': settings.MONGO_SOCKET_TIMEOUT_MS,
+    }
+
+
+def _reset_after_fork():
+    global _client, _client_pid, _async_client, _async_client_loop
+    # The inherited clients share sockets with the parent, they are dropped without close()
+    _client = None
+    _client_pid = None
+    _async_client = None
+    _async_client_loop = None
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def ping_mongo():
+    """
+    Health check, kept out of the request path. Raises a pymongo error when the server cannot be reached.
+    """
+    return get_mongo_client().admin.command('ping')
+
 
+def encode_message_cursor(message):
+    return base64.urlsafe_b64encode(json_util.dumps([message["created_on"], message["_id"]]).encode()).decode()
 
-class MongoDBClient:
+
+def decode_message_cursor(cursor):
+    try:
+        created_on, message_id = json_util.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (ValueError, TypeError, binascii.Error):
+        raise ValidationError("Invalid cursor")
+    return created_on, message_id
+
+
+class ChatHistoryMixin:
+    CHAT_COLLECTION = "Chat"
+    # Serves the room filter and both sort directions of the history, create it with mongo_ensure_indexes
+    CHAT_HISTORY_INDEX = [("room_id", ASCENDING), ("created_on", DESCENDING), ("_id", DESCENDING)]
+    CHAT_HISTORY_FIELDS = {"room_id": 1, "sender": 1, "receiver": 1, "message": 1, "created_on": 1}
+    MAX_LIMIT = 100
+
+    def find_chat_history_page(self, room_id, limit=10, before=None, after=None):
+        """
+        Keyset page of a room's messages. Without cursors it is the newest page, before selects the messages older
+        than the cursor and after the newer ones. Each page is one range scan of CHAT_HISTORY_INDEX whatever its
+        depth. Returns the find cursor (limit + 1 rows) and the page arguments for build_chat_history_page.
+        """
+        limit = min(max(int(limit), 1), self.MAX_LIMIT)
+        query = {"room_id": room_id}
+        newer = after is not None
+        if newer or before is not None:
+            created_on, message_id = decode_message_cursor(after if newer else before)
+            operator = "$gt" if newer else "$lt"
+            query["$or"] = [
+                {"created_on": {operator: created_on}},
+                {"created_on": created_on, "_id": {operator: message_id}},
+            ]
+
+        direction = ASCENDING if newer else DESCENDING
+        cursor = self.db[self.CHAT_COLLECTION].find(query, {"_id": 1, **self.CHAT_HISTORY_FIELDS}).sort(
+            [("created_on", direction), ("_id", direction)]
+        ).limit(limit + 1)
+        return cursor, limit, newer, after
+
+    @staticmethod
+    def build_chat_history_page(messages, limit, newer, after):
+        """
+        Messages in chronological order with the cursors to pass back as before/after.
+        """
+        has_more = len(messages) > limit
+        messages = messages[:limit]
+        if not newer:
+            messages.reverse()
+
+        if messages:
+            # Older messages only exist past the first one when the scan went further back, newer ones can
+            # always arrive, so the after cursor is returned even on the latest page
+            has_older = has_more if not newer else True
+            before_cursor = encode_message_cursor(messages[0]) if has_older else None
+            after_cursor = encode_message_cursor(messages[-1])
+        else:
+            before_cursor = None
+            after_cursor = after
+
+        for message in messages:
+            message.pop("_id")
+        return messages, before_cursor, after_cursor
+
+
+class MongoDBClient(ChatHistoryMixin):
     def __init__(self):
-        try:
-            self.client = MongoClient(
-                settings.MONGO_DB_HOST,
-                serverSelectionTimeoutMS=5000  # 5 seconds timeout
-            )
-            self.client.server_info()  # Trigger exception if connection fails
-            self.db = self.client["PearsChatDB"]
-        except ConnectionFailure as e:
-            print(f"Could not connect to MongoDB: {e}")
+        self.client = get_mongo_client()
+        self.db = self.client[settings.MONGO_DB_NAME]
+
+    def ensure_indexes(self):
+        return self.db[self.CHAT_COLLECTION].create_index(self.CHAT_HISTORY_INDEX, name="room_created_on_id")
 
     def get_chat_history(self, room_id, page=1, limit=10):
-        collection = self.db["Chat"]
+        collection = self.db[self.CHAT_COLLECTION]
         skip = (page - 1) * limit
         query = {"room_id": room_id}
-        projection = {"_id": 0, "room_id": 1, "sender": 1, "receiver": 1, "message": 1, "created_on": 1}
+        projection = {"_id": 0, **self.CHAT_HISTORY_FIELDS}
         cursor = collection.find(query, projection).sort("created_on", DESCENDING).skip(skip).limit(limit)
         results = list(cursor)  # Convert the cursor to a list
         return results[::-1]
+
+    def get_chat_history_page(self, room_id, limit=10, before=None, after=None):
+        cursor, limit, newer, after = self.find_chat_history_page(room_id, limit, before, after)
+        return self.build_chat_history_page(list(cursor), limit, newer, after)
+
+    def get_last_messages(self, room_ids):
+        """
+        Latest message of each room, in one aggregation for a whole page of rooms. The sort matches
+        CHAT_HISTORY_INDEX, so the server reads the first index entry of each room instead of its history.
+        Returns {room_id: {"message", "sender", "created_on"}}, rooms without messages are left out.
+        """
+        if not room_ids:
+            return {}
+
+        pipeline = [
+            {"$match": {"room_id": {"$in": list(room_ids)}}},
+            {"$sort": {"room_id": ASCENDING, "created_on": DESCENDING, "_id": DESCENDING}},
+            {"$group": {
+                "_id": "$room_id",
+                "message": {"$first": "$message"},
+                "sender": {"$first": "$sender"},
+                "created_on": {"$first": "$created_on"},
+            }},
+        ]
+        return {row.pop("_id"): row for row in self.db[self.CHAT_COLLECTION].aggregate(pipeline)}
+
+
+class AsyncMongoDBClient(ChatHistoryMixin):
+    """
+    Same reads as MongoDBClient on the async driver, for async views. The event loop is free while Mongo answers,
+    so one ASGI worker serves many history fetches at once instead of one per thread.
+    """
+
+    def __init__(self):
+        self.client = get_async_mongo_client()
+        self.db = self.client[settings.MONGO_DB_NAME]
+
+    async def get_chat_history_page(self, room_id, limit=10, before=None, after=None):
+        cursor, limit, newer, after = self.find_chat_history_page(room_id, limit, before, after)
+        return self.build_chat_history_page(await cursor.to_list(), limit, newer, after)
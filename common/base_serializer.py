@@ -1,47 +1,76 @@
-import base64
-import secrets
-
-from django.core.files.base import ContentFile
 from rest_framework import serializers
 
-from utils.custom_datetime import get_formatted_current_time
+from core_apps.upload.models import Upload
+from utils.base64_file import decode_base64_file
+from utils.custom_datetime import get_current_datetime
 
 
 class CustomBaseSerializer(serializers.ModelSerializer):
     @staticmethod
     def update_related_objects(instance, data_list, model, foreign_key_name=None, user=None, required_decode=False):
+        """
+        Applies a list of nested rows: items with an id update (or soft delete, with is_delete) that row, the others
+        create one under the instance. The existing rows are read with one query and written back with one bulk
+        UPDATE, soft deletes and creations take one query each, whatever the number of items.
+        """
+        now = get_current_datetime()
         for data in data_list:
-            obj_id = data.get('id')
-            if required_decode and "file" in data:
-                file_format, file_str = data["file"].split(';base64,')
-                file_extension = file_format.split('/')[-1]
-                file_data = base64.b64decode(file_str)
-                file_name = f'{secrets.token_hex(8)}.{file_extension}'
-                data["file"] = ContentFile(file_data, name=file_name)
+            if required_decode and "upload_id" in data:
+                data["file"] = Upload.claim(data.pop("upload_id"), user)
+            elif required_decode and "file" in data:
+                data["file"] = decode_base64_file(data["file"])
 
+        pk_field = model._meta.pk
+        existing = model.objects.in_bulk([pk_field.to_python(data['id']) for data in data_list if data.get('id')])
+        updated, update_fields, deleted_ids, created = {}, {'updated_by', 'updated_on'}, set(), []
+        for data in data_list:
+            obj_id = data.get('id')
             if obj_id:
-                try:
-                    obj_instance = model.objects.get(id=obj_id)
-                    data["updated_by"] = user
-                    data["updated_on"] = get_formatted_current_time()
-
-                    is_delete = data.pop("is_delete", False)
-                    if is_delete:
-                        obj_instance.delete(deleted_by=user)
-                        continue
-
-                    for attr, value in data.items():
-                        setattr(obj_instance, attr, value)
-                    obj_instance.save()
-                except model.DoesNotExist:
+                obj_id = pk_field.to_python(obj_id)
+                obj_instance = existing.get(obj_id)
+                # Ids of other models' rows, deleted rows or rows deleted earlier in the list are skipped
+                if obj_instance is None or obj_id in deleted_ids:
+                    continue
+
+                data["updated_by"] = user
+                data["updated_on"] = now
+                if data.pop("is_delete", False):
+                    deleted_ids.add(obj_id)
                     continue
+
+                for attr, value in data.items():
+                    setattr(obj_instance, attr, value)
+                update_fields.update(data)
+                updated[obj_id] = obj_instance
             else:
                 if foreign_key_name:
                     data[foreign_key_name] = instance
                 if user:
                     data['created_by'] = user
 
-                model.objects.create(**data)
+                obj_instance = model(**data)
+                # Set by BaseModel.save, which bulk_create bypasses
+                obj_instance.created_on = obj_instance.created_on or now
+                created.append(obj_instance)
+
+        if updated:
+            if any(not obj_instance.created_on for obj_instance in updated.values()):
+                update_fields.add('created_on')
+            # Foreign keys may be sent under their attname (language_id)
+            fields = [field for field in model._meta.concrete_fields
+                      if (field.name in update_fields or field.attname in update_fields) and not field.primary_key]
+            for obj_instance in updated.values():
+                obj_instance.created_on = obj_instance.created_on or now
+                # What save() does per field, so new files are written to storage before their name is
+                for field in fields:
+                    setattr(obj_instance, field.attname, field.pre_save(obj_instance, False))
+            model.objects.bulk_update(updated.values(), [field.name for field in fields])
+
+        if deleted_ids:
+            model.objects.filter(id__in=deleted_ids).update(is_delete=True, deleted_by=user, deleted_on=now)
+
+        if created:
+            model.objects.bulk_create(created)
 
     def to_representation(self, instance):
         representation = super().to_representation(instance)
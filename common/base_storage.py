@@ -0,0 +1,83 @@
+from urllib.parse import urlencode
+
+from django.conf import settings
+from django.core import signing
+from django.core.files.storage import default_storage
+
+
+def is_object_storage():
+    return settings.MEDIA_STORAGE == 's3'
+
+
+def sign_media_name(name, user):
+    """
+    Token letting the user download the local file with the given storage name through the media view, for
+    MEDIA_URL_EXPIRE seconds. Browsers fetch media without the Authorization header, the token stands in for it.
+    """
+    return signing.dumps(user.id, salt=f'media:{name}')
+
+
+def unsign_media_name(name, token):
+    """
+    Id of the user a media token was issued to, None when it is invalid, expired or for another file.
+    """
+    try:
+        return signing.loads(token, salt=f'media:{name}', max_age=settings.MEDIA_URL_EXPIRE)
+    except signing.BadSignature:
+        return None
+
+
+def get_media_url(file, request=None):
+    """
+    URL a client downloads the file from. With object storage it is a presigned URL on the bucket, valid for
+    AWS_QUERYSTRING_EXPIRE seconds, so the bytes never pass through an app worker. Local files are served under
+    MEDIA_URL by the media view, which checks access; the URL carries a token signed for the requesting user.
+    """
+    return get_media_name_url(file.name, request)
+
+
+def get_media_name_url(name, request=None):
+    file_url = default_storage.url(name)
+    if is_object_storage():
+        return file_url
+
+    user = getattr(request, 'user', None)
+    if user is not None and user.is_authenticated:
+        file_url = f"{file_url}?{urlencode({'token': sign_media_name(name, user)})}"
+    file_url = request.build_absolute_uri(file_url) if request else file_url
+    be_url = settings.BACKEND_URL
+    return f"{be_url}{file_url}" if be_url else file_url
+
+
+def get_image_urls(file, variants, request=None):
+    """
+    URLs of an image and of its resized copies (utils/image_variants.py) as {"original": url, "variants":
+    {size: {extension: url}}}, None without an image. Copies still being made, or made from a previous image,
+    are left out.
+    """
+    if not file:
+        return None
+
+    sizes = variants if variants.get('source') == file.name else {}
+    return {
+        'original': get_media_url(file, request),
+        'variants': {
+            size: {extension: get_media_name_url(name, request) for extension, name in names.items()}
+            for size, names in sizes.items() if size != 'source'
+        },
+    }
+
+
+def presigned_upload(name, content_type, max_size):
+    """
+    Presigned POST form letting a client send one file straight to the bucket under the given storage name. The
+    policy pins the key and content type and bounds the size, the bucket refuses anything else.
+    """
+    key = default_storage._normalize_name(name)
+    return default_storage.bucket.meta.client.generate_presigned_post(
+        Bucket=default_storage.bucket_name,
+        Key=key,
+        Fields={'Content-Type': content_type},
+        Conditions=[{'Content-Type': content_type}, ['content-length-range', 1, max_size]],
+        ExpiresIn=settings.MEDIA_UPLOAD_URL_EXPIRE,
+    )
@@ -1,12 +1,48 @@
+import hashlib
 from functools import wraps
+from urllib.parse import urlencode
 
+from django.conf import settings
 from django.db import transaction
+from django.http import JsonResponse
+from django.utils.http import parse_etags, quote_etag
 from rest_framework import status
-from rest_framework.exceptions import ValidationError
+from rest_framework.exceptions import AuthenticationFailed, NotAuthenticated, NotFound, ValidationError
 from rest_framework.generics import get_object_or_404
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework.utils.encoders import JSONEncoder
 from rest_framework.views import APIView
 from rest_framework.response import Response
-from django.core.paginator import Paginator
+
+from common.base_cache import default_cache
+from common.base_pagination import (COUNT_CACHED, COUNT_ESTIMATE, COUNT_EXACT, PAGINATION_PARAMS, CountedPaginator,
+                                    CursorPage, CursorPaginator, estimate_count)
+from core_apps.user.authentication import ClaimsStatelessAuthentication
+
+
+def validation_errors(ex):
+    errors = []
+    if isinstance(ex.detail, dict):
+        for key, value in ex.detail.items():
+            errors.extend(value if isinstance(value, list) else [value])
+    elif isinstance(ex.detail, list):
+        errors = ex.detail
+    else:
+        errors.append(str(ex))
+    return errors
+
+
+def positive_int(value, name):
+    """
+    Query parameter as a positive integer, a ValidationError (400) naming it otherwise.
+    """
+    try:
+        value = int(value)
+    except (TypeError, ValueError):
+        raise ValidationError(f"Invalid {name}")
+    if value <= 0:
+        raise ValidationError(f"Invalid {name}")
+    return value
 
 
 def custom_exception_handler(func):
@@ -14,17 +50,8 @@ def custom_exception_handler(func):
         try:
             return func(*args, **kwargs)
         except ValidationError as ex:
-            errors = []
-            if isinstance(ex.detail, dict):
-                for key, value in ex.detail.items():
-                    errors.extend(value if isinstance(value, list) else [value])
-            elif isinstance(ex.detail, list):
-                errors = ex.detail
-            else:
-                errors.append(str(ex))
-
             return Response(
-                {"message": "Validation error", "errors": errors},
+                {"message": "Validation error", "errors": validation_errors(ex)},
                 status=status.HTTP_400_BAD_REQUEST
             )
         except Exception as ex:
@@ -34,13 +61,127 @@ def custom_exception_handler(func):
     return wrapper
 
 
+def async_exception_handler(func):
+    """
+    custom_exception_handler for async Django views, answering with the same bodies as JsonResponse. Failed
+    authentication and missing objects give the 401 and 404 bodies DRF would send.
+    """
+
+    @wraps(func)
+    async def wrapper(*args, **kwargs):
+        try:
+            return await func(*args, **kwargs)
+        except ValidationError as ex:
+            return json_response({"message": "Validation error", "errors": validation_errors(ex)},
+                                 status.HTTP_400_BAD_REQUEST)
+        except (AuthenticationFailed, NotAuthenticated, NotFound) as ex:
+            return json_response(ex.detail if isinstance(ex.detail, dict) else {"detail": ex.detail}, ex.status_code)
+        except Exception as ex:
+            return json_response({"message": "Internal server error: ", "errors": [str(ex)]},
+                                 status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+    return wrapper
+
+
+def json_response(data, status_code=status.HTTP_200_OK):
+    # DRF's encoder, so dates and ids render as they do in Response
+    return JsonResponse(data, status=status_code, encoder=JSONEncoder, safe=False)
+
+
 class BaseView(APIView):
+    # Read-only requests are authenticated from the token claims alone, without loading the user row.
+    # Only takes effect with JWT_ROLE_CLAIMS enabled and for views that need nothing beyond the claims.
+    stateless_read = False
+
+    # How list totals are computed, see get_count. Views with expensive filtered counts use COUNT_CACHED.
+    count_strategy = COUNT_EXACT
+    count_cache = default_cache
+    count_cache_timeout = 30
+    count_estimate_threshold = 10000
+
+    def get_authenticators(self):
+        if self.stateless_read and settings.JWT_ROLE_CLAIMS and self.request.method in SAFE_METHODS:
+            return [ClaimsStatelessAuthentication()]
+        return super().get_authenticators()
+
     @staticmethod
     def get_object(model, object_id):
-        return get_object_or_404(model, id=object_id, is_delete=False)
+        # BaseModel managers already skip soft deleted rows, User's does not
+        queryset = model._default_manager.all()
+        if any(field.name == 'is_delete' for field in model._meta.concrete_fields):
+            queryset = queryset.filter(is_delete=False)
+        return get_object_or_404(queryset, id=object_id)
+
+    @staticmethod
+    def conditional_response(request, data, etag):
+        """
+        Returns 304 when the client already holds the representation identified by etag, the data otherwise.
+        """
+        etag = quote_etag(etag)
+        if_none_match = parse_etags(request.headers.get('If-None-Match', ''))
+        if etag in if_none_match or '*' in if_none_match:
+            response = Response(status=status.HTTP_304_NOT_MODIFIED)
+        else:
+            response = Response(data)
+        response['ETag'] = etag
+        response['Cache-Control'] = 'private, no-cache'
+        return response
+
+    def get_count(self, queryset, request, strategy=None):
+        """
+        Total for a list response using the view's count strategy:
+        exact - COUNT(*) on every request.
+        cached - COUNT(*) kept for count_cache_timeout seconds per user, path and filter params.
+        estimate - the planner row estimate when it is above count_estimate_threshold, exact below it.
+        """
+        strategy = strategy or self.count_strategy
+        if strategy == COUNT_CACHED:
+            return self.count_cache.get_or_set(self.get_count_cache_key(request), queryset.count,
+                                               self.count_cache_timeout)
+        if strategy == COUNT_ESTIMATE:
+            estimate = estimate_count(queryset)
+            return estimate if estimate >= self.count_estimate_threshold else queryset.count()
+        return queryset.count()
 
     @staticmethod
-    def paginate_queryset(queryset, request):
-        paginator = Paginator(queryset, request.query_params.get('limit', 10))
+    def get_count_cache_key(request):
+        params = sorted(
+            (key, value) for key, values in request.query_params.lists() if key not in PAGINATION_PARAMS
+            for value in values
+        )
+        digest = hashlib.sha1(f"{request.path}?{urlencode(params)}".encode()).hexdigest()
+        return f"count:{request.user.pk}:{digest}"
+
+    def paginate_queryset(self, queryset, request):
+        limit = request.query_params.get('limit', 10)
+        if 'cursor' in request.query_params:
+            count_mode = request.query_params.get('count', 'none')
+            if count_mode not in ('none', COUNT_EXACT, COUNT_ESTIMATE):
+                raise ValidationError("Invalid count mode")
+
+            count = None
+            if count_mode == COUNT_EXACT:
+                count = lambda: self.get_count(queryset, request)
+            elif count_mode == COUNT_ESTIMATE:
+                count = lambda: self.get_count(queryset, request, COUNT_ESTIMATE)
+            return CursorPaginator(queryset, limit, count).get_page(request.query_params['cursor'])
+
+        paginator = CountedPaginator(queryset, limit, lambda: self.get_count(queryset, request))
         page = paginator.get_page(request.query_params.get('page', 1))
         return page
+
+    @staticmethod
+    def paginated_response(page, data, counted=True):
+        """
+        Builds the list response for a page from paginate_queryset. Cursor pages carry the next/previous tokens,
+        their count is None unless one was requested with ?count=exact|estimate.
+        """
+        if isinstance(page, CursorPage):
+            body = {"data": data, "next": page.next_cursor, "previous": page.previous_cursor}
+            if counted:
+                body["count"] = page.count
+            return Response(body)
+
+        if counted:
+            return Response({"data": data, "count": page.paginator.count})
+        return Response(data)
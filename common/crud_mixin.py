@@ -2,7 +2,7 @@ from django.db import transaction
 from rest_framework import status
 from rest_framework.response import Response
 from common.base_view import BaseView, custom_exception_handler
-from utils.custom_datetime import get_formatted_current_time
+from utils.custom_datetime import get_current_datetime
 
 
 class CRUDMixin(BaseView):
@@ -34,6 +34,6 @@ class CRUDMixin(BaseView):
         instance = self.get_object(self.model, object_id)
         instance.is_delete = True
         instance.deleted_by = request.user
-        instance.deleted_on = get_formatted_current_time()
+        instance.deleted_on = get_current_datetime()
         instance.save()
         return Response({"message": "Successfully deleted"}, status=status.HTTP_204_NO_CONTENT)
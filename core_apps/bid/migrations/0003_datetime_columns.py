@@ -0,0 +1,146 @@
+import datetime
+
+from django.db import migrations, models
+
+from utils.custom_datetime import naive_datetime
+
+# Timestamp columns moved from CharField to DateTimeField, existing strings are parsed into a new column
+FIELDS = {
+    'bid': ['created_on', 'updated_on', 'deleted_on'],
+    'additionalcost': ['created_on', 'updated_on', 'deleted_on'],
+}
+
+BATCH_SIZE = 1000
+
+
+def to_datetime(value):
+    if not value:
+        return None
+    try:
+        return naive_datetime(value).replace(tzinfo=datetime.timezone.utc)
+    except ValueError:
+        return None
+
+
+def to_string(value):
+    return value.strftime("%Y-%m-%d %H:%M:%S") if value else None
+
+
+def convert(apps, source_suffix, target_suffix, converter):
+    for model_name, field_names in FIELDS.items():
+        model = apps.get_model('bid', model_name)
+        target_fields = [f"{field_name}{target_suffix}" for field_name in field_names]
+        batch = []
+        for instance in model.objects.order_by('pk').iterator(chunk_size=BATCH_SIZE):
+            for field_name in field_names:
+                value = getattr(instance, f"{field_name}{source_suffix}")
+                setattr(instance, f"{field_name}{target_suffix}", converter(value))
+            batch.append(instance)
+            if len(batch) >= BATCH_SIZE:
+                model.objects.bulk_update(batch, target_fields)
+                batch = []
+        if batch:
+            model.objects.bulk_update(batch, target_fields)
+
+
+def copy_to_datetime(apps, schema_editor):
+    convert(apps, '', '_new', to_datetime)
+
+
+def copy_to_string(apps, schema_editor):
+    convert(apps, '_new', '', to_string)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bid', '0002_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='bid',
+            name='created_on_new',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='bid',
+            name='updated_on_new',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='bid',
+            name='deleted_on_new',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='additionalcost',
+            name='created_on_new',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='additionalcost',
+            name='updated_on_new',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='additionalcost',
+            name='deleted_on_new',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.RunPython(copy_to_datetime, copy_to_string),
+        migrations.RemoveField(
+            model_name='bid',
+            name='created_on',
+        ),
+        migrations.RenameField(
+            model_name='bid',
+            old_name='created_on_new',
+            new_name='created_on',
+        ),
+        migrations.RemoveField(
+            model_name='bid',
+            name='updated_on',
+        ),
+        migrations.RenameField(
+            model_name='bid',
+            old_name='updated_on_new',
+            new_name='updated_on',
+        ),
+        migrations.RemoveField(
+            model_name='bid',
+            name='deleted_on',
+        ),
+        migrations.RenameField(
+            model_name='bid',
+            old_name='deleted_on_new',
+            new_name='deleted_on',
+        ),
+        migrations.RemoveField(
+            model_name='additionalcost',
+            name='created_on',
+        ),
+        migrations.RenameField(
+            model_name='additionalcost',
+            old_name='created_on_new',
+            new_name='created_on',
+        ),
+        migrations.RemoveField(
+            model_name='additionalcost',
+            name='updated_on',
+        ),
+        migrations.RenameField(
+            model_name='additionalcost',
+            old_name='updated_on_new',
+            new_name='updated_on',
+        ),
+        migrations.RemoveField(
+            model_name='additionalcost',
+            name='deleted_on',
+        ),
+        migrations.RenameField(
+            model_name='additionalcost',
+            old_name='deleted_on_new',
+            new_name='deleted_on',
+        ),
+    ]
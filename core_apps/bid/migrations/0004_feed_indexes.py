@@ -0,0 +1,21 @@
+# Generated by Django 4.2.11 on 2026-10-18 20:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bid', '0003_datetime_columns'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='bid',
+            index=models.Index(fields=['task', '-id'], name='bid_task_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='bid',
+            index=models.Index(fields=['created_by', 'is_accepted', 'is_rejected', '-id'], name='bid_created_by_state_idx'),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 4.2.11 on 2026-10-18 20:48
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bid', '0004_feed_indexes'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='bid',
+            name='bid_task_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='bid',
+            name='bid_created_by_state_idx',
+        ),
+        migrations.AddIndex(
+            model_name='bid',
+            index=models.Index(condition=models.Q(('is_delete', False)), fields=['task', '-id'], name='bid_task_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='bid',
+            index=models.Index(condition=models.Q(('is_delete', False)), fields=['created_by', 'is_accepted', 'is_rejected', '-id'], name='bid_created_by_state_idx'),
+        ),
+    ]
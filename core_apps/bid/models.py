@@ -1,4 +1,5 @@
-from django.db import models
+from django.db import models, transaction
+from django.db.models import Q
 
 from common.base_model import BaseModel
 from core_apps.task.models import Task
@@ -24,6 +25,21 @@ class Bid(BaseModel):
                                        null=True,
                                        blank=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['task', '-id'], name='bid_task_idx', condition=Q(is_delete=False)),
+            models.Index(fields=['created_by', 'is_accepted', 'is_rejected', '-id'], name='bid_created_by_state_idx',
+                         condition=Q(is_delete=False)),
+        ]
+
+    def save(self, *args, **kwargs):
+        # Every bid write goes through here (create, update, accept/reject and the soft delete of CRUDMixin
+        # and BaseModel.delete), the task's bid columns are refreshed in the same transaction
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            if self.task_id:
+                Task.all_objects.filter(id=self.task_id).refresh_bid_stats()
+
 
 class AdditionalCost(BaseModel):
     bid = models.ForeignKey(Bid, related_name="additional_costs", on_delete=models.DO_NOTHING, null=True, blank=True)
@@ -4,7 +4,6 @@ from django.conf import settings
 from rest_framework import serializers
 
 from common.base_serializer import CustomBaseSerializer
-from core_apps.bid.models import Bid
 from core_apps.task.models import Task, Attachment, Skill
 from core_apps.user.models import User
 from core_apps.user.serializers.common_serializers import OrganizationIdNameSerializer, UserIdNameSerializer
@@ -23,10 +22,10 @@ class TaskBidSummarySerializer(serializers.ModelSerializer):
         read_only_fields = ('is_delete',)
 
     def get_min_bid_value(self, obj):
-        return Bid.objects.filter(task=obj).order_by('amount').values_list('amount', flat=True).first() or "0.00"
+        return obj.min_bid_amount or "0.00"
 
     def get_max_bid_value(self, obj):
-        return Bid.objects.filter(task=obj).order_by('-amount').values_list('amount', flat=True).first() or "0.00"
+        return obj.max_bid_amount or "0.00"
     
     def get_bid_status(self, obj):
         if obj.is_accepted:
@@ -38,4 +37,4 @@ class TaskBidSummarySerializer(serializers.ModelSerializer):
             return "Pending"
         
     def get_bid_count(self, obj):
-        return Bid.objects.filter(task=obj).count()
+        return obj.bid_count
@@ -3,6 +3,8 @@ from rest_framework.exceptions import ValidationError
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
+from common.base_cache import bid_cache
+from common.base_pagination import COUNT_CACHED
 from common.base_permission import IsConsultantManager, IsSales, IsGigWorker, IsCustomer, IsOverEmployee, IsTaskManager
 from common.base_view import custom_exception_handler, BaseView
 from common.crud_mixin import CRUDMixin
@@ -18,6 +20,8 @@ class BidView(CRUDMixin):
     permission_classes = [IsAuthenticated]
     serializer_class = BidSerializer
     model = Bid
+    count_strategy = COUNT_CACHED
+    count_cache = bid_cache
 
     def get_permissions(self):
         if self.request.method in ["POST", "PUT", "DELETE"]:
@@ -73,12 +77,13 @@ class BidView(CRUDMixin):
             bids = bids.filter(task__is_delete=False).order_by("-id")
             page = self.paginate_queryset(bids, request)
             serializer = BidSummarySerializer(page, many=True)
-            count = bids.count()
-            return Response({"data": serializer.data, "count": count})
+            return self.paginated_response(page, serializer.data)
 
 
 class BidSummaryView(CRUDMixin):
     permission_classes = [IsAuthenticated]
+    count_strategy = COUNT_CACHED
+    count_cache = bid_cache
 
     def get_permissions(self):
         if self.request.method in ["POST", "PUT", "DELETE"]:
@@ -93,13 +98,12 @@ class BidSummaryView(CRUDMixin):
         keyword = request.query_params.get('keyword', None)
         if request.user.has_organization:
             if request.user.has_any_role([User.ADMIN_ROLE, User.TASK_MANAGER_ROLE]):
-                tasks = Task.objects.filter(is_delete=False,
-                                            origin_organization_id=request.user.organization).order_by(
+                tasks = Task.objects.filter(origin_organization_id=request.user.organization).order_by(
                     "-id")
             else:
                 raise Exception("User is not authorized to view this page")
         else:
-            tasks = Task.objects.filter(is_delete=False, created_by_id=request.user.id).order_by(
+            tasks = Task.objects.filter(created_by_id=request.user.id).order_by(
                 "-id")
 
         if bid_type == "in_progress":
@@ -110,11 +114,10 @@ class BidSummaryView(CRUDMixin):
             tasks = tasks.filter(is_accepted=False)
         if keyword:
             tasks = tasks.filter(title__icontains=keyword)
-        tasks = tasks.filter(is_delete=False).order_by("-id")
+        tasks = tasks.order_by("-id")
         page = self.paginate_queryset(tasks, request)
         serializer = TaskBidSummarySerializer(page, many=True)
-        count = tasks.count()
-        return Response({"data": serializer.data, "count": count})
+        return self.paginated_response(page, serializer.data)
 
 
 class BidManagementView(BaseView):
@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class TaskConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'core_apps.task'
+
+    def ready(self):
+        import core_apps.task.signals.skill_signals
@@ -0,0 +1,109 @@
+import statistics
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Q
+
+from core_apps.task.models import Task
+from core_apps.user.models import Organization, User
+from utils.custom_datetime import get_current_datetime
+
+
+class Command(BaseCommand):
+    help = ('Compares the find-task feed written with DISTINCT over the sub contractor joins against the EXISTS '
+            'version on seeded data, the seeded rows are rolled back afterwards')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--tasks', type=int, default=100000)
+        parser.add_argument('--lists', type=int, default=1000, help='Number of sub contractor only tasks')
+        parser.add_argument('--list-size', type=int, default=5, help='Users and organizations on each list')
+        parser.add_argument('--page-size', type=int, default=25)
+        parser.add_argument('--repeat', type=int, default=5)
+        parser.add_argument('--explain', action='store_true', help='Print the query plans')
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            organization, user = self.seed(options['tasks'], options['lists'], options['list_size'])
+            for name, old, new in self.feeds(organization.id, user.id):
+                self.compare(name, old, new, options)
+            transaction.set_rollback(True)
+
+    def seed(self, task_count, list_count, list_size):
+        now = get_current_datetime()
+        organizations = [Organization.objects.create(name=f'benchmark-{i}') for i in range(list_size * 4)]
+        users = [User.objects.create(email=f'benchmark-{i}@example.com', organization=organizations[i])
+                 for i in range(list_size * 4)]
+        owner = User.objects.create(email='benchmark-owner@example.com')
+
+        step = max(task_count // max(list_count, 1), 1)
+        tasks = Task.objects.bulk_create(
+            (Task(title=f'Benchmark {i}', created_by=owner, created_on=now, is_post_approved=True,
+                  bid_deadline=now + timedelta(days=30),
+                  is_sub_contractors_only=i % step == 0 and i // step < list_count)
+             for i in range(task_count)),
+            batch_size=5000,
+        )
+
+        user_links, organization_links = [], []
+        for position, task in enumerate(task for task in tasks if task.is_sub_contractors_only):
+            # Every third list contains the benchmarked user and organization
+            offset = 0 if position % 3 == 0 else 1
+            for i in range(list_size):
+                user_links.append(Task.sub_contractors.through(task_id=task.id, user_id=users[offset + i].id))
+                organization_links.append(Task.sub_organizations.through(
+                    task_id=task.id, organization_id=organizations[offset + i].id))
+        Task.sub_contractors.through.objects.bulk_create(user_links, batch_size=5000)
+        Task.sub_organizations.through.objects.bulk_create(organization_links, batch_size=5000)
+
+        self.stdout.write(f'Seeded {len(tasks)} tasks, {len(user_links) // max(list_size, 1)} sub contractor lists')
+        return organizations[0], users[0]
+
+    def feeds(self, organization_id, user_id):
+        open_tasks = Task.objects.filter(is_accepted=False, is_post_approved=True,
+                                         bid_deadline__gte=get_current_datetime())
+        return [
+            (
+                'organization feed',
+                open_tasks.filter(
+                    Q(is_sub_contractors_only=False) |
+                    Q(is_sub_contractors_only=True, sub_organizations__in=[organization_id])
+                ).exclude(origin_organization_id=organization_id).distinct(),
+                open_tasks.visible_to_organization(organization_id).exclude(origin_organization_id=organization_id),
+            ),
+            (
+                'user feed',
+                open_tasks.exclude(created_by_id=user_id).filter(
+                    Q(is_sub_contractors_only=False) |
+                    Q(is_sub_contractors_only=True, sub_contractors__in=[user_id])
+                ).distinct(),
+                open_tasks.exclude(created_by_id=user_id).visible_to_user(user_id),
+            ),
+        ]
+
+    def compare(self, name, old, new, options):
+        results = {}
+        for label, queryset in (('distinct', old), ('exists', new)):
+            page = queryset.order_by('-id')[:options['page_size']]
+            page_ms, ids = self.measure(lambda: [task.id for task in page.all()], options['repeat'])
+            count_ms, count = self.measure(queryset.count, options['repeat'])
+            results[label] = (ids, count)
+            self.stdout.write(f'{name} {label}: page {page_ms:.1f} ms, count {count_ms:.1f} ms ({count} rows)')
+            if options['explain']:
+                self.stdout.write(page.explain())
+
+        if results['distinct'] != results['exists']:
+            self.stdout.write(self.style.ERROR(f'{name}: the two versions return different tasks'))
+        else:
+            self.stdout.write(self.style.SUCCESS(f'{name}: same tasks and count'))
+
+    @staticmethod
+    def measure(func, repeat):
+        timings = []
+        result = None
+        for _ in range(max(repeat, 1)):
+            start = time.perf_counter()
+            result = func()
+            timings.append((time.perf_counter() - start) * 1000)
+        return statistics.median(timings), result
@@ -0,0 +1,129 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+
+from core_apps.bid.models import Bid
+from core_apps.task.models import Task
+from core_apps.user.models import Organization, User
+from utils.custom_datetime import get_current_datetime
+
+
+class Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = ('Runs EXPLAIN on the task feed and bid listing queries and fails if any of them does not read the index '
+            'declared for it, or uses a sequential scan')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--seed', type=int, default=0,
+                            help='Number of tasks to seed (with 3 bids each) before explaining, rolled back afterwards')
+        parser.add_argument('--page-size', type=int, default=25)
+        parser.add_argument('--verbose-plan', action='store_true', help='Print the full plan of every query')
+
+    def handle(self, *args, **options):
+        if connection.vendor != 'postgresql':
+            raise CommandError('explain_feeds needs PostgreSQL, the database in use is %s' % connection.vendor)
+
+        failures = []
+        try:
+            with transaction.atomic():
+                if options['seed']:
+                    self.seed(options['seed'])
+                with connection.cursor() as cursor:
+                    cursor.execute('ANALYZE task_task, bid_bid')
+                    # Makes the planner prefer an index even on small tables. Any index will then do, the primary
+                    # key read backwards included, so each plan is checked for the index meant for its query
+                    cursor.execute('SET LOCAL enable_seqscan = off')
+
+                for name, queryset, expected in self.canonical_queries():
+                    plan = json.loads(queryset[:options['page_size']].explain(format='json'))
+                    scans = sorted(self.seq_scans(plan[0]['Plan']))
+                    indexes = set(self.index_names(plan[0]['Plan']))
+                    if options['verbose_plan']:
+                        self.stdout.write(json.dumps(plan, indent=2))
+                    if scans:
+                        failures.append(name)
+                        self.stdout.write(self.style.ERROR(f'{name}: Seq Scan on {", ".join(scans)}'))
+                    elif not indexes.intersection(expected):
+                        failures.append(name)
+                        self.stdout.write(self.style.ERROR(
+                            f'{name}: reads {", ".join(sorted(indexes)) or "no index"} instead of '
+                            f'{" or ".join(expected)}'
+                        ))
+                    else:
+                        self.stdout.write(self.style.SUCCESS(f'{name}: ok ({", ".join(sorted(indexes))})'))
+                raise Rollback
+        except Rollback:
+            pass
+
+        if failures:
+            raise CommandError(f'{len(failures)} queries miss their index: {", ".join(failures)}')
+
+    def seq_scans(self, node):
+        if node.get('Node Type') == 'Seq Scan':
+            yield node['Relation Name']
+        for child in node.get('Plans', []):
+            yield from self.seq_scans(child)
+
+    def index_names(self, node):
+        # Index Scan, Index Only Scan and Bitmap Index Scan nodes
+        if 'Index Name' in node:
+            yield node['Index Name']
+        for child in node.get('Plans', []):
+            yield from self.index_names(child)
+
+    def seed(self, count):
+        now = get_current_datetime()
+        organization = Organization.objects.create(name='explain-feeds')
+        user = User.objects.create(email='explain-feeds@example.com', organization=organization)
+        tasks = Task.objects.bulk_create(
+            Task(title=f'Task {i}', created_by=user, created_on=now, origin_organization=organization,
+                 worker_organization=organization if i % 2 else None, assignee=user if i % 2 else None,
+                 is_accepted=bool(i % 2), is_post_approved=True, is_delete=i % 10 == 0, bid_deadline=now)
+            for i in range(count)
+        )
+        Bid.objects.bulk_create(
+            Bid(task=task, amount=10 + i, bidder=user, created_by=user, created_on=now, is_accepted=i == 0)
+            for task in tasks for i in range(3)
+        )
+
+    def canonical_queries(self):
+        """
+        The filters TaskGetView and BidView apply for each access path, with the ordering and annotations they use,
+        and the indexes (Task.Meta, Bid.Meta) any of which the plan must read.
+        """
+        user = User.objects.filter(organization__isnull=False).first() or User.objects.first()
+        user_id = user.id if user else 0
+        organization_id = user.organization_id if user else 0
+
+        tasks = Task.objects.all()
+        accepted = tasks.filter(is_accepted=True)
+        open_tasks = tasks.filter(is_accepted=False, is_post_approved=True, bid_deadline__gte=get_current_datetime())
+        bids = Bid.objects.filter(task__is_delete=False)
+
+        queries = [
+            ('task origin organization', tasks.filter(origin_organization_id=organization_id),
+             ['task_origin_org_idx']),
+            ('task origin created by', tasks.filter(created_by_id=user_id), ['task_created_by_idx']),
+            ('task worker organization', accepted.filter(worker_organization_id=organization_id),
+             ['task_worker_org_idx']),
+            ('task worker manager', accepted.filter(manager_id=user_id), ['task_manager_idx']),
+            ('task worker assignee', accepted.filter(assignee_id=user_id), ['task_assignee_idx']),
+            ('task open feed organization', open_tasks.visible_to_organization(organization_id).exclude(
+                origin_organization_id=organization_id), ['task_open_feed_idx']),
+            ('task open feed user', open_tasks.exclude(created_by_id=user_id).visible_to_user(user_id),
+             ['task_open_feed_idx']),
+            ('task open feed bid range', open_tasks.filter(bid_count__gte=0, bid_count__lte=5),
+             ['task_bid_count_idx', 'task_open_feed_idx']),
+            ('bid by task', bids.filter(task_id=Task.objects.values_list('id', flat=True).first() or 0),
+             ['bid_task_idx']),
+            ('bid by worker organization', bids.filter(created_by__organization_id=organization_id),
+             ['bid_created_by_state_idx']),
+            ('bid by bidder', bids.filter(created_by_id=user_id), ['bid_created_by_state_idx']),
+            ('bid by bidder pending', bids.filter(created_by_id=user_id, is_accepted=False, is_rejected=False),
+             ['bid_created_by_state_idx']),
+        ]
+        return [(name, queryset.order_by('-id'), indexes) for name, queryset, indexes in queries]
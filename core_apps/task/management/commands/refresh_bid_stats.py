@@ -0,0 +1,19 @@
+from django.core.management.base import BaseCommand
+
+from core_apps.task.models import Task
+
+
+class Command(BaseCommand):
+    help = 'Recomputes the denormalized bid_count and min/max_bid_amount columns of every task from the bids'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        task_ids = list(Task.all_objects.order_by('id').values_list('id', flat=True))
+        batch_size = options['batch_size']
+        updated = 0
+        for start in range(0, len(task_ids), batch_size):
+            updated += Task.all_objects.filter(id__in=task_ids[start:start + batch_size]).refresh_bid_stats()
+
+        self.stdout.write(self.style.SUCCESS(f'Refreshed bid stats of {updated} tasks'))
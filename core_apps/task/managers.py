@@ -0,0 +1,68 @@
+from django.apps import apps
+from django.db import models, transaction
+from django.db.models import Count, Exists, Max, Min, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce
+
+from common.base_manager import AliveManager
+
+
+class TaskQuerySet(models.QuerySet):
+    def refresh_bid_stats(self):
+        """
+        Recomputes bid_count and min/max_bid_amount from the non-deleted bids of each task in the queryset.
+        The task rows are locked first, so concurrent bid writes on one task are applied in turn and none is lost.
+        """
+        bid_model = apps.get_model('bid', 'Bid')
+        bids = bid_model.objects.filter(task_id=OuterRef('pk')).order_by().values('task_id')
+
+        with transaction.atomic():
+            task_ids = list(self.select_for_update().values_list('id', flat=True))
+            return self.model.all_objects.filter(id__in=task_ids).update(
+                bid_count=Coalesce(Subquery(bids.annotate(total=Count('id')).values('total')), 0),
+                min_bid_amount=Subquery(bids.annotate(lowest=Min('amount')).values('lowest')),
+                max_bid_amount=Subquery(bids.annotate(highest=Max('amount')).values('highest')),
+            )
+
+    def visible_to_organization(self, organization_id):
+        """
+        Tasks open to everyone, or restricted to sub contractors with the organization on the list. The list is
+        checked with EXISTS, so no join multiplies the rows and the feed needs no DISTINCT.
+        """
+        listed = self.model.sub_organizations.through.objects.filter(
+            task_id=OuterRef('pk'), organization_id=organization_id
+        )
+        return self.filter(Q(is_sub_contractors_only=False) | Q(Exists(listed), is_sub_contractors_only=True))
+
+    def visible_to_user(self, user_id):
+        """
+        Same as visible_to_organization for a sub contractor list of users.
+        """
+        listed = self.model.sub_contractors.through.objects.filter(task_id=OuterRef('pk'), user_id=user_id)
+        return self.filter(Q(is_sub_contractors_only=False) | Q(Exists(listed), is_sub_contractors_only=True))
+
+    def involving(self, user):
+        """
+        Tasks the user takes part in: created, owned, managed or assigned, or belonging to the user's organization
+        on either side.
+        """
+        parties = Q(created_by_id=user.id) | Q(task_owner_id=user.id) | Q(manager_id=user.id) | Q(assignee_id=user.id)
+        if user.has_organization and user.organization_id:
+            parties |= Q(origin_organization_id=user.organization_id) | Q(worker_organization_id=user.organization_id)
+        return self.filter(parties)
+
+    def readable_by(self, user):
+        """
+        Tasks whose details the user may see: the ones involving the user, the approved open tasks visible to the
+        user (or the user's organization) in the feed, and the ones the user has bid on.
+        """
+        open_tasks = self.filter(is_accepted=False, is_post_approved=True)
+        if user.has_organization and user.organization_id:
+            open_tasks = open_tasks.visible_to_organization(user.organization_id)
+        else:
+            open_tasks = open_tasks.visible_to_user(user.id)
+        bids = apps.get_model('bid', 'Bid').objects.filter(task_id=OuterRef('pk'), created_by_id=user.id)
+        return self.involving(user) | open_tasks | self.filter(Exists(bids))
+
+
+class TaskManager(AliveManager.from_queryset(TaskQuerySet)):
+    pass
@@ -0,0 +1,412 @@
+import datetime
+
+from django.db import migrations, models
+
+from utils.custom_datetime import naive_datetime
+
+# Timestamp columns moved from CharField to DateTimeField, existing strings are parsed into a new column
+FIELDS = {
+    'task': ['created_on', 'updated_on', 'deleted_on', 'bid_deadline', 'task_deadline', 'communication_deadline'],
+    'subtask': ['created_on', 'updated_on', 'deleted_on', 'from_date', 'to_date'],
+    'subtaskfile': ['created_on', 'updated_on', 'deleted_on'],
+    'invoice': ['created_on', 'updated_on', 'deleted_on', 'date_paid'],
+    'attachment': ['created_on', 'updated_on', 'deleted_on'],
+    'skill': ['created_on', 'updated_on', 'deleted_on'],
+}
+
+BATCH_SIZE = 1000
+
+
+def to_datetime(value):
+    if not value:
+        return None
+    try:
+        return naive_datetime(value).replace(tzinfo=datetime.timezone.utc)
+    except ValueError:
+        return None
+
+
+def to_string(value):
+    return value.strftime("%Y-%m-%d %H:%M:%S") if value else None
+
+
+def convert(apps, source_suffix, target_suffix, converter):
+    for model_name, field_names in FIELDS.items():
+        model = apps.get_model('task', model_name)
+        target_fields = [f"{field_name}{target_suffix}" for field_name in field_names]
+        batch = []
+        for instance in model.objects.order_by('pk').iterator(chunk_size=BATCH_SIZE):
+            for field_name in field_names:
+                value = getattr(instance, f"{field_name}{source_suffix}")
+                setattr(instance, f"{field_name}{target_suffix}", converter(value))
+            batch.append(instance)
+            if len(batch) >= BATCH_SIZE:
+                model.objects.bulk_update(batch, target_fields)
+                batch = []
+        if batch:
+            model.objects.bulk_update(batch, target_fields)
+
+
+def copy_to_datetime(apps, schema_editor):
+    convert(apps, '', '_new', to_datetime)
+
+
+def copy_to_string(apps, schema_editor):
+    convert(apps, '_new', '', to_string)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('task', '0002_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='task',
+            name='created_on_new',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='task',
+            name='updated_on_new',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='task',
+            name='deleted_on_new',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='task',
+            name='bid_deadline_new',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='task',
+            name='task_deadline_new',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='task',
+            name='communication_deadline_new',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='subtask',
+            name='created_on_new',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='subtask',
+            name='updated_on_new',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='subtask',
+            name='deleted_on_new',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='subtask',
+            name='from_date_new',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='subtask',
+            name='to_date_new',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='subtaskfile',
+            name='created_on_new',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='subtaskfile',
+            name='updated_on_new',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='subtaskfile',
+            name='deleted_on_new',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='invoice',
+            name='created_on_new',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='invoice',
+            name='updated_on_new',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='invoice',
+            name='deleted_on_new',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='invoice',
+            name='date_paid_new',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='attachment',
+            name='created_on_new',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='attachment',
+            name='updated_on_new',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='attachment',
+            name='deleted_on_new',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='skill',
+            name='created_on_new',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='skill',
+            name='updated_on_new',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='skill',
+            name='deleted_on_new',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.RunPython(copy_to_datetime, copy_to_string),
+        migrations.RemoveField(
+            model_name='task',
+            name='created_on',
+        ),
+        migrations.RenameField(
+            model_name='task',
+            old_name='created_on_new',
+            new_name='created_on',
+        ),
+        migrations.RemoveField(
+            model_name='task',
+            name='updated_on',
+        ),
+        migrations.RenameField(
+            model_name='task',
+            old_name='updated_on_new',
+            new_name='updated_on',
+        ),
+        migrations.RemoveField(
+            model_name='task',
+            name='deleted_on',
+        ),
+        migrations.RenameField(
+            model_name='task',
+            old_name='deleted_on_new',
+            new_name='deleted_on',
+        ),
+        migrations.RemoveField(
+            model_name='task',
+            name='bid_deadline',
+        ),
+        migrations.RenameField(
+            model_name='task',
+            old_name='bid_deadline_new',
+            new_name='bid_deadline',
+        ),
+        migrations.RemoveField(
+            model_name='task',
+            name='task_deadline',
+        ),
+        migrations.RenameField(
+            model_name='task',
+            old_name='task_deadline_new',
+            new_name='task_deadline',
+        ),
+        migrations.RemoveField(
+            model_name='task',
+            name='communication_deadline',
+        ),
+        migrations.RenameField(
+            model_name='task',
+            old_name='communication_deadline_new',
+            new_name='communication_deadline',
+        ),
+        migrations.RemoveField(
+            model_name='subtask',
+            name='created_on',
+        ),
+        migrations.RenameField(
+            model_name='subtask',
+            old_name='created_on_new',
+            new_name='created_on',
+        ),
+        migrations.RemoveField(
+            model_name='subtask',
+            name='updated_on',
+        ),
+        migrations.RenameField(
+            model_name='subtask',
+            old_name='updated_on_new',
+            new_name='updated_on',
+        ),
+        migrations.RemoveField(
+            model_name='subtask',
+            name='deleted_on',
+        ),
+        migrations.RenameField(
+            model_name='subtask',
+            old_name='deleted_on_new',
+            new_name='deleted_on',
+        ),
+        migrations.RemoveField(
+            model_name='subtask',
+            name='from_date',
+        ),
+        migrations.RenameField(
+            model_name='subtask',
+            old_name='from_date_new',
+            new_name='from_date',
+        ),
+        migrations.RemoveField(
+            model_name='subtask',
+            name='to_date',
+        ),
+        migrations.RenameField(
+            model_name='subtask',
+            old_name='to_date_new',
+            new_name='to_date',
+        ),
+        migrations.RemoveField(
+            model_name='subtaskfile',
+            name='created_on',
+        ),
+        migrations.RenameField(
+            model_name='subtaskfile',
+            old_name='created_on_new',
+            new_name='created_on',
+        ),
+        migrations.RemoveField(
+            model_name='subtaskfile',
+            name='updated_on',
+        ),
+        migrations.RenameField(
+            model_name='subtaskfile',
+            old_name='updated_on_new',
+            new_name='updated_on',
+        ),
+        migrations.RemoveField(
+            model_name='subtaskfile',
+            name='deleted_on',
+        ),
+        migrations.RenameField(
+            model_name='subtaskfile',
+            old_name='deleted_on_new',
+            new_name='deleted_on',
+        ),
+        migrations.RemoveField(
+            model_name='invoice',
+            name='created_on',
+        ),
+        migrations.RenameField(
+            model_name='invoice',
+            old_name='created_on_new',
+            new_name='created_on',
+        ),
+        migrations.RemoveField(
+            model_name='invoice',
+            name='updated_on',
+        ),
+        migrations.RenameField(
+            model_name='invoice',
+            old_name='updated_on_new',
+            new_name='updated_on',
+        ),
+        migrations.RemoveField(
+            model_name='invoice',
+            name='deleted_on',
+        ),
+        migrations.RenameField(
+            model_name='invoice',
+            old_name='deleted_on_new',
+            new_name='deleted_on',
+        ),
+        migrations.RemoveField(
+            model_name='invoice',
+            name='date_paid',
+        ),
+        migrations.RenameField(
+            model_name='invoice',
+            old_name='date_paid_new',
+            new_name='date_paid',
+        ),
+        migrations.RemoveField(
+            model_name='attachment',
+            name='created_on',
+        ),
+        migrations.RenameField(
+            model_name='attachment',
+            old_name='created_on_new',
+            new_name='created_on',
+        ),
+        migrations.RemoveField(
+            model_name='attachment',
+            name='updated_on',
+        ),
+        migrations.RenameField(
+            model_name='attachment',
+            old_name='updated_on_new',
+            new_name='updated_on',
+        ),
+        migrations.RemoveField(
+            model_name='attachment',
+            name='deleted_on',
+        ),
+        migrations.RenameField(
+            model_name='attachment',
+            old_name='deleted_on_new',
+            new_name='deleted_on',
+        ),
+        migrations.RemoveField(
+            model_name='skill',
+            name='created_on',
+        ),
+        migrations.RenameField(
+            model_name='skill',
+            old_name='created_on_new',
+            new_name='created_on',
+        ),
+        migrations.RemoveField(
+            model_name='skill',
+            name='updated_on',
+        ),
+        migrations.RenameField(
+            model_name='skill',
+            old_name='updated_on_new',
+            new_name='updated_on',
+        ),
+        migrations.RemoveField(
+            model_name='skill',
+            name='deleted_on',
+        ),
+        migrations.RenameField(
+            model_name='skill',
+            old_name='deleted_on_new',
+            new_name='deleted_on',
+        ),
+        migrations.AlterField(
+            model_name='task',
+            name='bid_deadline',
+            field=models.DateTimeField(blank=True, db_index=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name='task',
+            name='task_deadline',
+            field=models.DateTimeField(blank=True, db_index=True, null=True),
+        ),
+    ]
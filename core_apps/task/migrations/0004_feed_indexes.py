@@ -0,0 +1,37 @@
+# Generated by Django 4.2.11 on 2026-10-18 20:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('task', '0003_datetime_columns'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(condition=models.Q(('is_delete', False)), fields=['origin_organization', '-id'], name='task_origin_org_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(condition=models.Q(('is_delete', False)), fields=['created_by', '-id'], name='task_created_by_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(condition=models.Q(('is_accepted', True), ('is_delete', False)), fields=['worker_organization', '-id'], name='task_worker_org_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(condition=models.Q(('is_accepted', True), ('is_delete', False)), fields=['manager', '-id'], name='task_manager_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(condition=models.Q(('is_accepted', True), ('is_delete', False)), fields=['assignee', '-id'], name='task_assignee_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(condition=models.Q(('is_accepted', False), ('is_delete', False), ('is_post_approved', True)), fields=['-id', 'bid_deadline'], name='task_open_feed_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.11 on 2026-10-18 20:48
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('task', '0004_feed_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='subtask',
+            index=models.Index(condition=models.Q(('is_delete', False)), fields=['task', '-id'], name='subtask_task_idx'),
+        ),
+    ]
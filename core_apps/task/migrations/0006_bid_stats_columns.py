@@ -0,0 +1,47 @@
+# Generated by Django 4.2.11 on 2026-10-18 21:01
+
+from django.db import migrations, models
+from django.db.models import Count, Max, Min, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def fill_bid_stats(apps, schema_editor):
+    Task = apps.get_model('task', 'Task')
+    Bid = apps.get_model('bid', 'Bid')
+    bids = Bid.objects.filter(task_id=OuterRef('pk'), is_delete=False).order_by().values('task_id')
+    Task.objects.update(
+        bid_count=Coalesce(Subquery(bids.annotate(total=Count('id')).values('total')), 0),
+        min_bid_amount=Subquery(bids.annotate(lowest=Min('amount')).values('lowest')),
+        max_bid_amount=Subquery(bids.annotate(highest=Max('amount')).values('highest')),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('task', '0005_alive_indexes'),
+        ('bid', '0005_alive_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='task',
+            name='bid_count',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='task',
+            name='max_bid_amount',
+            field=models.DecimalField(blank=True, decimal_places=2, max_digits=10, null=True),
+        ),
+        migrations.AddField(
+            model_name='task',
+            name='min_bid_amount',
+            field=models.DecimalField(blank=True, decimal_places=2, max_digits=10, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(condition=models.Q(('is_delete', False)), fields=['bid_count'], name='task_bid_count_idx'),
+        ),
+        migrations.RunPython(fill_bid_stats, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 4.2.11 on 2026-10-18 21:21
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('task', '0006_bid_stats_columns'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='attachment',
+            index=models.Index(condition=models.Q(('is_delete', False)), fields=['file'], name='attachment_file_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='invoice',
+            index=models.Index(condition=models.Q(('is_delete', False)), fields=['file'], name='invoice_file_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='subtaskfile',
+            index=models.Index(condition=models.Q(('is_delete', False)), fields=['file'], name='subtaskfile_file_idx'),
+        ),
+    ]
@@ -1,6 +1,8 @@
 from django.db import models
+from django.db.models import Q
 
 from common.base_model import BaseModel
+from core_apps.task.managers import TaskManager, TaskQuerySet
 
 BID_CHOICES = [
     ("open", "Open"),
@@ -25,10 +27,10 @@ class Task(BaseModel):
     remaining_amount = models.DecimalField(max_digits=10, decimal_places=2, null=True, blank=True)
     currency = models.CharField(max_length=100, blank=True)
     bid_type = models.CharField(max_length=100, choices=BID_CHOICES, blank=True)
-    bid_deadline = models.CharField(max_length=100, null=True, blank=True)
+    bid_deadline = models.DateTimeField(null=True, blank=True, db_index=True)
     job_type = models.CharField(max_length=100, blank=True, choices=JOB_CHOICES)
     experience_level = models.CharField(max_length=100, blank=True, choices=EXPERIENCE_LEVEL)
-    task_deadline = models.CharField(max_length=100, null=True, blank=True)
+    task_deadline = models.DateTimeField(null=True, blank=True, db_index=True)
     acceptance_criteria = models.TextField(blank=True)
     skills = models.ManyToManyField("Skill", related_name='tasks', blank=True)
     is_completed = models.BooleanField(default=False)
@@ -44,7 +46,7 @@ class Task(BaseModel):
     task_owner = models.ForeignKey("user.User", related_name="task_owner",
                                    on_delete=models.DO_NOTHING, null=True, blank=True)
     exit_criteria = models.TextField(blank=True)
-    communication_deadline = models.CharField(max_length=100, null=True, blank=True)
+    communication_deadline = models.DateTimeField(null=True, blank=True)
     communication_type = models.CharField(max_length=100, blank=True, choices=COMMUNICATION_TYPE)
     is_origin_organization = models.BooleanField(default=False)  # If the task is created by an organization
     origin_organization = models.ForeignKey("user.Organization", related_name="origin_organization",
@@ -61,13 +63,48 @@ class Task(BaseModel):
                                  blank=True)
     manager = models.ForeignKey("user.User", related_name="task_manager", on_delete=models.DO_NOTHING, null=True,
                                 blank=True)
+    # Denormalized from the non-deleted bids, written only by TaskQuerySet.refresh_bid_stats (see Bid.save)
+    bid_count = models.IntegerField(default=0)
+    min_bid_amount = models.DecimalField(max_digits=10, decimal_places=2, null=True, blank=True)
+    max_bid_amount = models.DecimalField(max_digits=10, decimal_places=2, null=True, blank=True)
+
+    objects = TaskManager()
+    all_objects = models.Manager.from_queryset(TaskQuerySet)()
+
+    BID_STATS_FIELDS = ('bid_count', 'min_bid_amount', 'max_bid_amount')
+
+    class Meta:
+        # One index per TaskGetView access path, each ordered like the feed so a page is read straight off the index
+        indexes = [
+            models.Index(fields=['origin_organization', '-id'], name='task_origin_org_idx',
+                         condition=Q(is_delete=False)),
+            models.Index(fields=['created_by', '-id'], name='task_created_by_idx',
+                         condition=Q(is_delete=False)),
+            models.Index(fields=['worker_organization', '-id'], name='task_worker_org_idx',
+                         condition=Q(is_delete=False, is_accepted=True)),
+            models.Index(fields=['manager', '-id'], name='task_manager_idx',
+                         condition=Q(is_delete=False, is_accepted=True)),
+            models.Index(fields=['assignee', '-id'], name='task_assignee_idx',
+                         condition=Q(is_delete=False, is_accepted=True)),
+            models.Index(fields=['-id', 'bid_deadline'], name='task_open_feed_idx',
+                         condition=Q(is_delete=False, is_accepted=False, is_post_approved=True)),
+            models.Index(fields=['bid_count'], name='task_bid_count_idx', condition=Q(is_delete=False)),
+        ]
+
+    def save(self, *args, **kwargs):
+        # Leaves the bid columns out of updates, so saving a task loaded earlier in the request does not
+        # overwrite stats refreshed by a bid written in the meantime
+        if not self._state.adding and not kwargs.get('update_fields') and not kwargs.get('force_insert'):
+            kwargs['update_fields'] = [field.name for field in self._meta.concrete_fields
+                                       if not field.primary_key and field.name not in self.BID_STATS_FIELDS]
+        super().save(*args, **kwargs)
 
 
 class SubTask(BaseModel):
     task = models.ForeignKey(Task, related_name="sub_tasks", on_delete=models.CASCADE)
     description = models.TextField(null=True, blank=True)
-    from_date = models.CharField(max_length=100, null=True, blank=True)
-    to_date = models.CharField(max_length=100, null=True, blank=True)
+    from_date = models.DateTimeField(null=True, blank=True)
+    to_date = models.DateTimeField(null=True, blank=True)
     time_logged = models.CharField(max_length=100, null=True, blank=True)
     amount = models.DecimalField(max_digits=10, decimal_places=2, null=True, blank=True)
     is_completed = models.BooleanField(default=False)
@@ -76,6 +113,11 @@ class SubTask(BaseModel):
     is_invoiced = models.BooleanField(default=False)
     is_paid = models.BooleanField(default=False)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['task', '-id'], name='subtask_task_idx', condition=Q(is_delete=False)),
+        ]
+
 
 class SubtaskFile(BaseModel):
     subtask = models.ForeignKey(SubTask, related_name="subtask_files", on_delete=models.DO_NOTHING, null=True,
@@ -83,6 +125,12 @@ class SubtaskFile(BaseModel):
     file = models.FileField(upload_to='subtask_files/', null=True, blank=True)
     name = models.TextField(null=True, blank=True)
 
+    class Meta:
+        indexes = [
+            # Protected media downloads look the owning record up by stored file name
+            models.Index(fields=['file'], name='subtaskfile_file_idx', condition=Q(is_delete=False)),
+        ]
+
 
 class Invoice(BaseModel):
     subtask = models.ForeignKey(SubTask, related_name="sub_task_invoice", on_delete=models.CASCADE, null=True,
@@ -96,7 +144,12 @@ class Invoice(BaseModel):
     is_accepted = models.BooleanField(default=False)
     is_rejected = models.BooleanField(default=False)
     is_paid = models.BooleanField(default=False)
-    date_paid = models.CharField(max_length=100, null=True, blank=True)
+    date_paid = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['file'], name='invoice_file_idx', condition=Q(is_delete=False)),
+        ]
 
 
 class Attachment(BaseModel):
@@ -104,6 +157,13 @@ class Attachment(BaseModel):
     file = models.FileField(upload_to='attachments')
     name = models.TextField(null=True, blank=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['file'], name='attachment_file_idx', condition=Q(is_delete=False)),
+        ]
+
 
 class Skill(BaseModel):
+    CATALOGUE_CACHE_KEY = 'skill-catalogue'
+
     skill = models.CharField(max_length=100, blank=True)
@@ -0,0 +1,147 @@
+import bisect
+import re
+import threading
+import time
+import uuid
+
+from rest_framework import serializers
+
+from common.base_cache import task_cache
+from core_apps.task.models import Skill
+
+WORD_SEPARATORS = re.compile(r"[\s\-/_.,()&+]+")
+
+
+class SkillIndex:
+    """
+    Process local typeahead index over the non-deleted skills.
+
+    Results are ranked: names starting with the keyword first, then names with a later word starting with it,
+    then names containing it anywhere, alphabetical within each group. The index is rebuilt lazily when the
+    version stored in the task cache changes, so with a shared cache a skill change in one process is picked up
+    by all of them. A process local cache never sees the other processes' bumps, MAX_AGE bounds how long their
+    changes stay out of the index then.
+    """
+    VERSION_CACHE_KEY = 'skill-index-version'
+    DEFAULT_LIMIT = 50
+    MAX_AGE = 60
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._loaded = False
+        self._version = None
+        self._loaded_at = 0
+        self._skills = []
+        self._names = []
+        self._words = []
+        self._haystack = ""
+        self._starts = []
+        self._ids = frozenset()
+
+    def invalidate(self):
+        task_cache.set(self.VERSION_CACHE_KEY, uuid.uuid4().hex, timeout=None)
+        self._loaded = False
+
+    def search(self, keyword, limit=DEFAULT_LIMIT):
+        self._ensure_loaded()
+        term = keyword.strip().lower()
+        if not term or limit <= 0:
+            return []
+
+        skills, names, words = self._skills, self._names, self._words
+        positions = []
+        seen = set()
+
+        for entries in (names, words):
+            index = bisect.bisect_left(entries, (term,))
+            while index < len(entries) and entries[index][0].startswith(term) and len(positions) < limit:
+                position = entries[index][1]
+                if position not in seen:
+                    seen.add(position)
+                    positions.append(position)
+                index += 1
+
+            if len(positions) >= limit:
+                return [skills[position] for position in positions]
+
+        # One C level find over all names joined by newlines, names are in skill order so matches come out sorted
+        haystack, starts = self._haystack, self._starts
+        offset = haystack.find(term)
+        while offset != -1 and len(positions) < limit:
+            position = bisect.bisect_right(starts, offset) - 1
+            if position not in seen:
+                positions.append(position)
+            next_start = starts[position + 1] if position + 1 < len(starts) else len(haystack)
+            offset = haystack.find(term, next_start)
+
+        return [skills[position] for position in positions]
+
+    def missing(self, skill_ids):
+        """
+        Ids that are not skills. Ids the index does not know are checked against the database before being
+        reported, it may predate a skill made in another process; the index is rebuilt when some exist.
+        """
+        self._ensure_loaded()
+        missing = [skill_id for skill_id in skill_ids if skill_id not in self._ids]
+        if not missing:
+            return missing
+
+        existing = set(Skill.objects.filter(id__in=missing).values_list('id', flat=True))
+        if existing:
+            self._loaded = False
+        return [skill_id for skill_id in missing if skill_id not in existing]
+
+    def _is_current(self, version):
+        return self._loaded and version == self._version and time.monotonic() - self._loaded_at < self.MAX_AGE
+
+    def _ensure_loaded(self):
+        version = task_cache.get(self.VERSION_CACHE_KEY)
+        if self._is_current(version):
+            return
+
+        with self._lock:
+            if self._is_current(version):
+                return
+            self._build()
+            self._version = version
+            self._loaded_at = time.monotonic()
+            self._loaded = True
+
+    def _build(self):
+        rows = sorted(Skill.objects.values_list('id', 'skill'),
+                      key=lambda row: (row[1].lower(), row[0]))
+        skills = [{"id": skill_id, "skill": name} for skill_id, name in rows]
+        names = [(name.lower(), position) for position, (_, name) in enumerate(rows)]
+        words = sorted(
+            (word, position)
+            for position, (_, name) in enumerate(rows)
+            for word in WORD_SEPARATORS.split(name.lower())[1:]
+            if word
+        )
+
+        starts = []
+        offset = 0
+        for name, _ in names:
+            starts.append(offset)
+            offset += len(name) + 1
+
+        self._haystack = "\n".join(name for name, _ in names)
+        self._starts = starts
+        self._skills, self._names, self._words = skills, names, words
+        self._ids = frozenset(skill_id for skill_id, _ in rows)
+
+
+skill_index = SkillIndex()
+
+
+def validate_skill_ids(value):
+    try:
+        skill_ids = [int(skill_id) for skill_id in value]
+    except (TypeError, ValueError):
+        raise serializers.ValidationError("Skill ids must be integers.")
+
+    missing = skill_index.missing(skill_ids)
+    if missing:
+        raise serializers.ValidationError(f"Invalid skill ids: {', '.join(str(skill_id) for skill_id in missing)}")
+
+    return skill_ids
@@ -1,9 +1,7 @@
-from datetime import datetime
-
-from django.conf import settings
 from rest_framework import serializers
 
 from common.base_serializer import CustomBaseSerializer
+from common.base_storage import get_media_url
 from core_apps.task.models import SubTask, SubtaskFile, Task, Invoice
 
 
@@ -16,12 +14,7 @@ class SubmissionFileSerializer(CustomBaseSerializer):
         read_only_fields = ('is_delete',)
 
     def get_file_url(self, obj):
-        request = self.context.get('request')
-        be_url = settings.BACKEND_URL
-        file_url = request.build_absolute_uri(obj.file.url) if request else obj.file.url
-        if be_url:
-            return be_url + file_url
-        return file_url
+        return get_media_url(obj.file, self.context.get('request'))
 
 
 class InvoiceFileSerializer(CustomBaseSerializer):
@@ -113,9 +106,6 @@ class SubTaskSerializer(CustomBaseSerializer):
     @staticmethod
     def get_time_difference(from_date, to_date):
         if from_date and to_date:
-            from_date = datetime.strptime(from_date, "%Y-%m-%d %H:%M:%S")
-            to_date = datetime.strptime(to_date, "%Y-%m-%d %H:%M:%S")
-
             time_difference = to_date - from_date
             total_seconds_difference = time_difference.total_seconds()
             hours_difference = total_seconds_difference / 3600
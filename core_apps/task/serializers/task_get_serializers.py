@@ -1,10 +1,9 @@
 from rest_framework import serializers
 
-from django.conf import settings
 from rest_framework import serializers
 
 from common.base_serializer import CustomBaseSerializer
-from core_apps.bid.models import Bid
+from common.base_storage import get_media_url
 from core_apps.task.models import Task, Attachment, Skill
 from core_apps.user.models import User
 from core_apps.user.serializers.common_serializers import OrganizationIdNameSerializer, UserIdNameSerializer
@@ -24,10 +23,7 @@ class AttachmentSerializer(serializers.ModelSerializer):
         fields = ['id', 'file', 'file_url', 'name']
 
     def get_file_url(self, obj):
-        request = self.context.get('request')
-        be_url = settings.BACKEND_URL
-        file_url = request.build_absolute_uri(obj.file.url) if request else obj.file.url
-        return f"{be_url}{file_url}" if be_url else file_url
+        return get_media_url(obj.file, self.context.get('request'))
 
 
 class TaskRetrieveSerializer(serializers.ModelSerializer):
@@ -123,10 +119,10 @@ class TaskRetrieveSerializer(serializers.ModelSerializer):
                             self.fields.pop(field_name)
 
     def get_min_bid_value(self, obj):
-        return Bid.objects.filter(task=obj).order_by('amount').values_list('amount', flat=True).first() or "0.00"
+        return obj.min_bid_amount or "0.00"
 
     def get_max_bid_value(self, obj):
-        return Bid.objects.filter(task=obj).order_by('-amount').values_list('amount', flat=True).first() or "0.00"
+        return obj.max_bid_amount or "0.00"
 
     def get_post_status(self, obj):
         if obj.is_post_approved:
@@ -147,10 +143,10 @@ class TaskRetrieveSerializer(serializers.ModelSerializer):
             return "Pending"
 
     def get_has_manager(self, obj):
-        return obj.manager is not None
+        return obj.manager_id is not None
 
     def get_has_assignee(self, obj):
-        return obj.assignee is not None
+        return obj.assignee_id is not None
 
 
 class TaskIdNameSerializer(serializers.ModelSerializer):
@@ -1,11 +1,10 @@
-from datetime import datetime
-
 from rest_framework import serializers
 
 from common.base_serializer import CustomBaseSerializer
-from core_apps.task.models import Task, Attachment, Skill
+from core_apps.task.models import Task, Attachment
+from core_apps.task.search import validate_skill_ids
 from core_apps.user.models import User
-from utils.custom_datetime import naive_datetime, get_formatted_current_time
+from utils.custom_datetime import get_current_datetime, get_formatted_current_time
 
 
 class TaskSerializer(CustomBaseSerializer):
@@ -44,6 +43,9 @@ class TaskSerializer(CustomBaseSerializer):
         ]
         read_only_fields = ('is_delete',)
 
+    def validate_required_skills(self, value):
+        return validate_skill_ids(value)
+
     def validate(self, data):
         if self.instance is None:
             required_fields = ['title', 'description', 'budget', 'currency', 'bid_type', 'bid_deadline',
@@ -53,13 +55,13 @@ class TaskSerializer(CustomBaseSerializer):
                 if field not in data or data[field] is [None, ""]:
                     raise serializers.ValidationError({"error": f"{field} is required and cannot be empty."})
 
-            if naive_datetime(data['bid_deadline']) < datetime.now():
+            if data['bid_deadline'] < get_current_datetime():
                 raise serializers.ValidationError({"error": "Bid deadline cannot be in the past."})
 
-            if naive_datetime(data['task_deadline']) < datetime.now():
+            if data['task_deadline'] < get_current_datetime():
                 raise serializers.ValidationError({"error": "Task deadline cannot be in the past."})
 
-            if naive_datetime(data['task_deadline']) < naive_datetime(data['bid_deadline']):
+            if data['task_deadline'] < data['bid_deadline']:
                 raise serializers.ValidationError({"error": "Task deadline cannot be before bid deadline."})
 
             if data['budget'] < 0:
@@ -143,4 +145,4 @@ class TaskSerializer(CustomBaseSerializer):
 
     @staticmethod
     def update_skills(instance, skills):
-        instance.skills.set(Skill.objects.filter(id__in=skills))
+        instance.skills.set(skills)
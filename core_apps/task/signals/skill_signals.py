@@ -0,0 +1,12 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from common.base_cache import task_cache
+from core_apps.task.models import Skill
+from core_apps.task.search import skill_index
+
+
+@receiver([post_save, post_delete], sender=Skill)
+def skill_cache_handler(sender, instance, **kwargs):
+    task_cache.delete(Skill.CATALOGUE_CACHE_KEY)
+    skill_index.invalidate()
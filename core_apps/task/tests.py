@@ -1,3 +1,288 @@
-from django.test import TestCase
+import base64
+import shutil
+import tempfile
+from datetime import timedelta
 
-# Create your tests here.
+from django.core.cache import caches
+from django.core.files.base import ContentFile
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.exceptions import ValidationError
+from rest_framework.test import APIClient
+
+from common.base_serializer import CustomBaseSerializer
+from core_apps.bid.models import Bid
+from core_apps.task.models import Attachment, Invoice, Skill, SubTask, SubtaskFile, Task
+from core_apps.task.search import skill_index, validate_skill_ids
+from core_apps.upload.models import Upload
+from core_apps.user.models import Organization, User
+from utils.custom_datetime import get_current_datetime
+
+
+def base64_file(content, extension='txt'):
+    return f'data:text/{extension};base64,{base64.b64encode(content).decode()}'
+
+
+class UpdateRelatedObjectsTest(TestCase):
+    """
+    Attachments, submission files and invoices, written by CustomBaseSerializer.update_related_objects with
+    base64 files and upload ids.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.media_root = tempfile.mkdtemp()
+        cls.media = override_settings(MEDIA_ROOT=cls.media_root)
+        cls.media.enable()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.media.disable()
+        shutil.rmtree(cls.media_root, ignore_errors=True)
+        super().tearDownClass()
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create(email='owner@example.com')
+        cls.task = Task.objects.create(title='Task', created_by=cls.user)
+        cls.other_task = Task.objects.create(title='Other task', created_by=cls.user)
+        cls.subtask = SubTask.objects.create(task=cls.task)
+        cls.other_subtask = SubTask.objects.create(task=cls.task)
+
+    def upload(self, content, user=None):
+        return Upload.objects.create(file=ContentFile(content, name='upload.txt'), name='upload.txt',
+                                     created_by=user or self.user)
+
+    def test_attachments(self):
+        replaced = Attachment.objects.create(task=self.task, name='Replaced', file=ContentFile(b'old', name='a.txt'))
+        deleted = Attachment.objects.create(task=self.task, name='Deleted', file=ContentFile(b'old', name='b.txt'))
+        upload = self.upload(b'uploaded')
+        data = [
+            {'id': replaced.id, 'file': base64_file(b'replaced')},
+            {'id': str(deleted.id), 'is_delete': True},
+            {'name': 'From base64', 'file': base64_file(b'base64')},
+            {'name': 'From upload', 'upload_id': upload.id},
+        ]
+
+        # The upload claim takes two queries, then one read, one bulk update, one soft delete and one insert
+        with self.assertNumQueries(6):
+            CustomBaseSerializer.update_related_objects(self.task, data, Attachment, 'task', self.user,
+                                                        required_decode=True)
+
+        replaced.refresh_from_db()
+        self.assertEqual(replaced.name, 'Replaced')
+        self.assertTrue(replaced.file.name.startswith('attachments/'))
+        self.assertEqual(replaced.file.read(), b'replaced')
+        self.assertTrue(Attachment.all_objects.get(id=deleted.id).is_delete)
+
+        from_base64 = Attachment.objects.get(name='From base64')
+        self.assertEqual((from_base64.task, from_base64.created_by), (self.task, self.user))
+        self.assertTrue(from_base64.file.name.startswith('attachments/'))
+        self.assertEqual(from_base64.file.read(), b'base64')
+
+        from_upload = Attachment.objects.get(name='From upload')
+        self.assertEqual(from_upload.file.name, upload.file.name)
+        self.assertEqual(from_upload.file.read(), b'uploaded')
+        upload.refresh_from_db()
+        self.assertIsNotNone(upload.attached_on)
+
+    def test_attachment_foreign_key_attname(self):
+        attachment = Attachment.objects.create(task=self.task, file=ContentFile(b'x', name='a.txt'))
+
+        CustomBaseSerializer.update_related_objects(self.task, [{'id': attachment.id, 'task_id': self.other_task.id}],
+                                                    Attachment, 'task', self.user, required_decode=True)
+
+        attachment.refresh_from_db()
+        self.assertEqual(attachment.task_id, self.other_task.id)
+
+    def test_submission_files(self):
+        moved = SubtaskFile.objects.create(subtask=self.subtask, name='Moved', file=ContentFile(b'x', name='s.txt'))
+        upload = self.upload(b'uploaded')
+
+        CustomBaseSerializer.update_related_objects(self.subtask, [
+            {'id': moved.id, 'subtask_id': self.other_subtask.id, 'name': 'Moved file'},
+            {'name': 'New', 'upload_id': upload.id},
+        ], SubtaskFile, 'subtask', self.user, required_decode=True)
+
+        moved.refresh_from_db()
+        self.assertEqual((moved.subtask_id, moved.name), (self.other_subtask.id, 'Moved file'))
+        self.assertEqual(SubtaskFile.objects.get(name='New').file.read(), b'uploaded')
+
+    def test_invoices(self):
+        invoice = Invoice.objects.create(subtask=self.subtask, amount=10, file=ContentFile(b'x', name='i.txt'))
+
+        CustomBaseSerializer.update_related_objects(self.subtask, [
+            {'id': invoice.id, 'amount': 20, 'assignee_id': self.user.id},
+            {'amount': 5, 'file': base64_file(b'invoice', 'pdf')},
+        ], Invoice, 'subtask', self.user, required_decode=True)
+
+        invoice.refresh_from_db()
+        self.assertEqual((invoice.amount, invoice.assignee_id), (20, self.user.id))
+        created = Invoice.objects.get(amount=5)
+        self.assertTrue(created.file.name.startswith('invoice/') and created.file.name.endswith('.pdf'))
+        self.assertEqual(created.file.read(), b'invoice')
+
+    def test_foreign_upload_is_refused(self):
+        upload = self.upload(b'not yours', User.objects.create(email='other@example.com'))
+
+        with self.assertRaises(ValidationError):
+            CustomBaseSerializer.update_related_objects(self.task, [{'upload_id': upload.id}], Attachment, 'task',
+                                                        self.user, required_decode=True)
+        self.assertFalse(Attachment.objects.filter(task=self.task).exists())
+
+
+class TaskFeedQueryCountTest(TestCase):
+    """
+    Pins the queries of a retrieve-task page for each role and feed, and checks they do not grow with the number
+    of tasks (the serializer reads the bid stats columns and prefetched relations, not per-row queries).
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        for cache in caches.all():
+            cache.clear()
+        call_command('role_seed', verbosity=0)
+        cls.organization = Organization.objects.create(name='Origin')
+        cls.worker_organization = Organization.objects.create(name='Worker')
+        cls.admin = cls.create_user('admin@example.com', [User.ADMIN_ROLE, User.CUSTOMER_ROLE], cls.organization)
+        cls.customer = cls.create_user('customer@example.com', [User.CUSTOMER_ROLE])
+        cls.worker_admin = cls.create_user('worker-admin@example.com', [User.ADMIN_ROLE], cls.worker_organization)
+        cls.sales = cls.create_user('sales@example.com', [User.SALES_ROLE, User.CUSTOMER_ROLE],
+                                    cls.worker_organization)
+        cls.manager = cls.create_user('manager@example.com', [User.CONSULTANT_MANAGER_ROLE],
+                                      cls.worker_organization)
+        cls.consultant = cls.create_user('consultant@example.com', [User.CONSULTANT_ROLE], cls.worker_organization)
+        cls.gig = cls.create_user('gig@example.com', [User.GIG_WORKER_ROLE])
+        cls.skill = Skill.objects.create(skill='Python')
+        cls.seed_tasks(3)
+
+    @staticmethod
+    def create_user(email, roles, organization=None):
+        user = User.objects.create(email=email, is_verified=True, organization=organization,
+                                   has_organization=organization is not None)
+        user.set_roles(roles)
+        return user
+
+    @classmethod
+    def seed_tasks(cls, count):
+        deadline = get_current_datetime() + timedelta(days=30)
+        for i in range(count):
+            tasks = [
+                # Open for bids, in the find-task feeds
+                Task.objects.create(title=f'Open {i}', created_by=cls.admin, origin_organization=cls.organization,
+                                    is_post_approved=True, bid_deadline=deadline, post_approved_by=cls.admin),
+                Task.objects.create(title=f'Customer {i}', created_by=cls.customer, is_post_approved=True,
+                                    bid_deadline=deadline),
+                # Accepted by the worker organization, managed and assigned
+                Task.objects.create(title=f'Accepted {i}', created_by=cls.admin, is_accepted=True,
+                                    origin_organization=cls.organization,
+                                    worker_organization=cls.worker_organization, manager=cls.manager,
+                                    assignee=cls.consultant),
+                # Accepted by a gig worker
+                Task.objects.create(title=f'Gig {i}', created_by=cls.customer, is_accepted=True, assignee=cls.gig),
+            ]
+            for task in tasks:
+                task.skills.add(cls.skill)
+                task.sub_contractors.add(cls.gig)
+                Attachment.objects.create(task=task, file=f'attachments/{task.id}.txt')
+                for amount in (10, 20):
+                    Bid.objects.create(task=task, amount=amount + i, bidder=cls.gig, created_by=cls.gig)
+
+    def page_queries(self, user, params):
+        for cache in caches.all():
+            cache.clear()
+        client = APIClient()
+        client.force_authenticate(User.objects.get(id=user.id))
+        with CaptureQueriesContext(connection) as context:
+            response = client.get('/api/v1/retrieve-task/', params)
+        self.assertEqual(response.status_code, 200, response.content)
+        self.assertTrue(response.json()['data'])
+        return len(context.captured_queries)
+
+    def test_feeds(self):
+        # The user's roles, the count, the page, and the prefetches of attachments, skills and sub contractors;
+        # organization admins and sales also read their organization
+        feeds = [
+            ('origin, organization admin', self.admin, {'origin': 1}, 7),
+            ('origin, organization admin, full', self.admin, {'origin': 1, 'summary': 0}, 7),
+            ('origin, customer', self.customer, {'origin': 1}, 6),
+            ('worker, organization admin', self.worker_admin, {'worker': 1}, 7),
+            ('worker, organization admin, full', self.worker_admin, {'worker': 1, 'summary': 0}, 7),
+            ('worker, consultant manager', self.manager, {'worker': 1}, 6),
+            ('worker, consultant', self.consultant, {'worker': 1}, 6),
+            ('worker, gig worker', self.gig, {'worker': 1}, 6),
+            ('find-task, sales', self.sales, {}, 7),
+            ('find-task, gig worker', self.gig, {}, 6),
+            ('find-task, gig worker, bid range', self.gig, {'min_bids': 1, 'max_bids': 5}, 6),
+        ]
+        for name, user, params, expected in feeds:
+            with self.subTest(name):
+                self.assertEqual(self.page_queries(user, params), expected)
+
+        self.seed_tasks(4)
+        for name, user, params, expected in feeds:
+            with self.subTest(f'{name}, more tasks'):
+                self.assertEqual(self.page_queries(user, params), expected)
+
+
+class SkillViewParamsTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create(email='skills@example.com', is_verified=True)
+        for name in ('Python', 'Pandas', 'Go'):
+            Skill.objects.create(skill=name)
+
+    def setUp(self):
+        for cache in caches.all():
+            cache.clear()
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_pages(self):
+        response = self.client.get('/api/v1/skill/', {'limit': 2, 'page': 2})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(([skill['skill'] for skill in response.json()['data']], response.json()['count']),
+                         (['Python'], 3))
+
+        response = self.client.get('/api/v1/skill/', {'keyword': 'p', 'limit': 1})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()['data']), 1)
+
+    def test_invalid_params(self):
+        for params in ({'limit': 'ten'}, {'limit': 0}, {'limit': -1}, {'limit': 2, 'page': 0},
+                       {'limit': 2, 'page': -1}, {'limit': 2, 'page': 'x'}, {'keyword': 'p', 'limit': -5}):
+            with self.subTest(params):
+                response = self.client.get('/api/v1/skill/', params)
+                self.assertEqual(response.status_code, 400)
+                self.assertEqual(response.json()['message'], 'Validation error')
+
+
+class SkillIndexTest(TestCase):
+    """
+    Skills made where the index cannot hear of them (another process with a local cache), stood in for by
+    bulk_create, which sends no signal.
+    """
+
+    def setUp(self):
+        for cache in caches.all():
+            cache.clear()
+        self.python = Skill.objects.create(skill='Python')
+        skill_index.search('p')
+
+    def test_unseen_skill_ids_are_checked_in_the_database(self):
+        unseen, = Skill.objects.bulk_create([Skill(skill='Pandas')])
+
+        self.assertEqual(validate_skill_ids([self.python.id, str(unseen.id)]), [self.python.id, unseen.id])
+        self.assertEqual([skill['skill'] for skill in skill_index.search('pa')], ['Pandas'])
+        with self.assertRaisesMessage(ValidationError, f'Invalid skill ids: {unseen.id + 1}'):
+            validate_skill_ids([unseen.id, unseen.id + 1])
+
+    def test_index_expires(self):
+        Skill.objects.bulk_create([Skill(skill='Pandas')])
+        self.assertEqual(skill_index.search('pa'), [])
+
+        skill_index._loaded_at -= skill_index.MAX_AGE
+        self.assertEqual([skill['skill'] for skill in skill_index.search('pa')], ['Pandas'])
@@ -1,9 +1,14 @@
+import hashlib
+import json
+
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
-from common.base_view import custom_exception_handler
+from common.base_cache import task_cache
+from common.base_view import custom_exception_handler, positive_int
 from common.crud_mixin import CRUDMixin
 from core_apps.task.models import Skill
+from core_apps.task.search import skill_index
 from core_apps.task.serializers.task_get_serializers import SkillSerializer
 
 
@@ -12,16 +17,30 @@ class SkillView(CRUDMixin):
     permission_classes = [IsAuthenticated]
     serializer_class = SkillSerializer
     model = Skill
+    stateless_read = True
 
     @custom_exception_handler
     def get(self, request, ):
-        instances = self.model.objects.filter(is_delete=False).order_by("skill")
-
         keyword = request.query_params.get('keyword')
+        limit = request.query_params.get('limit')
+
+        if limit:
+            limit = positive_int(limit, "limit")
 
         if keyword:
-            instances = instances.filter(skill__icontains=keyword)
+            return Response({"data": skill_index.search(keyword, limit or skill_index.DEFAULT_LIMIT)})
+
+        catalogue = task_cache.get_or_set(self.model.CATALOGUE_CACHE_KEY, self.build_catalogue)
+        if not limit:
+            return self.conditional_response(request, {"data": catalogue["data"]}, catalogue["etag"])
+
+        page = positive_int(request.query_params.get('page', 1), "page")
+        data = catalogue["data"][(page - 1) * limit:page * limit]
+        return self.conditional_response(request, {"data": data, "count": len(catalogue["data"])},
+                                         f"{catalogue['etag']}-{page}-{limit}")
 
-        # page = self.paginate_queryset(instances, request)
-        serializer = self.serializer_class(instances, many=True)
-        return Response({"data": serializer.data})
+    def build_catalogue(self):
+        instances = self.model.objects.order_by("skill")
+        data = list(self.serializer_class(instances, many=True).data)
+        etag = hashlib.sha1(json.dumps(data).encode()).hexdigest()
+        return {"data": data, "etag": etag}
@@ -5,8 +5,6 @@ from common.base_view import custom_exception_handler
 from common.crud_mixin import CRUDMixin
 from core_apps.task.models import SubTask
 
-from rest_framework.response import Response
-
 from core_apps.task.serializers.sub_task_serializer import SubTaskSerializer
 
 
@@ -25,10 +23,8 @@ class SubTaskView(CRUDMixin):
 
     @custom_exception_handler
     def get(self, request, object_id=None):
-        submissions = self.model.objects.filter(is_delete=False, task_id=object_id).order_by(
-            "-id")
+        submissions = self.model.objects.filter(task_id=object_id).order_by("-id")
 
         page = self.paginate_queryset(submissions, request)
         serializer = self.serializer_class(page, many=True)
-        count = submissions.count()
-        return Response({"data": serializer.data, "count": count})
+        return self.paginated_response(page, serializer.data)
@@ -1,9 +1,8 @@
-from datetime import datetime
-
-from django.db.models import Count, Q
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
+from common.base_cache import task_cache
+from common.base_pagination import COUNT_CACHED
 from common.base_permission import IsGigWorker, IsConsultant, IsOverEmployee, IsCustomer
 from common.base_view import custom_exception_handler
 from common.crud_mixin import CRUDMixin
@@ -11,6 +10,7 @@ from core_apps.task.models import Task
 from core_apps.task.serializers.task_get_serializers import TaskRetrieveSerializer
 from core_apps.task.serializers.task_serializers import TaskSerializer
 from core_apps.user.models import User
+from utils.custom_datetime import get_current_datetime
 
 
 class TaskView(CRUDMixin):
@@ -24,6 +24,8 @@ class TaskGetView(CRUDMixin):
     serializer_class = TaskRetrieveSerializer
     model = Task
     http_method_names = ['get']
+    count_strategy = COUNT_CACHED
+    count_cache = task_cache
 
     @custom_exception_handler
     def get(self, request, object_id=None):
@@ -49,35 +51,33 @@ class TaskGetView(CRUDMixin):
             if origin is not None and origin:
                 if request.user.has_organization:
                     if request.user.has_any_role([User.ADMIN_ROLE, User.TASK_MANAGER_ROLE]):
-                        instances = self.model.objects.filter(is_delete=False,
-                                                              origin_organization_id=request.user.organization).order_by(
-                            "-id")
+                        instances = self.model.objects.filter(
+                            origin_organization_id=request.user.organization).order_by("-id")
                     else:
-                        instances = self.model.objects.filter(is_delete=False,
-                                                              created_by_id=request.user.id).order_by(
+                        instances = self.model.objects.filter(created_by_id=request.user.id).order_by(
                             "-id")
                 else:
-                    instances = self.model.objects.filter(is_delete=False, created_by_id=request.user.id).order_by(
+                    instances = self.model.objects.filter(created_by_id=request.user.id).order_by(
                         "-id")
             elif worker is not None and worker:
                 if request.user.has_organization:
                     if request.user.has_any_role(
                             [User.ADMIN_ROLE, User.BILLING_ROLE, User.SALES_ROLE]):
-                        instances = self.model.objects.filter(is_delete=False, is_accepted=True,
+                        instances = self.model.objects.filter(is_accepted=True,
                                                               worker_organization_id=request.user.organization).order_by(
                             "-id")
                     elif request.user.has_any_role([User.CONSULTANT_MANAGER_ROLE]):
-                        instances = self.model.objects.filter(is_delete=False, is_accepted=True,
+                        instances = self.model.objects.filter(is_accepted=True,
                                                               # is_worker_accepted=True,
                                                               manager_id=request.user.id).order_by(
                             "-id")
                     else:
-                        instances = self.model.objects.filter(is_delete=False, is_accepted=True,
+                        instances = self.model.objects.filter(is_accepted=True,
                                                               # is_worker_accepted=True,
                                                               assignee_id=request.user.id).order_by(
                             "-id")
                 else:
-                    instances = self.model.objects.filter(is_delete=False, is_accepted=True,
+                    instances = self.model.objects.filter(is_accepted=True,
                                                           assignee_id=request.user.id).order_by(
                         "-id")
             else:
@@ -85,32 +85,26 @@ class TaskGetView(CRUDMixin):
                 if request.user.has_organization and request.user.has_any_role([User.ADMIN_ROLE, User.SALES_ROLE]):
                     # organization_skills = request.user.organization.skills.all()
                     instances = (self.model.objects.filter(
-                        is_delete=False,
                         is_accepted=False,
                         is_post_approved=True,
-                        bid_deadline__gte=datetime.now()
+                        bid_deadline__gte=get_current_datetime()
                         # ,
                         # skills__in=organization_skills
                     )
-                                 .filter(
-                        Q(is_sub_contractors_only=False) |
-                        Q(is_sub_contractors_only=True, sub_organizations__in=[request.user.organization]))
+                                 .visible_to_organization(request.user.organization_id)
                                  .exclude(
                         origin_organization=request.user.organization
-                    ).distinct().order_by("-id"))
+                    ).order_by("-id"))
                 else:
                     # user_skills = request.user.skills.all()
                     instances = (self.model.objects.filter(
-                        is_delete=False,
                         is_accepted=False,
                         is_post_approved=True,
-                        bid_deadline__gte=datetime.now(),
+                        bid_deadline__gte=get_current_datetime(),
                         # skills__in=user_skills
-                    ).exclude(created_by=request.user
-                              ).filter(
-                        Q(is_sub_contractors_only=False) |
-                        Q(is_sub_contractors_only=True, sub_contractors__in=[request.user]))
-                                 .distinct().order_by("-id"))
+                    ).exclude(created_by=request.user)
+                                 .visible_to_user(request.user.id)
+                                 .order_by("-id"))
 
             if job_type:
                 instances = instances.filter(job_type=job_type)
@@ -121,13 +115,6 @@ class TaskGetView(CRUDMixin):
             if experience:
                 instances = instances.filter(experience_level=experience)
 
-            if max_bids:
-                if not min_bids:
-                    min_bids = 0
-
-                instances = instances.annotate(bid_count=Count('bid')).filter(bid_count__gte=int(min_bids),
-                                                                              bid_count__lte=int(max_bids))
-
             if is_post_approved is not None:
                 instances = instances.filter(is_post_approved=is_post_approved)
 
@@ -140,10 +127,19 @@ class TaskGetView(CRUDMixin):
             if assignee_assigned is not None:
                 instances = instances.filter(assignee__isnull=not bool(int(assignee_assigned)))
 
-            instances = instances.filter(is_delete=False).order_by("-id")
+            instances = instances.order_by("-id")
+
+            if max_bids:
+                if not min_bids:
+                    min_bids = 0
+
+                instances = instances.filter(bid_count__gte=int(min_bids), bid_count__lte=int(max_bids))
+
+            instances = instances.select_related(
+                'origin_organization', 'post_approved_by', 'assignee', 'manager'
+            ).prefetch_related('attachments', 'skills', 'sub_contractors')
             page = self.paginate_queryset(instances, request)
             serializer = TaskRetrieveSerializer(page, many=True,
                                                 context={'request': request, 'summary': summary,
                                                          'is_find_task': is_find_task})
-            count = instances.count()
-            return Response({"data": serializer.data, "count": count})
+            return self.paginated_response(page, serializer.data)
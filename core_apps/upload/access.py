@@ -0,0 +1,62 @@
+from django.db.models import Q
+
+from core_apps.task.models import Attachment, Invoice, SubtaskFile, Task
+from core_apps.upload.models import Upload
+from core_apps.user.models import Organization, User
+from utils.image_variants import source_name
+
+
+def _attachment(user, name):
+    task_ids = Attachment.objects.filter(file=name).values('task_id')
+    return Task.objects.readable_by(user).filter(id__in=task_ids).exists()
+
+
+def _subtask_file(user, name):
+    task_ids = SubtaskFile.objects.filter(file=name).values('subtask__task_id')
+    return Task.objects.involving(user).filter(id__in=task_ids).exists()
+
+
+def _invoice(user, name):
+    invoices = Invoice.objects.filter(file=name)
+    if invoices.filter(Q(assignee_id=user.id) | Q(client_id=user.id)).exists():
+        return True
+    return Task.objects.involving(user).filter(id__in=invoices.values('subtask__task_id')).exists()
+
+
+def _profile_image(user, name):
+    # Profiles are visible to every signed in user
+    return User.objects.filter(profile_image=name, is_delete=False).exists()
+
+
+def _logo(user, name):
+    return Organization.objects.filter(logo=name).exists()
+
+
+def _upload(user, name):
+    return Upload.objects.filter(file=name, created_by_id=user.id).exists()
+
+
+# Records that may point at a stored file, by the upload_to directory it was saved under. Files sent to the
+# upload endpoint keep their uploads/ name once claimed, so any record can own them.
+OWNERS = {
+    'attachments/': (_attachment,),
+    'subtask_files/': (_subtask_file,),
+    'invoice/': (_invoice,),
+    'profile_image/': (_profile_image,),
+    'organization_image/': (_logo,),
+    'uploads/': (_upload, _attachment, _subtask_file, _invoice, _profile_image),
+}
+
+
+def can_read_media(user, name):
+    """
+    Whether the user may download the local file with the given storage name, decided on the record owning it.
+    """
+    if user.is_super_admin:
+        return True
+    # Resized copies of an image are readable with it
+    name = source_name(name)
+    for prefix, checks in OWNERS.items():
+        if name.startswith(prefix):
+            return any(check(user, name) for check in checks)
+    return False
@@ -0,0 +1,34 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+
+from core_apps.upload.models import Upload
+from utils.custom_datetime import get_current_datetime
+
+
+class Command(BaseCommand):
+    help = 'Deletes uploads that no record claimed within the given age, with their stored files'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--hours', type=int, default=24)
+
+    def handle(self, *args, **options):
+        cutoff = get_current_datetime() - timedelta(hours=options['hours'])
+        stale = Upload.all_objects.filter(attached_on__isnull=True, created_on__lt=cutoff)
+
+        deleted = 0
+        batch = []
+        for upload in stale.iterator():
+            upload.file.delete(save=False)
+            batch.append(upload.id)
+            if len(batch) >= 1000:
+                deleted += self.delete_rows(batch)
+                batch = []
+        deleted += self.delete_rows(batch)
+
+        self.stdout.write(self.style.SUCCESS(f'Deleted {deleted} stale uploads'))
+
+    @staticmethod
+    def delete_rows(ids):
+        # Queryset delete removes the rows, Upload.delete() would only soft delete them
+        return Upload.all_objects.filter(id__in=ids).delete()[0] if ids else 0
@@ -0,0 +1,39 @@
+# Generated by Django 4.2.11 on 2026-10-18 21:14
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Upload',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('is_active', models.BooleanField(default=True)),
+                ('is_delete', models.BooleanField(default=False)),
+                ('created_on', models.DateTimeField(blank=True, null=True)),
+                ('updated_on', models.DateTimeField(blank=True, null=True)),
+                ('deleted_on', models.DateTimeField(blank=True, null=True)),
+                ('file', models.FileField(upload_to='uploads/%Y/%m/%d/')),
+                ('name', models.TextField(blank=True, null=True)),
+                ('content_type', models.CharField(blank=True, max_length=255, null=True)),
+                ('size', models.BigIntegerField(default=0)),
+                ('attached_on', models.DateTimeField(blank=True, null=True)),
+                ('created_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='created_%(class)s_set', to=settings.AUTH_USER_MODEL)),
+                ('deleted_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='deleted_%(class)s_set', to=settings.AUTH_USER_MODEL)),
+                ('updated_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='updated_%(class)s_set', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'indexes': [models.Index(condition=models.Q(('attached_on__isnull', True)), fields=['created_on'], name='upload_pending_idx')],
+            },
+        ),
+    ]
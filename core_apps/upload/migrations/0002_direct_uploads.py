@@ -0,0 +1,18 @@
+# Generated by Django 4.2.11 on 2026-10-18 21:17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('upload', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='upload',
+            name='is_uploaded',
+            field=models.BooleanField(default=True),
+        ),
+    ]
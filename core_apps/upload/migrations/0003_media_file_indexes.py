@@ -0,0 +1,17 @@
+# Generated by Django 4.2.11 on 2026-10-18 21:21
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('upload', '0002_direct_uploads'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='upload',
+            index=models.Index(fields=['file'], name='upload_file_idx'),
+        ),
+    ]
@@ -0,0 +1,50 @@
+import os
+import secrets
+
+from django.db import models
+from django.db.models import Q
+from rest_framework.exceptions import ValidationError
+
+from common.base_model import BaseModel
+from utils.custom_datetime import get_current_datetime
+
+
+class Upload(BaseModel):
+    """
+    A file put in storage by the upload endpoint (or by the client with a presigned form), before any record points
+    at it. Serializers take its id in place of a base64 payload and claim it, the record then refers to the same
+    stored file.
+    """
+    file = models.FileField(upload_to='uploads/%Y/%m/%d/')
+    name = models.TextField(null=True, blank=True)
+    content_type = models.CharField(max_length=255, null=True, blank=True)
+    size = models.BigIntegerField(default=0)
+    attached_on = models.DateTimeField(null=True, blank=True)
+    # False between handing out a presigned upload form and the client confirming the file reached the bucket
+    is_uploaded = models.BooleanField(default=True)
+
+    class Meta:
+        indexes = [
+            # Pending uploads by age, for clear_stale_uploads
+            models.Index(fields=['created_on'], name='upload_pending_idx', condition=Q(attached_on__isnull=True)),
+            models.Index(fields=['file'], name='upload_file_idx'),
+        ]
+
+    @staticmethod
+    def random_name(client_name):
+        # Files are stored under random names like on the base64 path, the client's name is kept on the row
+        return f'{secrets.token_hex(8)}{os.path.splitext(client_name)[1].lower()}'
+
+    @classmethod
+    def claim(cls, upload_id, user):
+        """
+        Marks a pending upload of the user as attached and returns its stored file name. The conditional UPDATE
+        lets only one record claim an upload, it is released again if the request's transaction rolls back.
+        """
+        claimed = user is not None and cls.objects.filter(
+            id=upload_id, created_by_id=user.id, is_uploaded=True, attached_on__isnull=True
+        ).update(attached_on=get_current_datetime())
+        if not claimed:
+            raise ValidationError("Upload not found")
+
+        return cls.objects.values_list('file', flat=True).get(id=upload_id)
@@ -0,0 +1,8 @@
+from common.base_serializer import CustomBaseSerializer
+from core_apps.upload.models import Upload
+
+
+class UploadSerializer(CustomBaseSerializer):
+    class Meta:
+        model = Upload
+        fields = ['id', 'name', 'content_type', 'size']
@@ -0,0 +1,32 @@
+from django.test import RequestFactory, SimpleTestCase
+
+from core_apps.upload.views.views import RANGE_NOT_SATISFIABLE, requested_range
+
+
+class RequestedRangeTest(SimpleTestCase):
+    def requested_range(self, header, size=10, **extra):
+        request = RequestFactory().get('/media/file.txt', HTTP_RANGE=header, **extra)
+        return requested_range(request, size, 'Mon, 01 Jan 2024 00:00:00 GMT')
+
+    def test_ranges(self):
+        self.assertEqual(self.requested_range('bytes=2-5'), (2, 5))
+        self.assertEqual(self.requested_range('bytes=2-'), (2, 9))
+        self.assertEqual(self.requested_range('bytes=2-100'), (2, 9))
+        self.assertEqual(self.requested_range('bytes=-3'), (7, 9))
+        self.assertEqual(self.requested_range('bytes=-100'), (0, 9))
+
+    def test_invalid_ranges_serve_the_whole_file(self):
+        # The last byte before the first makes the range-spec invalid, even when both are past the end
+        for header in ('bytes=5-3', 'bytes=20-15', 'bytes=a-3', 'bytes=-', 'bytes=1-2,4-5', 'items=1-2', ''):
+            with self.subTest(header):
+                self.assertIsNone(self.requested_range(header))
+
+    def test_stale_if_range_serves_the_whole_file(self):
+        self.assertIsNone(self.requested_range('bytes=2-5', HTTP_IF_RANGE='Tue, 02 Jan 2024 00:00:00 GMT'))
+        self.assertEqual(self.requested_range('bytes=2-5', HTTP_IF_RANGE='Mon, 01 Jan 2024 00:00:00 GMT'), (2, 5))
+
+    def test_not_satisfiable(self):
+        self.assertEqual(self.requested_range('bytes=10-'), RANGE_NOT_SATISFIABLE)
+        self.assertEqual(self.requested_range('bytes=10-20'), RANGE_NOT_SATISFIABLE)
+        self.assertEqual(self.requested_range('bytes=-0'), RANGE_NOT_SATISFIABLE)
+        self.assertEqual(self.requested_range('bytes=0-', size=0), RANGE_NOT_SATISFIABLE)
@@ -0,0 +1,8 @@
+from django.urls import re_path
+
+from core_apps.upload.views.views import UploadUrlView, UploadView
+
+urlpatterns = [
+    re_path(r'^upload/?(?P<object_id>[\d]+)?/$', UploadView.as_view(), name='upload'),
+    re_path(r'^upload-url/$', UploadUrlView.as_view(), name='upload_url'),
+]
@@ -0,0 +1,204 @@
+import mimetypes
+import os
+from urllib.parse import quote
+
+from django.conf import settings
+from django.core.exceptions import SuspiciousFileOperation
+from django.core.files.storage import default_storage
+from django.http import FileResponse, HttpResponse, StreamingHttpResponse
+from django.utils.http import http_date
+from rest_framework import status
+from rest_framework.exceptions import NotAuthenticated, NotFound, ValidationError
+from rest_framework.parsers import MultiPartParser
+from rest_framework.permissions import AllowAny, IsAuthenticated
+from rest_framework.response import Response
+
+from common.base_storage import is_object_storage, presigned_upload, unsign_media_name
+from common.base_view import BaseView, custom_exception_handler
+from core_apps.upload.access import can_read_media
+from core_apps.upload.models import Upload
+from core_apps.upload.serializers.upload_serializers import UploadSerializer
+from core_apps.user.models import User
+
+RANGE_NOT_SATISFIABLE = 'not-satisfiable'
+
+
+class UploadView(BaseView):
+    """
+    Multipart upload of one or more `file` parts. Django's upload handlers spool each part to a temporary file in
+    64 KiB chunks and the storage copies it the same way, so no file is held in memory whole. Returns the upload
+    ids to send in place of base64 file contents.
+    """
+    permission_classes = [IsAuthenticated]
+    parser_classes = [MultiPartParser]
+
+    @custom_exception_handler
+    def post(self, request):
+        # Checked before the body is parsed, so an oversized request is not spooled to disk first
+        if int(request.META.get('CONTENT_LENGTH') or 0) > settings.UPLOAD_MAX_SIZE:
+            raise ValidationError(f"Upload larger than {settings.UPLOAD_MAX_SIZE} bytes")
+
+        files = request.FILES.getlist('file')
+        if not files:
+            raise ValidationError("file is required")
+
+        uploads = []
+        for file in files:
+            name = file.name
+            file.name = Upload.random_name(name)
+            uploads.append(Upload.objects.create(file=file, name=name, content_type=file.content_type,
+                                                 size=file.size, created_by=request.user))
+        return Response({"message": "Successfully uploaded", "data": UploadSerializer(uploads, many=True).data},
+                        status=status.HTTP_201_CREATED)
+
+    @custom_exception_handler
+    def put(self, request, object_id=None):
+        """
+        Confirms a direct upload once the client's POST to the bucket succeeded, the upload can then be claimed.
+        """
+        upload = Upload.objects.filter(id=object_id, created_by_id=request.user.id, is_uploaded=False).first()
+        if upload is None:
+            raise ValidationError("Upload not found")
+        if not default_storage.exists(upload.file.name):
+            raise ValidationError("File not received yet")
+
+        upload.size = default_storage.size(upload.file.name)
+        # The form's policy already bounds the size, checked again for servers that do not enforce it
+        if upload.size > settings.UPLOAD_MAX_SIZE:
+            default_storage.delete(upload.file.name)
+            raise ValidationError(f"Upload larger than {settings.UPLOAD_MAX_SIZE} bytes")
+        upload.is_uploaded = True
+        upload.save(update_fields=['size', 'is_uploaded'])
+        return Response({"message": "Successfully updated", "data": UploadSerializer(upload).data})
+
+
+class UploadUrlView(BaseView):
+    """
+    Direct upload with object storage: returns a presigned form the client posts the file to, so its bytes go
+    to the bucket without passing through the app. Confirm it with PUT upload/<id>/ before using the id.
+    """
+    permission_classes = [IsAuthenticated]
+
+    @custom_exception_handler
+    def post(self, request):
+        if not is_object_storage():
+            raise ValidationError("Direct uploads need MEDIA_STORAGE=s3, send the file to upload/ instead")
+
+        name = request.data.get('name')
+        if not name:
+            raise ValidationError("name is required")
+        content_type = request.data.get('content_type') or 'application/octet-stream'
+
+        upload = Upload(name=name, content_type=content_type, is_uploaded=False, created_by=request.user)
+        upload.file.name = upload.file.field.generate_filename(upload, Upload.random_name(name))
+        upload.save()
+        form = presigned_upload(upload.file.name, content_type, settings.UPLOAD_MAX_SIZE)
+        return Response({"message": "Successfully created",
+                         "data": {"id": upload.id, "url": form['url'], "fields": form['fields']}},
+                        status=status.HTTP_201_CREATED)
+
+
+class MediaView(BaseView):
+    """
+    Local media under MEDIA_URL. The caller is authenticated by the Authorization header or by the token of a
+    signed media URL, and must have access to the record owning the file. The bytes are then handed to the
+    front proxy (MEDIA_SENDFILE) or streamed by Django, honouring single Range requests.
+    """
+    permission_classes = [AllowAny]
+
+    def get(self, request, name):
+        user = request.user if request.user.is_authenticated else self.token_user(request, name)
+        if user is None:
+            raise NotAuthenticated()
+        # Files the caller may not read are reported missing, so their names cannot be probed
+        if not can_read_media(user, name):
+            raise NotFound()
+        return media_response(request, name)
+
+    @staticmethod
+    def token_user(request, name):
+        user_id = unsign_media_name(name, request.query_params.get('token', ''))
+        if user_id is None:
+            return None
+        return User.objects.filter(id=user_id, is_active=True, is_delete=False).first()
+
+
+def media_response(request, name):
+    content_type = mimetypes.guess_type(name)[0] or 'application/octet-stream'
+    if settings.MEDIA_SENDFILE == 'nginx':
+        response = HttpResponse(content_type=content_type)
+        response['X-Accel-Redirect'] = settings.MEDIA_ACCEL_PREFIX + quote(name)
+        return response
+
+    try:
+        path = default_storage.path(name)
+        stat = os.stat(path)
+    except (SuspiciousFileOperation, OSError):
+        raise NotFound()
+
+    if settings.MEDIA_SENDFILE == 'apache':
+        response = HttpResponse(content_type=content_type)
+        response['X-Sendfile'] = path
+        return response
+
+    last_modified = http_date(stat.st_mtime)
+    byte_range = requested_range(request, stat.st_size, last_modified)
+    if byte_range == RANGE_NOT_SATISFIABLE:
+        response = HttpResponse(status=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE)
+        response['Content-Range'] = f'bytes */{stat.st_size}'
+        return response
+
+    file = open(path, 'rb')
+    if byte_range is None:
+        response = FileResponse(file, content_type=content_type)
+    else:
+        start, end = byte_range
+        file.seek(start)
+        response = StreamingHttpResponse(read_range(file, end - start + 1), status=status.HTTP_206_PARTIAL_CONTENT,
+                                         content_type=content_type)
+        response['Content-Length'] = end - start + 1
+        response['Content-Range'] = f'bytes {start}-{end}/{stat.st_size}'
+    response['Accept-Ranges'] = 'bytes'
+    response['Last-Modified'] = last_modified
+    return response
+
+
+def requested_range(request, size, last_modified):
+    """
+    (start, end) of a single byte range asked for by the Range header, None to send the whole file. Multiple
+    ranges, malformed or invalid ones (last byte before the first) and an If-Range that no longer matches get the
+    whole file, as RFC 9110 has the header ignored then. Only a range starting past the end is not satisfiable.
+    """
+    header = request.META.get('HTTP_RANGE', '')
+    if_range = request.META.get('HTTP_IF_RANGE')
+    if not header.startswith('bytes=') or ',' in header or (if_range and if_range != last_modified):
+        return None
+
+    start, _, end = header[6:].strip().partition('-')
+    try:
+        if start:
+            start = int(start)
+            end = int(end) if end else None
+            if end is not None and end < start:
+                return None
+            end = size - 1 if end is None else min(end, size - 1)
+        else:
+            # Suffix range, the last n bytes
+            start, end = max(size - int(end), 0), size - 1
+    except ValueError:
+        return None
+    if start > end or start >= size:
+        return RANGE_NOT_SATISFIABLE
+    return start, end
+
+
+def read_range(file, length):
+    try:
+        while length > 0:
+            chunk = file.read(min(FileResponse.block_size, length))
+            if not chunk:
+                break
+            length -= len(chunk)
+            yield chunk
+    finally:
+        file.close()
@@ -7,3 +7,5 @@ class UserConfig(AppConfig):
 
     def ready(self):
         import core_apps.user.signals.user_signals  # Assuming your signals are defined here
+        import core_apps.user.signals.cache_signals
+        import core_apps.user.signals.image_signals
@@ -0,0 +1,135 @@
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.utils.functional import cached_property
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.authentication import JWTAuthentication, JWTStatelessUserAuthentication
+from rest_framework_simplejwt.models import TokenUser
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+from rest_framework_simplejwt.tokens import RefreshToken
+
+ROLES_CLAIM = 'roles'
+
+
+def get_token_for_user(user):
+    """
+    Issues a refresh token for the user. When JWT_ROLE_CLAIMS is enabled the role names, organization id and
+    account flags are embedded as claims, and copied into every access token derived from it.
+
+    Invalidation rule: claims are a snapshot taken at login/refresh. CustomTokenRefreshSerializer re-reads the
+    user on every refresh, so a change of roles, organization or lock/verify state reaches claim based checks
+    within ACCESS_TOKEN_LIFETIME. Changes that must not wait for the next refresh call revoke_token_claims(user),
+    which blacklists the user's outstanding refresh tokens and forces a new login.
+    """
+    refresh = RefreshToken.for_user(user)
+    if settings.JWT_ROLE_CLAIMS:
+        refresh[ROLES_CLAIM] = sorted(user.role_names)
+        refresh['organization_id'] = user.organization_id
+        refresh['has_organization'] = user.has_organization
+        refresh['is_active'] = user.is_active
+        refresh['is_verified'] = user.is_verified
+        refresh['is_locked'] = user.is_locked
+        refresh['is_super_admin'] = user.is_super_admin
+    return refresh
+
+
+def revoke_token_claims(user):
+    if not settings.JWT_ROLE_CLAIMS:
+        return
+
+    for token in OutstandingToken.objects.filter(user_id=user.id, blacklistedtoken__isnull=True):
+        BlacklistedToken.objects.get_or_create(token=token)
+
+
+class ClaimsUser(TokenUser):
+    """
+    Stateless user built from the access token claims, answers the same role and flag checks as User.
+    """
+
+    @cached_property
+    def role_names(self):
+        return frozenset(self.token.get(ROLES_CLAIM, []))
+
+    @cached_property
+    def organization_id(self):
+        return self.token.get('organization_id')
+
+    @cached_property
+    def has_organization(self):
+        return self.token.get('has_organization', False)
+
+    @cached_property
+    def is_active(self):
+        return self.token.get('is_active', False)
+
+    @cached_property
+    def is_verified(self):
+        return self.token.get('is_verified', False)
+
+    @cached_property
+    def is_locked(self):
+        return self.token.get('is_locked', True)
+
+    @cached_property
+    def is_super_admin(self):
+        return self.token.get('is_super_admin', False)
+
+    def has_role(self, role_name):
+        return role_name in self.role_names
+
+    def has_any_role(self, role_names):
+        return not self.role_names.isdisjoint(role_names)
+
+
+def get_claims_user(validated_token):
+    """
+    ClaimsUser of a token carrying role claims. Refuses inactive and locked accounts like JWTAuthentication.get_user
+    does for the user row, going by the flags in the claims.
+    """
+    user = ClaimsUser(validated_token)
+    if not user.is_active:
+        raise AuthenticationFailed("User is inactive", code="user_inactive")
+    if user.is_locked:
+        raise AuthenticationFailed("Account locked.", code="user_locked")
+    return user
+
+
+class ClaimsJWTAuthentication(JWTAuthentication):
+    """
+    Loads the user row as usual, but seeds the role cache from the token claims so role checks issue no query.
+    """
+
+    def get_user(self, validated_token):
+        user = super().get_user(validated_token)
+        if settings.JWT_ROLE_CLAIMS and ROLES_CLAIM in validated_token:
+            user._role_names = frozenset(validated_token[ROLES_CLAIM])
+        return user
+
+
+class ClaimsStatelessAuthentication(JWTStatelessUserAuthentication):
+    """
+    Returns a ClaimsUser without touching the database. Tokens issued without role claims fall back to loading
+    the user row, so enabling the mode does not lock out holders of older tokens.
+    """
+
+    def get_user(self, validated_token):
+        if settings.JWT_ROLE_CLAIMS and ROLES_CLAIM in validated_token:
+            return get_claims_user(validated_token)
+        return ClaimsJWTAuthentication().get_user(validated_token)
+
+
+async def authenticate_async(request):
+    """
+    JWT authentication for async Django views, which DRF authenticators do not run in. Returns the user or None
+    without credentials and raises AuthenticationFailed/InvalidToken like the sync authenticators. The user row is
+    only loaded (in a worker thread) when the token carries no role claims.
+    """
+    authenticator = ClaimsJWTAuthentication()
+    header = authenticator.get_header(request)
+    raw_token = authenticator.get_raw_token(header) if header is not None else None
+    if raw_token is None:
+        return None
+
+    validated_token = authenticator.get_validated_token(raw_token)
+    if settings.JWT_ROLE_CLAIMS and ROLES_CLAIM in validated_token:
+        return get_claims_user(validated_token)
+    return await sync_to_async(authenticator.get_user)(validated_token)
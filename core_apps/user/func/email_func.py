@@ -1,16 +1,35 @@
-from celery import shared_task
-from django.conf import settings
-
-from utils.email_config import send_email
-
-
-@shared_task
-def send_forget_password_email(instance):
-    try:
-        send_email(instance.email, 'Forget Password', {"name": instance.first_name,
-                                                       "link": f"{settings.WEB_URL}/register-confirm/{instance.id}/{instance.reset_token}"},
-                   "change_password.html")
-        return True
-    except Exception as ex:
-        print("Email failed to send " + str(ex))
-        return False
+import logging
+
+from django.db import transaction
+
+from core_apps.user import tasks
+
+logger = logging.getLogger(__name__)
+
+
+def enqueue_after_commit(task, *args):
+    """
+    Queues the task once the current transaction commits, so the worker reads committed rows and a rolled back
+    request sends nothing. Runs immediately outside a transaction. A broker outage is logged, the request that
+    already committed does not fail over an email.
+    """
+
+    def send():
+        try:
+            task.delay(*args)
+        except Exception:
+            logger.exception("Could not queue %s%s", task.name, args)
+
+    transaction.on_commit(send)
+
+
+def send_verification_email(user, language='en'):
+    enqueue_after_commit(tasks.send_verification_email, user.id, language)
+
+
+def send_connection_email(connection, language='en'):
+    enqueue_after_commit(tasks.send_connection_email, connection.id, language)
+
+
+def send_forget_password_email(user):
+    enqueue_after_commit(tasks.send_forget_password_email, user.id)
@@ -0,0 +1,95 @@
+import asyncio
+import statistics
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from pymongo.errors import PyMongoError
+
+from common.base_mongo import AsyncMongoDBClient, MongoDBClient
+from utils.custom_datetime import get_current_datetime
+
+
+class Command(BaseCommand):
+    help = ('Load test of chat history reads against the configured MongoDB: the sync client on a fixed pool of '
+            'worker threads against the async client on one event loop. Seeds a throwaway room and deletes it')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--messages', type=int, default=5000, help='Messages seeded in the benchmark room')
+        parser.add_argument('--requests', type=int, default=2000, help='History fetches per client')
+        parser.add_argument('--concurrency', type=int, default=500, help='Fetches in flight on the event loop')
+        parser.add_argument('--threads', type=int, default=8, help='Worker threads of the sync run')
+        parser.add_argument('--limit', type=int, default=20)
+
+    def handle(self, *args, **options):
+        room_id = f'benchmark-{uuid.uuid4()}'
+        sync_client = MongoDBClient()
+        collection = sync_client.db[sync_client.CHAT_COLLECTION]
+        try:
+            self.seed(collection, room_id, options['messages'])
+            sync_client.ensure_indexes()
+
+            sync_result = self.run_sync(room_id, options)
+            async_result = asyncio.run(self.run_async(room_id, options))
+        except PyMongoError as e:
+            raise CommandError(f"MongoDB error: {e}")
+        finally:
+            collection.delete_many({"room_id": room_id})
+
+        if sync_result[1] != async_result[1]:
+            self.stdout.write(self.style.ERROR('sync and async clients returned different pages'))
+        self.report(f"sync, {options['threads']} threads", sync_result[0], options)
+        self.report(f"async, {options['concurrency']} in flight", async_result[0], options)
+
+    def seed(self, collection, room_id, count):
+        now = get_current_datetime()
+        collection.insert_many([
+            {"room_id": room_id, "sender": "a", "receiver": "b", "message": f"Message {i}",
+             "created_on": now + timedelta(milliseconds=i)}
+            for i in range(count)
+        ])
+        self.stdout.write(f'Seeded {count} messages in {room_id}')
+
+    @staticmethod
+    def run_sync(room_id, options):
+        client = MongoDBClient()
+
+        def fetch(_):
+            start = time.perf_counter()
+            page = client.get_chat_history_page(room_id, options['limit'])
+            return time.perf_counter() - start, page[0]
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=options['threads']) as executor:
+            results = list(executor.map(fetch, range(options['requests'])))
+        return (time.perf_counter() - start, [latency for latency, _ in results]), results[-1][1]
+
+    @staticmethod
+    async def run_async(room_id, options):
+        client = AsyncMongoDBClient()
+        semaphore = asyncio.Semaphore(options['concurrency'])
+
+        async def fetch():
+            async with semaphore:
+                start = time.perf_counter()
+                page = await client.get_chat_history_page(room_id, options['limit'])
+                return time.perf_counter() - start, page[0]
+
+        try:
+            start = time.perf_counter()
+            results = await asyncio.gather(*(fetch() for _ in range(options['requests'])))
+            return (time.perf_counter() - start, [latency for latency, _ in results]), results[-1][1]
+        finally:
+            # The client is bound to this loop, which asyncio.run closes on return
+            await client.client.close()
+
+    def report(self, name, result, options):
+        elapsed, latencies = result
+        latencies = sorted(latency * 1000 for latency in latencies)
+        p95 = latencies[int(len(latencies) * 0.95) - 1] if len(latencies) >= 20 else latencies[-1]
+        self.stdout.write(
+            f'{name}: {options["requests"] / elapsed:.0f} req/s, '
+            f'p50 {statistics.median(latencies):.1f} ms, p95 {p95:.1f} ms, max {latencies[-1]:.1f} ms'
+        )
@@ -0,0 +1,148 @@
+import io
+import os
+import statistics
+import time
+
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.test import RequestFactory
+from PIL import Image
+from rest_framework.renderers import JSONRenderer
+
+from core_apps.user import tasks
+from core_apps.user.models import User
+from core_apps.user.serializers.user_serializers import UserSummarySerializer
+from utils.image_variants import VARIANT_FORMATS, VARIANT_SIZES
+
+
+class Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = ('Bytes a client downloads for one page of the user list (JSON body and avatars) with the original '
+            'profile images against the resized variants. Seeds users with photos, the rows are rolled back and '
+            'the files deleted afterwards')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=25)
+        parser.add_argument('--page-size', type=int, default=25)
+        parser.add_argument('--width', type=int, default=3000, help='Width of the generated photos')
+        parser.add_argument('--height', type=int, default=2000)
+        parser.add_argument('--source', help='Directory of images to use instead of generated photos')
+        parser.add_argument('--size', type=int, default=min(VARIANT_SIZES), help='Variant size shown in the list')
+        parser.add_argument('--format', default='webp', choices=list(VARIANT_FORMATS))
+
+    def handle(self, *args, **options):
+        if options['size'] not in VARIANT_SIZES:
+            raise CommandError(f"--size must be one of {', '.join(map(str, VARIANT_SIZES))}")
+
+        stored = []
+        try:
+            with transaction.atomic():
+                users = self.seed(options, stored)
+                timings = self.make_variants(users, stored)
+                self.compare(users[:options['page_size']], options)
+                self.report_timings(timings)
+                raise Rollback
+        except Rollback:
+            pass
+        finally:
+            for name in stored:
+                default_storage.delete(name)
+
+    def seed(self, options, stored):
+        images = self.source_images(options)
+        users = []
+        for i in range(options['users']):
+            content, extension = images[i % len(images)]
+            user = User.objects.create(email=f'benchmark-image-{i}@example.com', first_name='Benchmark',
+                                       last_name=str(i), profile_image=ContentFile(content, name=f'photo{extension}'))
+            stored.append(user.profile_image.name)
+            users.append(user)
+        self.stdout.write(f'Seeded {len(users)} users with {len(images)} distinct images')
+        return users
+
+    def source_images(self, options):
+        if options['source']:
+            paths = sorted(os.path.join(options['source'], name) for name in os.listdir(options['source']))
+            images = []
+            for path in paths:
+                if os.path.isfile(path):
+                    with open(path, 'rb') as file:
+                        images.append((file.read(), os.path.splitext(path)[1].lower()))
+            if not images:
+                raise CommandError(f"No images in {options['source']}")
+            return images
+        return [(self.photo(options['width'], options['height'], seed), '.jpg') for seed in range(3)]
+
+    @staticmethod
+    def photo(width, height, seed):
+        """
+        Camera-like JPEG: detailed content, noise, and EXIF with an orientation and a device name.
+        """
+        size = (width, height)
+        detail = Image.effect_mandelbrot(size, (-2.0 + seed * 0.1, -1.2, 0.8, 1.2), 100)
+        gradient = Image.linear_gradient('L').resize(size)
+        noise = Image.effect_noise(size, 24 + seed * 8)
+        image = Image.merge('RGB', (detail, gradient, noise))
+
+        exif = Image.Exif()
+        exif[0x0112] = 6  # Orientation: rotated 90 degrees
+        exif[0x010F] = 'Benchmark'  # Make
+        exif[0x0110] = 'Camera'  # Model
+        buffer = io.BytesIO()
+        image.save(buffer, 'JPEG', quality=90, exif=exif)
+        return buffer.getvalue()
+
+    def make_variants(self, users, stored):
+        timings = []
+        for user in users:
+            start = time.perf_counter()
+            tasks.make_image_variants(User._meta.label, user.id)
+            timings.append(time.perf_counter() - start)
+            user.refresh_from_db(fields=['profile_image_variants'])
+            for size, names in user.profile_image_variants.items():
+                if isinstance(names, dict):
+                    stored.extend(names.values())
+        return timings
+
+    def compare(self, page, options):
+        request = RequestFactory().get('/')
+        request.user = page[0]
+        data = UserSummarySerializer(page, many=True, context={'request': request}).data
+        after_json = len(JSONRenderer().render(data))
+        for item in data:
+            item['profile_image_urls']['variants'] = {}
+        before_json = len(JSONRenderer().render(data))
+
+        before_images = sum(default_storage.size(user.profile_image.name) for user in page)
+        size, extension = str(options['size']), options['format']
+        variant_names = [user.profile_image_variants[size][extension] for user in page]
+        after_images = sum(default_storage.size(name) for name in variant_names)
+
+        with default_storage.open(page[0].profile_image.name) as file:
+            original_exif = len(Image.open(file).getexif())
+        with default_storage.open(variant_names[0]) as file:
+            variant = Image.open(file)
+            variant_exif, variant_size = len(variant.getexif()), variant.size
+
+        before, after = before_json + before_images, after_json + after_images
+        self.stdout.write(f'Page of {len(page)} users, showing the {size} px {extension} variant ({variant_size[0]}x'
+                          f'{variant_size[1]}, EXIF tags: original {original_exif}, variant {variant_exif})')
+        self.stdout.write(f'originals: {self.kib(before)} (JSON {self.kib(before_json)}, '
+                          f'images {self.kib(before_images)})')
+        self.stdout.write(f'variants:  {self.kib(after)} (JSON {self.kib(after_json)}, '
+                          f'images {self.kib(after_images)})')
+        self.stdout.write(self.style.SUCCESS(f'{before / max(after, 1):.0f}x fewer bytes per page'))
+
+    def report_timings(self, timings):
+        timings = sorted(timing * 1000 for timing in timings)
+        self.stdout.write(f'variant generation: p50 {statistics.median(timings):.0f} ms, '
+                          f'max {timings[-1]:.0f} ms per image')
+
+    @staticmethod
+    def kib(count):
+        return f'{count / 1024:.1f} KiB'
@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand, CommandError
+from pymongo.errors import PyMongoError
+
+from common.base_mongo import MongoDBClient
+
+
+class Command(BaseCommand):
+    help = 'Creates the chat history index on (room_id, created_on, _id), run on deploy before serving requests'
+
+    def handle(self, *args, **kwargs):
+        try:
+            name = MongoDBClient().ensure_indexes()
+        except PyMongoError as e:
+            raise CommandError(f"Could not create the chat indexes: {e}")
+
+        self.stdout.write(self.style.SUCCESS(f'Index {name} is in place'))
@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand, CommandError
+from pymongo.errors import PyMongoError
+
+from common.base_mongo import ping_mongo
+
+
+class Command(BaseCommand):
+    help = 'Checks that the chat MongoDB server answers a ping, for container health checks'
+
+    def handle(self, *args, **kwargs):
+        try:
+            ping_mongo()
+        except PyMongoError as e:
+            raise CommandError(f"Could not connect to MongoDB: {e}")
+
+        self.stdout.write(self.style.SUCCESS('MongoDB is reachable'))
@@ -1,5 +1,7 @@
 from django.contrib.auth.base_user import BaseUserManager
 
+from common.base_manager import AliveManager
+
 
 class UserManager(BaseUserManager):
     use_in_migrations = True
@@ -27,3 +29,17 @@ class UserManager(BaseUserManager):
             raise ValueError('Superuser must have is_superuser=True.')
 
         return self._create_user(id, password, **extra_fields)
+
+
+class ChatroomManager(AliveManager):
+    def get_or_create_for_users(self, user, other_user, **defaults):
+        """
+        The live room of a pair of users whichever of them started it, created when there is none. The pair is
+        looked up in canonical order on the unique (min_user, max_user) index; when two requests race to create
+        the room, the loser's insert fails on the constraint and get_or_create returns the winner's row.
+        """
+        min_user_id, max_user_id = sorted((user.id, other_user.id))
+        return self.get_or_create(
+            min_user_id=min_user_id, max_user_id=max_user_id,
+            defaults={'init_user': user, 'consumer': other_user, **defaults},
+        )
@@ -0,0 +1,447 @@
+import datetime
+
+from django.db import migrations, models
+
+from utils.custom_datetime import naive_datetime
+
+# Timestamp columns moved from CharField to DateTimeField, existing strings are parsed into a new column
+FIELDS = {
+    'role': ['created_on', 'updated_on', 'deleted_on'],
+    'coworker': ['created_on', 'updated_on', 'deleted_on'],
+    'organization': ['created_on', 'updated_on', 'deleted_on'],
+    'language': ['created_on', 'updated_on', 'deleted_on'],
+    'awards': ['created_on', 'updated_on', 'deleted_on'],
+    'certification': ['created_on', 'updated_on', 'deleted_on'],
+    'locale': ['created_on', 'updated_on', 'deleted_on'],
+    'project': ['created_on', 'updated_on', 'deleted_on'],
+    'chatroom': ['created_on', 'updated_on', 'deleted_on'],
+}
+
+BATCH_SIZE = 1000
+
+
+def to_datetime(value):
+    if not value:
+        return None
+    try:
+        return naive_datetime(value).replace(tzinfo=datetime.timezone.utc)
+    except ValueError:
+        return None
+
+
+def to_string(value):
+    return value.strftime("%Y-%m-%d %H:%M:%S") if value else None
+
+
+def convert(apps, source_suffix, target_suffix, converter):
+    for model_name, field_names in FIELDS.items():
+        model = apps.get_model('user', model_name)
+        target_fields = [f"{field_name}{target_suffix}" for field_name in field_names]
+        batch = []
+        for instance in model.objects.order_by('pk').iterator(chunk_size=BATCH_SIZE):
+            for field_name in field_names:
+                value = getattr(instance, f"{field_name}{source_suffix}")
+                setattr(instance, f"{field_name}{target_suffix}", converter(value))
+            batch.append(instance)
+            if len(batch) >= BATCH_SIZE:
+                model.objects.bulk_update(batch, target_fields)
+                batch = []
+        if batch:
+            model.objects.bulk_update(batch, target_fields)
+
+
+def copy_to_datetime(apps, schema_editor):
+    convert(apps, '', '_new', to_datetime)
+
+
+def copy_to_string(apps, schema_editor):
+    convert(apps, '_new', '', to_string)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('user', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='role',
+            name='created_on_new',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='role',
+            name='updated_on_new',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='role',
+            name='deleted_on_new',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='coworker',
+            name='created_on_new',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='coworker',
+            name='updated_on_new',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='coworker',
+            name='deleted_on_new',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='organization',
+            name='created_on_new',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='organization',
+            name='updated_on_new',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='organization',
+            name='deleted_on_new',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='language',
+            name='created_on_new',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='language',
+            name='updated_on_new',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='language',
+            name='deleted_on_new',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='awards',
+            name='created_on_new',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='awards',
+            name='updated_on_new',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='awards',
+            name='deleted_on_new',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='certification',
+            name='created_on_new',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='certification',
+            name='updated_on_new',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='certification',
+            name='deleted_on_new',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='locale',
+            name='created_on_new',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='locale',
+            name='updated_on_new',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='locale',
+            name='deleted_on_new',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='project',
+            name='created_on_new',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='project',
+            name='updated_on_new',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='project',
+            name='deleted_on_new',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='chatroom',
+            name='created_on_new',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='chatroom',
+            name='updated_on_new',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='chatroom',
+            name='deleted_on_new',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.RunPython(copy_to_datetime, copy_to_string),
+        migrations.RemoveField(
+            model_name='role',
+            name='created_on',
+        ),
+        migrations.RenameField(
+            model_name='role',
+            old_name='created_on_new',
+            new_name='created_on',
+        ),
+        migrations.RemoveField(
+            model_name='role',
+            name='updated_on',
+        ),
+        migrations.RenameField(
+            model_name='role',
+            old_name='updated_on_new',
+            new_name='updated_on',
+        ),
+        migrations.RemoveField(
+            model_name='role',
+            name='deleted_on',
+        ),
+        migrations.RenameField(
+            model_name='role',
+            old_name='deleted_on_new',
+            new_name='deleted_on',
+        ),
+        migrations.RemoveField(
+            model_name='coworker',
+            name='created_on',
+        ),
+        migrations.RenameField(
+            model_name='coworker',
+            old_name='created_on_new',
+            new_name='created_on',
+        ),
+        migrations.RemoveField(
+            model_name='coworker',
+            name='updated_on',
+        ),
+        migrations.RenameField(
+            model_name='coworker',
+            old_name='updated_on_new',
+            new_name='updated_on',
+        ),
+        migrations.RemoveField(
+            model_name='coworker',
+            name='deleted_on',
+        ),
+        migrations.RenameField(
+            model_name='coworker',
+            old_name='deleted_on_new',
+            new_name='deleted_on',
+        ),
+        migrations.RemoveField(
+            model_name='organization',
+            name='created_on',
+        ),
+        migrations.RenameField(
+            model_name='organization',
+            old_name='created_on_new',
+            new_name='created_on',
+        ),
+        migrations.RemoveField(
+            model_name='organization',
+            name='updated_on',
+        ),
+        migrations.RenameField(
+            model_name='organization',
+            old_name='updated_on_new',
+            new_name='updated_on',
+        ),
+        migrations.RemoveField(
+            model_name='organization',
+            name='deleted_on',
+        ),
+        migrations.RenameField(
+            model_name='organization',
+            old_name='deleted_on_new',
+            new_name='deleted_on',
+        ),
+        migrations.RemoveField(
+            model_name='language',
+            name='created_on',
+        ),
+        migrations.RenameField(
+            model_name='language',
+            old_name='created_on_new',
+            new_name='created_on',
+        ),
+        migrations.RemoveField(
+            model_name='language',
+            name='updated_on',
+        ),
+        migrations.RenameField(
+            model_name='language',
+            old_name='updated_on_new',
+            new_name='updated_on',
+        ),
+        migrations.RemoveField(
+            model_name='language',
+            name='deleted_on',
+        ),
+        migrations.RenameField(
+            model_name='language',
+            old_name='deleted_on_new',
+            new_name='deleted_on',
+        ),
+        migrations.RemoveField(
+            model_name='awards',
+            name='created_on',
+        ),
+        migrations.RenameField(
+            model_name='awards',
+            old_name='created_on_new',
+            new_name='created_on',
+        ),
+        migrations.RemoveField(
+            model_name='awards',
+            name='updated_on',
+        ),
+        migrations.RenameField(
+            model_name='awards',
+            old_name='updated_on_new',
+            new_name='updated_on',
+        ),
+        migrations.RemoveField(
+            model_name='awards',
+            name='deleted_on',
+        ),
+        migrations.RenameField(
+            model_name='awards',
+            old_name='deleted_on_new',
+            new_name='deleted_on',
+        ),
+        migrations.RemoveField(
+            model_name='certification',
+            name='created_on',
+        ),
+        migrations.RenameField(
+            model_name='certification',
+            old_name='created_on_new',
+            new_name='created_on',
+        ),
+        migrations.RemoveField(
+            model_name='certification',
+            name='updated_on',
+        ),
+        migrations.RenameField(
+            model_name='certification',
+            old_name='updated_on_new',
+            new_name='updated_on',
+        ),
+        migrations.RemoveField(
+            model_name='certification',
+            name='deleted_on',
+        ),
+        migrations.RenameField(
+            model_name='certification',
+            old_name='deleted_on_new',
+            new_name='deleted_on',
+        ),
+        migrations.RemoveField(
+            model_name='locale',
+            name='created_on',
+        ),
+        migrations.RenameField(
+            model_name='locale',
+            old_name='created_on_new',
+            new_name='created_on',
+        ),
+        migrations.RemoveField(
+            model_name='locale',
+            name='updated_on',
+        ),
+        migrations.RenameField(
+            model_name='locale',
+            old_name='updated_on_new',
+            new_name='updated_on',
+        ),
+        migrations.RemoveField(
+            model_name='locale',
+            name='deleted_on',
+        ),
+        migrations.RenameField(
+            model_name='locale',
+            old_name='deleted_on_new',
+            new_name='deleted_on',
+        ),
+        migrations.RemoveField(
+            model_name='project',
+            name='created_on',
+        ),
+        migrations.RenameField(
+            model_name='project',
+            old_name='created_on_new',
+            new_name='created_on',
+        ),
+        migrations.RemoveField(
+            model_name='project',
+            name='updated_on',
+        ),
+        migrations.RenameField(
+            model_name='project',
+            old_name='updated_on_new',
+            new_name='updated_on',
+        ),
+        migrations.RemoveField(
+            model_name='project',
+            name='deleted_on',
+        ),
+        migrations.RenameField(
+            model_name='project',
+            old_name='deleted_on_new',
+            new_name='deleted_on',
+        ),
+        migrations.RemoveField(
+            model_name='chatroom',
+            name='created_on',
+        ),
+        migrations.RenameField(
+            model_name='chatroom',
+            old_name='created_on_new',
+            new_name='created_on',
+        ),
+        migrations.RemoveField(
+            model_name='chatroom',
+            name='updated_on',
+        ),
+        migrations.RenameField(
+            model_name='chatroom',
+            old_name='updated_on_new',
+            new_name='updated_on',
+        ),
+        migrations.RemoveField(
+            model_name='chatroom',
+            name='deleted_on',
+        ),
+        migrations.RenameField(
+            model_name='chatroom',
+            old_name='deleted_on_new',
+            new_name='deleted_on',
+        ),
+    ]
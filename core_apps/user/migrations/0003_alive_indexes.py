@@ -0,0 +1,21 @@
+# Generated by Django 4.2.11 on 2026-10-18 20:48
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('user', '0002_datetime_columns'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='chatroom',
+            index=models.Index(condition=models.Q(('is_delete', False)), fields=['init_user', '-id'], name='chatroom_init_user_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='chatroom',
+            index=models.Index(condition=models.Q(('is_delete', False)), fields=['consumer', '-id'], name='chatroom_consumer_idx'),
+        ),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 4.2.11 on 2026-10-18 21:10
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Min
+from django.db.models.functions import Greatest, Least
+from django.utils import timezone
+import django.db.models.deletion
+
+
+def fill_user_pairs(apps, schema_editor):
+    Chatroom = apps.get_model('user', 'Chatroom')
+    rooms = Chatroom.objects.filter(init_user__isnull=False, consumer__isnull=False)
+    rooms.update(min_user_id=Least('init_user_id', 'consumer_id'), max_user_id=Greatest('init_user_id', 'consumer_id'))
+
+    # The old lookup returned the lowest id of a pair, so clients already use that room. The other live rooms
+    # of the pair only come from racing creates and are soft deleted to make way for the unique constraint.
+    keep = rooms.filter(is_delete=False).values('min_user_id', 'max_user_id').annotate(keep=Min('id')).values('keep')
+    rooms.filter(is_delete=False).exclude(id__in=keep).update(is_delete=True, deleted_on=timezone.now())
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('user', '0003_alive_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='chatroom',
+            name='max_user',
+            field=models.ForeignKey(blank=True, db_index=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddField(
+            model_name='chatroom',
+            name='min_user',
+            field=models.ForeignKey(blank=True, db_index=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.RunPython(fill_user_pairs, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='chatroom',
+            constraint=models.UniqueConstraint(condition=models.Q(('is_delete', False)), fields=('min_user', 'max_user'), name='chatroom_user_pair_uniq'),
+        ),
+    ]
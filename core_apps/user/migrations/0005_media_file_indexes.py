@@ -0,0 +1,17 @@
+# Generated by Django 4.2.11 on 2026-10-18 21:21
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('user', '0004_chatroom_user_pair'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(condition=models.Q(('profile_image__isnull', False)), fields=['profile_image'], name='user_profile_image_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.11 on 2026-10-18 21:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('user', '0005_media_file_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='organization',
+            index=models.Index(condition=models.Q(('logo__isnull', False)), fields=['logo'], name='organization_logo_idx'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 4.2.11 on 2026-10-18 21:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('user', '0006_organization_logo_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='organization',
+            name='logo_variants',
+            field=models.JSONField(blank=True, default=dict),
+        ),
+        migrations.AddField(
+            model_name='user',
+            name='profile_image_variants',
+            field=models.JSONField(blank=True, default=dict),
+        ),
+    ]
@@ -1,19 +1,20 @@
 from __future__ import unicode_literals
 
-import base64
 import secrets
 import uuid
 from datetime import datetime, timedelta
 
 from django.contrib.auth.base_user import AbstractBaseUser
 from django.contrib.auth.models import PermissionsMixin
-from django.core.files.base import ContentFile
 from django.db import models, transaction
-from django.db import transaction
+from django.db.models import Q
 
+from common.base_cache import user_cache
 from common.base_model import BaseModel
 from core_apps.task.models import Skill
-from core_apps.user.managers import UserManager
+from core_apps.user.authentication import revoke_token_claims
+from core_apps.user.managers import ChatroomManager, UserManager
+from utils.base64_file import decode_base64_file
 from utils.custom_datetime import get_formatted_current_time
 
 
@@ -44,6 +45,8 @@ class User(AbstractBaseUser, PermissionsMixin):
     reset_token = models.CharField(max_length=200, null=True, blank=True)
     res_tok_expire_date = models.CharField(max_length=200, null=True, blank=True)
     profile_image = models.FileField(upload_to='profile_image/', blank=True, null=True)
+    # Resized copies of profile_image, see core_apps.user.tasks.make_image_variants
+    profile_image_variants = models.JSONField(default=dict, blank=True)
     is_face_id_verified = models.BooleanField(default=False)
     is_face_id_proceed = models.BooleanField(default=False)
     is_delete = models.BooleanField(default=False)
@@ -76,6 +79,15 @@ class User(AbstractBaseUser, PermissionsMixin):
     USERNAME_FIELD = 'email'
     REQUIRED_FIELDS = []
 
+    class Meta:
+        indexes = [
+            # Protected media downloads look profile images up by stored file name
+            models.Index(fields=['profile_image'], name='user_profile_image_idx',
+                         condition=Q(profile_image__isnull=False)),
+        ]
+
+    _role_names = None
+
     def __str__(self):
         return str(self.id)
 
@@ -103,12 +115,7 @@ class User(AbstractBaseUser, PermissionsMixin):
         self.save()
 
     def update_profile_image(self, profile_image):
-        file_format, file_str = profile_image.split(';base64,')
-        file_extension = file_format.split('/')[-1]
-
-        file_data = base64.b64decode(file_str)
-
-        self.profile_image = ContentFile(file_data, name=f'{secrets.token_hex(8)}.{file_extension}')
+        self.profile_image = decode_base64_file(profile_image)
         self.save()
 
     def delete(self, **kwargs):
@@ -127,15 +134,36 @@ class User(AbstractBaseUser, PermissionsMixin):
         self._add_roles(role_names)
 
     def _add_roles(self, role_names):
+        role_ids = Role.get_ids_by_name()
         for role_name in role_names:
-            role = Role.objects.get(name=role_name)
-            self.roles.add(role)
+            if role_name not in role_ids:
+                raise Role.DoesNotExist(f"Role {role_name} does not exist")
+        self.roles.add(*[role_ids[role_name] for role_name in role_names])
+        self.clear_role_cache()
+        revoke_token_claims(self)
+
+    @property
+    def role_names(self):
+        """
+        Role names of the user, loaded once per instance and reused by has_role/has_any_role.
+        Uses the prefetched roles when the instance comes from a queryset with prefetch_related('roles').
+        """
+        if self._role_names is None:
+            if 'roles' in getattr(self, '_prefetched_objects_cache', {}):
+                self._role_names = frozenset(role.name for role in self.roles.all())
+            else:
+                self._role_names = frozenset(self.roles.values_list('name', flat=True))
+        return self._role_names
+
+    def clear_role_cache(self):
+        self._role_names = None
+        getattr(self, '_prefetched_objects_cache', {}).pop('roles', None)
 
     def has_role(self, role_name):
-        return self.roles.filter(name=role_name).exists()
+        return role_name in self.role_names
 
     def has_any_role(self, role_names):
-        return self.roles.filter(name__in=role_names).exists()
+        return not self.role_names.isdisjoint(role_names)
 
     def create_coworker(self):
         CoWorker.objects.create(
@@ -147,9 +175,15 @@ class User(AbstractBaseUser, PermissionsMixin):
 
 
 class Role(BaseModel):
+    IDS_CACHE_KEY = 'role-ids'
+
     name = models.CharField(max_length=50, unique=True)
     description = models.TextField(blank=True, null=True)
 
+    @classmethod
+    def get_ids_by_name(cls):
+        return user_cache.get_or_set(cls.IDS_CACHE_KEY, lambda: dict(cls.objects.values_list('name', 'id')))
+
 
 class CoWorker(BaseModel):
     user = models.ForeignKey("user.User", related_name="user_co_worker", on_delete=models.DO_NOTHING,
@@ -180,8 +214,14 @@ class Organization(BaseModel):
     country = models.CharField(max_length=200, blank=True, null=True)
     description = models.CharField(max_length=199, blank=True, null=True)
     logo = models.FileField(upload_to='organization_image/', blank=True, null=True)
+    logo_variants = models.JSONField(default=dict, blank=True)
     skills = models.ManyToManyField(Skill, related_name='organization_skill', blank=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['logo'], name='organization_logo_idx', condition=Q(logo__isnull=False)),
+        ]
+
 
 class Language(BaseModel):
     user = models.ForeignKey("user.User", related_name="user_languages", on_delete=models.DO_NOTHING,
@@ -211,6 +251,8 @@ class Certification(BaseModel):
 
 
 class Locale(BaseModel):
+    CATALOGUE_CACHE_KEY = 'locale-catalogue'
+
     language = models.CharField(max_length=199, blank=True, null=True)
     symbol = models.CharField(max_length=199, blank=True, null=True)
 
@@ -230,3 +272,25 @@ class Chatroom(BaseModel):
     consumer = models.ForeignKey(User, related_name="chat_room_consumer", on_delete=models.DO_NOTHING,
                                  null=True, blank=True)
     chat_room_id = models.TextField(blank=True, null=True)
+    # The two users in id order, so a pair has one key whoever started the room
+    min_user = models.ForeignKey(User, related_name="+", on_delete=models.DO_NOTHING, null=True, blank=True,
+                                 db_index=False)
+    max_user = models.ForeignKey(User, related_name="+", on_delete=models.DO_NOTHING, null=True, blank=True,
+                                 db_index=False)
+
+    objects = ChatroomManager()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['init_user', '-id'], name='chatroom_init_user_idx', condition=Q(is_delete=False)),
+            models.Index(fields=['consumer', '-id'], name='chatroom_consumer_idx', condition=Q(is_delete=False)),
+        ]
+        constraints = [
+            models.UniqueConstraint(fields=['min_user', 'max_user'], name='chatroom_user_pair_uniq',
+                                    condition=Q(is_delete=False)),
+        ]
+
+    def save(self, *args, **kwargs):
+        if self.init_user_id is not None and self.consumer_id is not None:
+            self.min_user_id, self.max_user_id = sorted((self.init_user_id, self.consumer_id))
+        super().save(*args, **kwargs)
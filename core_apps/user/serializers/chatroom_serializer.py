@@ -1,6 +1,5 @@
 import uuid
 
-from django.db.models import Q
 from rest_framework import serializers
 
 from common.base_serializer import CustomBaseSerializer
@@ -10,10 +9,11 @@ from core_apps.user.models import User, Chatroom
 class ChatRoomSerializer(CustomBaseSerializer):
     consumer_id = serializers.IntegerField(required=False, write_only=True)
     consumer_data = serializers.SerializerMethodField()
+    last_message = serializers.SerializerMethodField()
 
     class Meta:
         model = Chatroom
-        fields = ['id', 'init_user', 'consumer', 'chat_room_id', 'consumer_id', 'consumer_data']
+        fields = ['id', 'init_user', 'consumer', 'chat_room_id', 'consumer_id', 'consumer_data', 'last_message']
         read_only_fields = ('is_delete',)
 
     def validate(self, data):
@@ -28,7 +28,7 @@ class ChatRoomSerializer(CustomBaseSerializer):
 
     def get_consumer_data(self, obj):
         request_user = self.context['request'].user
-        other_user = obj.consumer if obj.init_user == request_user else obj.init_user
+        other_user = obj.consumer if obj.init_user_id == request_user.id else obj.init_user
         return {
             "id": other_user.id,
             "first_name": other_user.first_name,
@@ -36,18 +36,12 @@ class ChatRoomSerializer(CustomBaseSerializer):
             "chat_id": other_user.chat_id
         }
 
-    def create(self, validated_data):
-        validated_data["init_user"] = self.context["request"].user
-        validated_data["chat_room_id"] = uuid.uuid4()
+    def get_last_message(self, obj):
+        # Looked up for the whole page by the view, see MongoDBClient.get_last_messages
+        return self.context.get('last_messages', {}).get(obj.chat_room_id)
 
-        query = Chatroom.objects.filter(
-            (Q(init_user=validated_data["init_user"]) & Q(consumer=validated_data["consumer"])) |
-            (Q(consumer=validated_data["init_user"]) & Q(init_user=validated_data["consumer"]))
+    def create(self, validated_data):
+        chatroom, created = Chatroom.objects.get_or_create_for_users(
+            self.context["request"].user, validated_data["consumer"], chat_room_id=uuid.uuid4()
         )
-
-        if query.exists():
-            return query.first()
-        else:
-            chatroom = Chatroom.objects.create(**validated_data)
-
         return chatroom
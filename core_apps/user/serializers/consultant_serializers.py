@@ -1,10 +1,9 @@
-from django.conf import settings
 from rest_framework import serializers
 
 from common.base_serializer import CustomBaseSerializer
 
+from core_apps.user.func.email_func import send_connection_email
 from core_apps.user.models import User, CoWorker
-from utils.email_config import send_email
 
 
 class ConsultantSerializer(CustomBaseSerializer):
@@ -44,32 +43,6 @@ class ConsultantSerializer(CustomBaseSerializer):
             manager=manager
         )
         consultant.set_token()
-        self._send_verification_email(consultant, language=validated_data.get("language", "en"))
+        send_connection_email(consultant, language=validated_data.get("language", "en"))
 
         return consultant
-
-    @staticmethod
-    def _send_verification_email(connection, language):
-        try:
-            if language == "en":
-                send_email(
-                    connection.user.email,
-                    f"Invitation to Connect with {connection.organization.name} ",
-                    {"name": connection.user.first_name,
-                     "link": f"{settings.WEB_URL}/connection-accept/{connection.id}/{connection.token}",
-                     "organization_name": connection.organization.name
-                     },
-                    "connection_accept.html"
-                )
-            elif language == "se":
-                send_email(
-                    connection.user.email,
-                    f"Inbjudan att ansluta till {connection.organization.name} ",
-                    {"name": connection.user.first_name,
-                     "link": f"{settings.WEB_URL}/connection-accept/{connection.id}/{connection.token}",
-                     "organization_name": connection.organization.name
-                     },
-                    "connection_accept_se.html"
-                )
-        except Exception as ex:
-            raise serializers.ValidationError({'email': 'Failed to send email'})
@@ -4,6 +4,8 @@ from rest_framework_simplejwt.tokens import RefreshToken
 from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
 from django.contrib.auth import get_user_model
 
+from core_apps.user.authentication import get_token_for_user
+
 User = get_user_model()
 
 
@@ -22,7 +24,7 @@ class CustomTokenRefreshSerializer(TokenRefreshSerializer):
         except AttributeError:
             pass
 
-        new_refresh = RefreshToken.for_user(user)
+        new_refresh = get_token_for_user(user)
 
         data = {
             'refresh': str(new_refresh),
@@ -1,12 +1,11 @@
 import uuid
 
-from django.conf import settings
 from rest_framework import serializers
 
 from common.base_serializer import CustomBaseSerializer
+from core_apps.user.func.email_func import send_verification_email
 from core_apps.user.models import User, Organization, CoWorker
 from utils.custom_datetime import get_formatted_current_time
-from utils.email_config import send_email
 
 
 class RegisterSerializer(CustomBaseSerializer):
@@ -41,7 +40,7 @@ class RegisterSerializer(CustomBaseSerializer):
 
         if user.has_organization:
             user.create_coworker()
-        self._send_verification_email(user)
+        send_verification_email(user)
 
         return user
 
@@ -63,15 +62,3 @@ class RegisterSerializer(CustomBaseSerializer):
             validated_data["roles"] = [User.CUSTOMER_ROLE]
 
         return validated_data
-
-    @staticmethod
-    def _send_verification_email(user):
-        try:
-            send_email(
-                user.email,
-                'Welcome to our platform',
-                {"name": user.first_name, "link": f"{settings.WEB_URL}/register-confirm/{user.id}/{user.reset_token}"},
-                "user_verification.html"
-            )
-        except Exception as ex:
-            raise serializers.ValidationError({'email': 'Failed to send email'})
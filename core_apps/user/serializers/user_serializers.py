@@ -1,36 +1,45 @@
 import uuid
 
-from django.conf import settings
 from rest_framework import serializers
 from rest_framework.fields import ListField
 
 from common.base_serializer import CustomBaseSerializer
-from core_apps.task.models import Skill
+from common.base_storage import get_image_urls
+from core_apps.task.search import validate_skill_ids
 from core_apps.task.serializers.task_get_serializers import SkillSerializer
+from core_apps.upload.models import Upload
+from core_apps.user.func.email_func import send_verification_email
 from core_apps.user.models import User, Organization, Language, Locale, Project, Certification
 from core_apps.user.serializers.common_serializers import LanguageSerializer, CertificationSerializer, ProjectSerializer
-from utils.custom_datetime import get_formatted_current_time
-from utils.email_config import send_email
+from utils.custom_datetime import get_formatted_current_time, get_current_datetime
 
 
 class OrganizationSerializer(CustomBaseSerializer):
     required_skills = ListField(child=serializers.IntegerField(), write_only=True, required=False)
+    logo_urls = serializers.SerializerMethodField()
 
     class Meta:
         model = Organization
         fields = ['id', 'name', 'url', 'address_line1', 'address_line2', 'city', 'zip_code', 'country', 'description',
-                  'logo', 'required_skills']
+                  'logo', 'logo_urls', 'required_skills']
         read_only_fields = ('is_delete',)
 
+    def validate_required_skills(self, value):
+        return validate_skill_ids(value)
+
+    def get_logo_urls(self, obj):
+        return get_image_urls(obj.logo, obj.logo_variants, self.context.get('request'))
+
     def to_representation(self, instance):
         representation = super().to_representation(instance)
-        representation['skills'] = SkillSerializer(instance.skills.filter(is_delete=False), many=True).data
+        representation['skills'] = SkillSerializer(instance.skills.all(), many=True).data
         return representation
 
 
 class UserSerializer(CustomBaseSerializer):
     # update fields
     profile_pic = serializers.CharField(write_only=True, required=False)
+    profile_upload_id = serializers.IntegerField(write_only=True, required=False)
     organization = OrganizationSerializer(required=False)
     required_skills = ListField(child=serializers.IntegerField(), write_only=True, required=False)
     languages = LanguageSerializer(many=True, required=False)
@@ -44,18 +53,22 @@ class UserSerializer(CustomBaseSerializer):
     has_skills = serializers.SerializerMethodField()
     has_languages = serializers.SerializerMethodField()
     available_roles = serializers.SerializerMethodField()
+    profile_image_urls = serializers.SerializerMethodField()
 
     class Meta:
         model = User
         fields = ['id', 'first_name', 'last_name', 'user_name', 'chat_id', 'email', 'country', 'phone_no',
                   'description',
                   'is_active', 'is_locked', 'is_face_id_verified', 'is_face_id_proceed', 'is_verified',
-                  'is_super_admin', 'country', 'profile_pic',
+                  'is_super_admin', 'country', 'profile_pic', 'profile_upload_id', 'profile_image_urls',
                   'has_organization', 'organization', 'has_completed_basic_details',
                   'has_associated_organization_details', 'has_skills', 'has_languages', 'required_skills', 'languages',
                   'certifications', 'projects', 'available_roles', 'roles']
         read_only_fields = ('is_delete',)
 
+    def validate_required_skills(self, value):
+        return validate_skill_ids(value)
+
     def validate(self, data):
         if self.instance is None:
             required_fields = ['first_name', 'last_name', 'email', 'roles']
@@ -106,7 +119,7 @@ class UserSerializer(CustomBaseSerializer):
         user.set_roles(roles)
         user.save()
 
-        self._send_verification_email(user, language=validated_data.get('language', 'en'))
+        send_verification_email(user, language=validated_data.get('language', 'en'))
 
         return user
 
@@ -127,8 +140,7 @@ class UserSerializer(CustomBaseSerializer):
 
                     if "required_skills" in organization_data:
                         org_skills = organization_data.pop('required_skills', None)
-                        skills = Skill.objects.filter(id__in=org_skills)
-                        organization_instance.skills.set(skills)
+                        organization_instance.skills.set(org_skills)
 
                     organization_instance.update(organization_data)
                 else:
@@ -139,6 +151,9 @@ class UserSerializer(CustomBaseSerializer):
             instance.update_profile_image(validated_data['profile_pic'])
             validated_data.pop('profile_pic', None)
 
+        if 'profile_upload_id' in validated_data:
+            instance.profile_image = Upload.claim(validated_data.pop('profile_upload_id'), validated_data["updated_by"])
+
         languages_data = validated_data.pop('locales', [])
         if languages_data:
             self.update_related_objects(instance, languages_data, Language, 'user',
@@ -146,8 +161,7 @@ class UserSerializer(CustomBaseSerializer):
 
         skills_data = validated_data.pop('required_skills', [])
         if skills_data:
-            skills = Skill.objects.filter(id__in=skills_data)
-            instance.skills.set(skills)
+            instance.skills.set(skills_data)
 
         certifications_data = validated_data.pop('certifications', [])
         if certifications_data:
@@ -163,28 +177,6 @@ class UserSerializer(CustomBaseSerializer):
 
         return instance
 
-    @staticmethod
-    def _send_verification_email(user, language):
-        try:
-            if language == "en":
-                send_email(
-                    user.email,
-                    'Welcome to our platform',
-                    {"name": user.first_name,
-                     "link": f"{settings.WEB_URL}/register-confirm/{user.id}/{user.reset_token}"},
-                    "user_verification.html"
-                )
-            elif language == "se":
-                send_email(
-                    user.email,
-                    'Välkommen till vår plattform',
-                    {"name": user.first_name,
-                     "link": f"{settings.WEB_URL}/register-confirm/{user.id}/{user.reset_token}"},
-                    "user_verification_se.html"
-                )
-        except Exception as ex:
-            raise serializers.ValidationError({'email': 'Failed to send email'})
-
     @staticmethod
     def update_language(languages_data, updated_by, user_instance):
         if languages_data:
@@ -195,7 +187,7 @@ class UserSerializer(CustomBaseSerializer):
                     try:
                         obj_instance = Language.objects.get(id=obj_id)
                         data["updated_by"] = updated_by
-                        data["updated_on"] = get_formatted_current_time()
+                        data["updated_on"] = get_current_datetime()
 
                         is_delete = data.pop("is_delete", False)
                         if is_delete:
@@ -249,16 +241,19 @@ class UserSerializer(CustomBaseSerializer):
     def get_available_roles(self, obj):
         return [role.name for role in obj.roles.all()]
 
+    def get_profile_image_urls(self, obj):
+        return get_image_urls(obj.profile_image, obj.profile_image_variants, self.context.get('request'))
+
     def to_representation(self, instance):
         representation = super().to_representation(instance)
         representation['manager_id'] = instance.manager_id if instance.manager else ""
         representation['manager_name'] = instance.manager.get_full_name() if instance.manager else ""
-        representation['skills'] = SkillSerializer(instance.skills.filter(is_delete=False), many=True).data
-        representation['languages'] = LanguageSerializer(instance.user_languages.filter(is_delete=False),
+        representation['skills'] = SkillSerializer(instance.skills.all(), many=True).data
+        representation['languages'] = LanguageSerializer(instance.user_languages.all(),
                                                          many=True).data
-        representation['projects'] = ProjectSerializer(instance.user_projects.filter(is_delete=False), many=True).data
+        representation['projects'] = ProjectSerializer(instance.user_projects.all(), many=True).data
         representation['certifications'] = CertificationSerializer(
-            instance.user_certifications.filter(is_delete=False), many=True
+            instance.user_certifications.all(), many=True
         ).data
 
         return representation
@@ -272,13 +267,15 @@ class UserSummarySerializer(CustomBaseSerializer):
     has_languages = serializers.SerializerMethodField()
     roles = serializers.SerializerMethodField()
     is_external = serializers.SerializerMethodField()
+    profile_image_urls = serializers.SerializerMethodField()
 
     class Meta:
         model = User
         fields = ['id', 'first_name', 'last_name', 'chat_id', 'email', 'country', 'phone_no',
                   'is_active', 'is_locked', 'is_face_id_verified', 'is_face_id_proceed', 'is_verified',
                   'has_completed_basic_details', 'has_organization',
-                  'has_associated_organization_details', 'has_skills', 'has_languages', 'roles', 'is_external']
+                  'has_associated_organization_details', 'has_skills', 'has_languages', 'roles', 'is_external',
+                  'profile_image_urls']
         read_only_fields = ('is_delete',)
 
     def get_has_completed_basic_details(self, obj):
@@ -317,6 +314,9 @@ class UserSummarySerializer(CustomBaseSerializer):
     def get_is_external(self, obj):
         return 0 if obj.organization else 1
 
+    def get_profile_image_urls(self, obj):
+        return get_image_urls(obj.profile_image, obj.profile_image_variants, self.context.get('request'))
+
     def to_representation(self, instance):
         representation = super().to_representation(instance)
         representation['manager_id'] = instance.manager_id if instance.manager else ""
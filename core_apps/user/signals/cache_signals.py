@@ -0,0 +1,15 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from common.base_cache import user_cache
+from core_apps.user.models import Role, Locale
+
+
+@receiver([post_save, post_delete], sender=Role)
+def role_cache_handler(sender, instance, **kwargs):
+    user_cache.delete(Role.IDS_CACHE_KEY)
+
+
+@receiver([post_save, post_delete], sender=Locale)
+def locale_cache_handler(sender, instance, **kwargs):
+    user_cache.delete(Locale.CATALOGUE_CACHE_KEY)
@@ -0,0 +1,26 @@
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from core_apps.user import tasks
+from core_apps.user.func.email_func import enqueue_after_commit
+from core_apps.user.models import Organization, User
+
+
+@receiver(post_save, sender=User)
+@receiver(post_save, sender=Organization)
+def image_variants_handler(sender, instance, **kwargs):
+    """
+    Queues the resizing of a new or cleared image once the transaction commits, after the request's last save.
+    A row saved several times in one request is queued once.
+    """
+    if kwargs.get('raw'):
+        return
+
+    label = sender._meta.label
+    field, variants_field = tasks.IMAGE_VARIANT_FIELDS[label]
+    name = getattr(instance, field).name or None
+    if name == getattr(instance, variants_field).get('source') or name == getattr(instance, '_variants_queued', False):
+        return
+
+    instance._variants_queued = name
+    enqueue_after_commit(tasks.make_image_variants, label, instance.pk)
@@ -0,0 +1,113 @@
+import logging
+from smtplib import SMTPException
+
+from celery import shared_task
+from django.apps import apps
+from django.conf import settings
+from PIL import Image
+
+from core_apps.user.models import CoWorker, User
+from utils.email_config import send_email
+from utils.image_variants import delete_variants, make_variants
+
+logger = logging.getLogger(__name__)
+
+# SMTP and connection errors are retried with exponential backoff (1s, 2s, 4s... up to 10 minutes, jittered)
+EMAIL_RETRY_OPTIONS = {
+    'autoretry_for': (SMTPException, OSError),
+    'retry_backoff': True,
+    'retry_backoff_max': 600,
+    'retry_jitter': True,
+    'max_retries': 6,
+}
+
+VERIFICATION_EMAILS = {
+    'en': ('Welcome to our platform', 'user_verification.html'),
+    'se': ('Välkommen till vår plattform', 'user_verification_se.html'),
+}
+
+# Image field and the JSON field holding its resized copies, by model
+IMAGE_VARIANT_FIELDS = {
+    'user.User': ('profile_image', 'profile_image_variants'),
+    'user.Organization': ('logo', 'logo_variants'),
+}
+
+CONNECTION_EMAILS = {
+    'en': ('Invitation to Connect with {organization} ', 'connection_accept.html'),
+    'se': ('Inbjudan att ansluta till {organization} ', 'connection_accept_se.html'),
+}
+
+
+@shared_task(**EMAIL_RETRY_OPTIONS)
+def send_verification_email(user_id, language='en'):
+    user = User.objects.filter(id=user_id).first()
+    if user is None or language not in VERIFICATION_EMAILS:
+        return False
+
+    subject, template = VERIFICATION_EMAILS[language]
+    return send_email(
+        user.email, subject,
+        {"name": user.first_name, "link": f"{settings.WEB_URL}/register-confirm/{user.id}/{user.reset_token}"},
+        template, fail_silently=False
+    )
+
+
+@shared_task(**EMAIL_RETRY_OPTIONS)
+def send_connection_email(co_worker_id, language='en'):
+    connection = CoWorker.objects.select_related('user', 'organization').filter(id=co_worker_id).first()
+    if connection is None or language not in CONNECTION_EMAILS:
+        return False
+
+    subject, template = CONNECTION_EMAILS[language]
+    return send_email(
+        connection.user.email, subject.format(organization=connection.organization.name),
+        {"name": connection.user.first_name,
+         "link": f"{settings.WEB_URL}/connection-accept/{connection.id}/{connection.token}",
+         "organization_name": connection.organization.name},
+        template, fail_silently=False
+    )
+
+
+@shared_task(**EMAIL_RETRY_OPTIONS)
+def send_forget_password_email(user_id):
+    user = User.objects.filter(id=user_id).first()
+    if user is None:
+        return False
+
+    return send_email(
+        user.email, 'Forget Password',
+        {"name": user.first_name, "link": f"{settings.WEB_URL}/register-confirm/{user.id}/{user.reset_token}"},
+        "change_password.html", fail_silently=False
+    )
+
+
+@shared_task
+def make_image_variants(model_label, pk):
+    """
+    Resizes the current image of the row and stores the variant names with the source they were made from. The
+    row is only updated if its image is still that source, otherwise the new copies are dropped; the copies of a
+    replaced image are deleted. An unreadable image is recorded without variants, clients keep the original.
+    """
+    model = apps.get_model(model_label)
+    field, variants_field = IMAGE_VARIANT_FIELDS[model_label]
+    row = model._base_manager.filter(pk=pk).values(field, variants_field).first()
+    if row is None:
+        return False
+
+    name, previous = row[field], row[variants_field] or {}
+    if previous.get('source') == (name or None):
+        return False
+
+    variants = {}
+    if name:
+        variants['source'] = name
+        try:
+            variants.update(make_variants(name))
+        except (OSError, ValueError, Image.DecompressionBombError):
+            logger.warning("Could not make variants of %s", name, exc_info=True)
+
+    if model._base_manager.filter(pk=pk, **{field: name}).update(**{variants_field: variants}):
+        delete_variants(previous)
+        return True
+    delete_variants(variants)
+    return False
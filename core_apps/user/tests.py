@@ -1,3 +1,232 @@
-from django.test import TestCase
+import asyncio
+import uuid
+from unittest import mock
 
-# Create your tests here.
+from django.test import RequestFactory, TestCase, override_settings
+from pymongo.errors import ServerSelectionTimeoutError
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework.test import APIClient
+
+from common.base_serializer import CustomBaseSerializer
+from core_apps.user.authentication import (ClaimsStatelessAuthentication, ClaimsUser, authenticate_async,
+                                           get_token_for_user)
+from core_apps.user.models import Certification, Chatroom, Language, Locale, Project, User
+from core_apps.user.views import chatroom_views
+
+
+class UpdateRelatedObjectsTest(TestCase):
+    """
+    Nested rows of the user serializer, written by CustomBaseSerializer.update_related_objects.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create(email='owner@example.com')
+        cls.other = User.objects.create(email='other@example.com')
+        cls.english = Locale.objects.create(language='English', symbol='en')
+        cls.swedish = Locale.objects.create(language='Swedish', symbol='se')
+
+    def certifications(self, count):
+        return [Certification.objects.create(user=self.user, title=f'Certification {i}', created_by=self.user)
+                for i in range(count)]
+
+    def test_mixed_updates_deletes_and_creates(self):
+        kept, deleted, updated_then_deleted, deleted_then_updated, untouched = self.certifications(5)
+        data = [
+            {'id': kept.id, 'title': 'Renamed'},
+            {'id': deleted.id, 'is_delete': True},
+            {'id': updated_then_deleted.id, 'title': 'Updated before delete'},
+            {'id': updated_then_deleted.id, 'is_delete': True},
+            {'id': deleted_then_updated.id, 'is_delete': True},
+            {'id': deleted_then_updated.id, 'title': 'Updated after delete'},
+            {'title': 'Created', 'institution': 'School'},
+        ]
+
+        # One read, one bulk update, one soft delete and one insert
+        with self.assertNumQueries(4):
+            CustomBaseSerializer.update_related_objects(self.user, data, Certification, 'user', self.other)
+
+        rows = {row.id: row for row in Certification.all_objects.filter(user=self.user)}
+        self.assertEqual(rows[kept.id].title, 'Renamed')
+        self.assertEqual(rows[kept.id].updated_by, self.other)
+        self.assertIsNotNone(rows[kept.id].updated_on)
+        self.assertFalse(rows[kept.id].is_delete)
+
+        self.assertTrue(rows[deleted.id].is_delete)
+        self.assertEqual(rows[deleted.id].deleted_by, self.other)
+        self.assertIsNotNone(rows[deleted.id].deleted_on)
+
+        # An update before the delete of the same row is written too, one after it is skipped
+        self.assertEqual(rows[updated_then_deleted.id].title, 'Updated before delete')
+        self.assertTrue(rows[updated_then_deleted.id].is_delete)
+        self.assertEqual(rows[deleted_then_updated.id].title, 'Certification 3')
+        self.assertTrue(rows[deleted_then_updated.id].is_delete)
+
+        self.assertEqual(rows[untouched.id].title, 'Certification 4')
+        self.assertIsNone(rows[untouched.id].updated_by)
+
+        created = Certification.objects.get(title='Created')
+        self.assertEqual((created.user, created.created_by, created.institution), (self.user, self.other, 'School'))
+        self.assertIsNotNone(created.created_on)
+
+    def test_query_count_does_not_grow_with_items(self):
+        rows = self.certifications(30)
+        data = ([{'id': row.id, 'title': 'Renamed'} for row in rows[:10]] +
+                [{'id': row.id, 'is_delete': True} for row in rows[10:20]] +
+                [{'title': f'New {i}'} for i in range(10)])
+
+        with self.assertNumQueries(4):
+            CustomBaseSerializer.update_related_objects(self.user, data, Certification, 'user', self.user)
+
+        self.assertEqual(Certification.objects.filter(user=self.user, title='Renamed').count(), 10)
+        self.assertEqual(Certification.all_objects.filter(user=self.user, is_delete=True).count(), 10)
+        self.assertEqual(Certification.objects.filter(user=self.user, title__startswith='New').count(), 10)
+
+    def test_string_ids(self):
+        row, = self.certifications(1)
+
+        CustomBaseSerializer.update_related_objects(self.user, [{'id': str(row.id), 'title': 'Renamed'}],
+                                                    Certification, 'user', self.user)
+
+        row.refresh_from_db()
+        self.assertEqual(row.title, 'Renamed')
+
+    def test_unknown_and_soft_deleted_ids_are_skipped(self):
+        row, = self.certifications(1)
+        row.delete()
+
+        CustomBaseSerializer.update_related_objects(
+            self.user, [{'id': row.id, 'title': 'Revived'}, {'id': row.id + 1000, 'title': 'Missing'}],
+            Certification, 'user', self.user
+        )
+
+        row = Certification.all_objects.get(id=row.id)
+        self.assertEqual(row.title, 'Certification 0')
+        self.assertTrue(row.is_delete)
+        self.assertFalse(Certification.all_objects.filter(title='Missing').exists())
+
+    def test_foreign_key_attname(self):
+        row, = self.certifications(1)
+
+        CustomBaseSerializer.update_related_objects(self.user, [{'id': row.id, 'user_id': self.other.id}],
+                                                    Certification, 'user', self.user)
+
+        row.refresh_from_db()
+        self.assertEqual(row.user_id, self.other.id)
+
+    def test_language_by_instance_and_by_id(self):
+        by_instance = Language.objects.create(user=self.user, language=self.english, expertise_level='basic')
+        by_id = Language.objects.create(user=self.user, language=self.english, expertise_level='basic')
+
+        CustomBaseSerializer.update_related_objects(self.user, [
+            {'id': by_instance.id, 'language': self.swedish, 'expertise_level': 'fluent'},
+            {'id': by_id.id, 'language_id': self.swedish.id},
+            {'language_id': self.swedish.id, 'expertise_level': 'native'},
+        ], Language, 'user', self.user)
+
+        by_instance.refresh_from_db()
+        by_id.refresh_from_db()
+        self.assertEqual((by_instance.language, by_instance.expertise_level), (self.swedish, 'fluent'))
+        self.assertEqual((by_id.language, by_id.expertise_level), (self.swedish, 'basic'))
+        self.assertTrue(Language.objects.filter(user=self.user, language=self.swedish, expertise_level='native')
+                        .exists())
+
+    def test_projects(self):
+        project = Project.objects.create(user=self.user, title='Project')
+
+        CustomBaseSerializer.update_related_objects(self.user, [
+            {'id': project.id, 'title': 'Renamed', 'to_date': '2024-01'},
+            {'title': 'Second'},
+        ], Project, 'user', self.user)
+
+        project.refresh_from_db()
+        self.assertEqual((project.title, project.to_date), ('Renamed', '2024-01'))
+        self.assertEqual(Project.objects.filter(user=self.user).count(), 2)
+
+
+class ChatHistoryTest(TestCase):
+    """
+    Access and parameter checks of the async history view, Mongo is left out.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create(email='user@example.com', is_verified=True)
+        cls.consumer = User.objects.create(email='consumer@example.com', is_verified=True)
+        cls.outsider = User.objects.create(email='outsider@example.com', is_verified=True)
+        cls.room_id = str(uuid.uuid4())
+        Chatroom.objects.create(init_user=cls.user, consumer=cls.consumer, chat_room_id=cls.room_id)
+
+    def get(self, user, **params):
+        token = get_token_for_user(user).access_token
+        with mock.patch.object(chatroom_views.MongoDBClient, 'get_chat_history_page',
+                               return_value=([], None, None)) as page:
+            response = self.client.get(f'/api/v1/chat-history/{self.room_id}/', params,
+                                       HTTP_AUTHORIZATION=f'Bearer {token}')
+        return response, page
+
+    def test_members_read_the_room(self):
+        for user in (self.user, self.consumer):
+            response, page = self.get(user, limit=1000)
+            self.assertEqual(response.status_code, 200)
+            page.assert_called_once_with(self.room_id, chatroom_views.AsyncMongoDBClient.MAX_LIMIT, None, None)
+
+    def test_other_users_get_404(self):
+        response, page = self.get(self.outsider)
+        self.assertEqual(response.status_code, 404)
+        page.assert_not_called()
+
+    def test_invalid_limit(self):
+        for limit in ('ten', 0, -1):
+            with self.subTest(limit):
+                response, page = self.get(self.user, limit=limit)
+                self.assertEqual(response.status_code, 400)
+                page.assert_not_called()
+
+
+class ChatroomListTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create(email='user@example.com', is_verified=True)
+        cls.consumer = User.objects.create(email='consumer@example.com', is_verified=True)
+        cls.room = Chatroom.objects.create(init_user=cls.user, consumer=cls.consumer, chat_room_id=str(uuid.uuid4()))
+
+    def test_rooms_are_listed_when_mongo_is_down(self):
+        client = APIClient()
+        client.force_authenticate(self.user)
+        with mock.patch.object(chatroom_views.MongoDBClient, 'get_last_messages',
+                               side_effect=ServerSelectionTimeoutError('down')), \
+                self.assertLogs(chatroom_views.logger, 'ERROR'):
+            response = client.get('/api/v1/chatroom/')
+
+        # Rendered like a room without messages, CustomBaseSerializer turns None into ''
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([(room['chat_room_id'], room['last_message']) for room in response.json()['data']],
+                         [(self.room.chat_room_id, '')])
+
+
+@override_settings(JWT_ROLE_CLAIMS=True)
+class ClaimsAuthenticationTest(TestCase):
+    """
+    Users built from the token claims, without reading the user row.
+    """
+
+    def authenticate(self, **flags):
+        user = User.objects.create(email=f'{uuid.uuid4().hex}@example.com', is_verified=True, **flags)
+        token = get_token_for_user(user).access_token
+        stateless = ClaimsStatelessAuthentication()
+        request = RequestFactory().get('/', HTTP_AUTHORIZATION=f'Bearer {token}')
+        return (lambda: stateless.get_user(stateless.get_validated_token(str(token))),
+                lambda: asyncio.run(authenticate_async(request)))
+
+    def test_active_user(self):
+        for authenticate in self.authenticate():
+            with self.assertNumQueries(0):
+                user = authenticate()
+            self.assertIsInstance(user, ClaimsUser)
+
+    def test_inactive_and_locked_users_are_refused(self):
+        for flags in ({'is_active': False}, {'is_locked': True}):
+            for authenticate in self.authenticate(**flags):
+                with self.subTest(flags), self.assertRaises(AuthenticationFailed):
+                    authenticate()
@@ -1,6 +1,7 @@
 from django.urls import re_path
 
-from core_apps.user.views.chatroom_views import ChatroomView
+from core_apps.user.views.cache_views import CacheStatsView
+from core_apps.user.views.chatroom_views import ChatroomView, chat_history
 from core_apps.user.views.language_views import LanguageView
 from core_apps.user.views.user_views import UserView, update_password, LoginView, GetAllUserView, forget_password, \
     RegisterView, GetAllUserSummaryView, GetExternalConsultantsView, GetOrganizationView, connection_accept, \
@@ -19,7 +20,9 @@ urlpatterns = [
     re_path(r'^login/$', LoginView.as_view(), name='user'),
     re_path(r'^language/$', LanguageView.as_view(), name='user'),
     re_path(r'^chatroom/?(?P<object_id>[0-9a-f-]+)?/$', ChatroomView.as_view(), name='chatroom'),
+    re_path(r'^chat-history/(?P<room_id>[0-9a-f-]+)/$', chat_history, name='chat_history'),
     re_path(r'^connection/$', ConsultantView.as_view(), name='user'),
     re_path(r'^connection-accept/?(?P<conn_id>[\d]+)?/$', connection_accept, name='user'),
     re_path(r'^get-user-status/$', get_user_status, name='get_user_status'),
+    re_path(r'^cache-stats/$', CacheStatsView.as_view(), name='cache_stats'),
 ]
@@ -0,0 +1,14 @@
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+
+from common.base_cache import get_cache_stats
+from common.base_permission import IsSuperAdmin
+from common.base_view import BaseView, custom_exception_handler
+
+
+class CacheStatsView(BaseView):
+    permission_classes = [IsAuthenticated, IsSuperAdmin]
+
+    @custom_exception_handler
+    def get(self, request):
+        return Response({"data": get_cache_stats()})
@@ -1,16 +1,25 @@
+import logging
 import uuid
 
+from asgiref.sync import sync_to_async
 from django.db import transaction
 from django.db.models import Q
+from django.http import HttpResponseNotAllowed
+from pymongo.errors import PyMongoError
 from rest_framework import status
+from rest_framework.exceptions import NotAuthenticated, NotFound
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
-from common.base_mongo import MongoDBClient
-from common.base_view import BaseView, custom_exception_handler
+from common.base_mongo import AsyncMongoDBClient, MongoDBClient, is_asgi_request
+from common.base_view import (BaseView, async_exception_handler, custom_exception_handler, json_response,
+                              positive_int)
+from core_apps.user.authentication import authenticate_async
 from core_apps.user.models import Chatroom, User
 from core_apps.user.serializers.chatroom_serializer import ChatRoomSerializer
 
+logger = logging.getLogger(__name__)
+
 
 # Create your views here.
 class ChatroomView(BaseView):
@@ -46,13 +55,60 @@ class ChatroomView(BaseView):
     def get(self, request, object_id=None):
         if object_id:
             m_class = MongoDBClient()
-            page = int(request.GET.get('page', 1))
             limit = int(request.GET.get('limit', 10))
-            data = m_class.get_chat_history(object_id, page, limit)
-            return Response({"message": "Successfully retrieved", "data": data}, status=status.HTTP_200_OK)
+            if 'page' in request.GET:
+                # Offset pages, kept for clients that have not moved to before/after yet
+                page = int(request.GET.get('page', 1))
+                data = m_class.get_chat_history(object_id, page, limit)
+                return Response({"message": "Successfully retrieved", "data": data}, status=status.HTTP_200_OK)
+
+            data, before, after = m_class.get_chat_history_page(
+                object_id, limit, before=request.GET.get('before') or None, after=request.GET.get('after') or None
+            )
+            return Response({"message": "Successfully retrieved", "data": data, "before": before, "after": after},
+                            status=status.HTTP_200_OK)
         else:
-            chat_rooms = Chatroom.objects.filter(Q(init_user=request.user) | Q(consumer=request.user))
+            chat_rooms = Chatroom.objects.filter(
+                Q(init_user=request.user) | Q(consumer=request.user)
+            ).select_related('init_user', 'consumer').order_by("-id")
             page = self.paginate_queryset(chat_rooms, request)
-            serializer = self.serializer_class(page, many=True, context={'request': request})
-            count = chat_rooms.count()
-            return Response({"data": serializer.data, "count": count})
+            try:
+                last_messages = MongoDBClient().get_last_messages(
+                    [room.chat_room_id for room in page if room.chat_room_id]
+                )
+            except PyMongoError:
+                # The rooms are listed without their last message rather than not at all
+                logger.exception("Could not read the last messages of the chat rooms")
+                last_messages = {}
+            serializer = self.serializer_class(page, many=True,
+                                               context={'request': request, 'last_messages': last_messages})
+            return self.paginated_response(page, serializer.data)
+
+
+@async_exception_handler
+async def chat_history(request, room_id):
+    """
+    Async version of ChatroomView.get for one room's history (before/after cursors only). Under ASGI the worker
+    awaits Mongo instead of holding a thread for the round trip.
+    """
+    # Django 4.2's require_GET cannot wrap a coroutine view
+    if request.method != 'GET':
+        return HttpResponseNotAllowed(['GET'])
+    user = await authenticate_async(request)
+    if user is None:
+        raise NotAuthenticated()
+    limit = min(positive_int(request.GET.get('limit', 10), "limit"), AsyncMongoDBClient.MAX_LIMIT)
+
+    # Only the two users of the room may read it
+    members = Q(init_user_id=user.id) | Q(consumer_id=user.id)
+    if not await Chatroom.objects.filter(members, chat_room_id=room_id).aexists():
+        raise NotFound()
+
+    before, after = request.GET.get('before') or None, request.GET.get('after') or None
+    if is_asgi_request(request):
+        data, before, after = await AsyncMongoDBClient().get_chat_history_page(room_id, limit, before, after)
+    else:
+        # A WSGI server gives each async view a new event loop, an async client made on it would never be closed
+        data, before, after = await sync_to_async(MongoDBClient().get_chat_history_page)(room_id, limit, before,
+                                                                                         after)
+    return json_response({"message": "Successfully retrieved", "data": data, "before": before, "after": after})
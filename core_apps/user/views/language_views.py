@@ -2,6 +2,7 @@
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
+from common.base_cache import user_cache
 from common.base_view import custom_exception_handler
 from common.crud_mixin import CRUDMixin
 from core_apps.user.models import Locale
@@ -13,16 +14,20 @@ class LanguageView(CRUDMixin):
     permission_classes = [IsAuthenticated]
     serializer_class = LocaleSerializer
     model = Locale
+    stateless_read = True
 
     @custom_exception_handler
     def get(self, request, ):
-        instances = self.model.objects.filter(is_delete=False).order_by("language")
+        instances = self.model.objects.order_by("language")
 
         keyword = request.query_params.get('keyword')
 
         if keyword:
             instances = instances.filter(language__icontains=keyword)
+            serializer = self.serializer_class(instances, many=True)
+            return Response({"data": serializer.data})
 
         # page = self.paginate_queryset(instances, request)
-        serializer = self.serializer_class(instances, many=True)
-        return Response({"data": serializer.data})
+        data = user_cache.get_or_set(self.model.CATALOGUE_CACHE_KEY,
+                                     lambda: list(self.serializer_class(instances, many=True).data))
+        return Response({"data": data})
@@ -16,7 +16,7 @@ class SkillView(CRUDMixin):
 
     @custom_exception_handler
     def get(self, request, ):
-        instances = self.model.objects.filter(is_delete=False).order_by("skill")
+        instances = self.model.objects.order_by("skill")
 
         keyword = request.query_params.get('keyword')
 
@@ -12,11 +12,11 @@ from rest_framework.exceptions import ValidationError
 from rest_framework.permissions import IsAuthenticated, AllowAny
 from rest_framework.response import Response
 from rest_framework.views import APIView
-from rest_framework_simplejwt.tokens import RefreshToken
 
 from common.base_permission import IsAdmin, IsConsultantManager, IsConsultant
 from common.base_view import custom_exception_handler, BaseView
 from common.crud_mixin import CRUDMixin
+from core_apps.user.authentication import get_token_for_user, revoke_token_claims
 from core_apps.user.func.email_func import send_forget_password_email
 from core_apps.user.models import User, CoWorker, Organization
 from core_apps.user.serializers.common_serializers import UserIdNameSerializer, OrganizationIdNameSerializer
@@ -52,7 +52,7 @@ class UserView(CRUDMixin):
         except User.DoesNotExist:
             raise ValidationError("User not found")
 
-        serializer = self.serializer_class(user)
+        serializer = self.serializer_class(user, context={'request': request})
 
         return Response(serializer.data)
 
@@ -161,13 +161,14 @@ class LoginView(APIView):
             if user.login_attempts >= 5:
                 user.is_locked = True
                 user.description = "Account locked due to multiple login attempts"
+                revoke_token_claims(user)
             user.save()
         except User.DoesNotExist:
             pass
 
     @staticmethod
     def compose_data(user):
-        refresh = RefreshToken.for_user(user)
+        refresh = get_token_for_user(user)
         user_data = UserSummarySerializer(user).data
         return {
             "message": "Successfully logged in",
@@ -226,10 +227,11 @@ class GetAllUserView(BaseView):
         if u_status:
             users = users.filter(is_active=u_status)
 
+        users = users.select_related('organization', 'manager').prefetch_related('roles', 'skills', 'user_languages')
         page = self.paginate_queryset(users, request)
-        serializer = self.serializer_class(page, many=True)
+        serializer = self.serializer_class(page, many=True, context={'request': request})
 
-        return Response(serializer.data)
+        return self.paginated_response(page, serializer.data, counted=False)
 
 
 class GetExternalConsultantsView(BaseView):
@@ -275,7 +277,7 @@ class GetExternalConsultantsView(BaseView):
         page = self.paginate_queryset(users, request)
         serializer = self.serializer_class(page, many=True)
 
-        return Response(serializer.data)
+        return self.paginated_response(page, serializer.data, counted=False)
 
 
 class GetOrganizationView(BaseView):
@@ -298,7 +300,7 @@ class GetOrganizationView(BaseView):
         page = self.paginate_queryset(organizations, request)
         serializer = self.serializer_class(page, many=True)
 
-        return Response(serializer.data)
+        return self.paginated_response(page, serializer.data, counted=False)
 
 
 class GetAllUserSummaryView(BaseView):
@@ -356,7 +358,7 @@ def connection_accept(request, conn_id):
         return Response({'message': 'Authorization header is missing'}, status=status.HTTP_401_UNAUTHORIZED)
 
     try:
-        coworker = CoWorker.objects.get(id=conn_id, is_delete=False)
+        coworker = CoWorker.objects.get(id=conn_id)
 
         if not auth_header == coworker.token or coworker.is_token_valid is False:
             return Response({'message': 'Unauthorized'}, status=status.HTTP_401_UNAUTHORIZED)
@@ -395,7 +397,7 @@ class GetUserByRoleView(BaseView):
             page = self.paginate_queryset(users, request)
             serializer = self.serializer_class(page, many=True)
 
-            return Response(serializer.data)
+            return self.paginated_response(page, serializer.data, counted=False)
         else:
             raise Exception("User is not authorized to view this page")
 
@@ -418,7 +420,7 @@ def get_user_status(request):
         user_status = 'internal' if user.organization == requesting_user.organization else 'exist'
     else:
         is_coworker = CoWorker.objects.filter(
-            user=user, organization=requesting_user.organization, is_delete=False
+            user=user, organization=requesting_user.organization
         ).exists()
         user_status = 'internal' if is_coworker else 'external'
 
@@ -42,6 +42,7 @@ LOCAL_APPS = [
     "core_apps.user",
     "core_apps.task",
     "core_apps.bid",
+    "core_apps.upload",
 ]
 
 INSTALLED_APPS = DJANGO_APPS + THIRD_PARTY_APPS + LOCAL_APPS
@@ -92,6 +93,31 @@ DATABASES = {
     }
 }
 
+# Cache
+# Redis when CACHE_REDIS_URL is set, otherwise an in-process local memory cache (tests, runs without services).
+# Every app gets its own alias so keys are namespaced, bump CACHE_VERSION to invalidate all keys on deploy.
+
+CACHE_REDIS_URL = env('CACHE_REDIS_URL', default='')
+CACHE_VERSION = env.int('CACHE_VERSION', default=1)
+CACHE_TIMEOUT = env.int('CACHE_TIMEOUT', default=300)
+
+CACHES = {
+    alias: {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': CACHE_REDIS_URL,
+        'KEY_PREFIX': f'sparetan:{alias}',
+        'VERSION': CACHE_VERSION,
+        'TIMEOUT': CACHE_TIMEOUT,
+    } if CACHE_REDIS_URL else {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': alias,
+        'KEY_PREFIX': alias,
+        'VERSION': CACHE_VERSION,
+        'TIMEOUT': CACHE_TIMEOUT,
+    }
+    for alias in ('default', 'user', 'task', 'bid')
+}
+
 # Password validation
 # https://docs.djangoproject.com/en/4.2/ref/settings/#auth-password-validators
 
@@ -138,7 +164,7 @@ AUTH_USER_MODEL = 'user.User'
 
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'core_apps.user.authentication.ClaimsJWTAuthentication',
     ],
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.AllowAny',
@@ -147,7 +173,10 @@ REST_FRAMEWORK = {
         'rest_framework.parsers.JSONParser',
         'rest_framework.parsers.FormParser',
         'rest_framework.parsers.MultiPartParser',
-    )
+    ),
+    # Same shape as the strings the timestamp columns used to hold
+    'DATETIME_FORMAT': '%Y-%m-%d %H:%M:%S',
+    'DATETIME_INPUT_FORMATS': ['%Y-%m-%d %H:%M:%S', '%Y-%m-%d %H:%M', '%Y-%m-%dT%H:%M', '%Y-%m-%d', 'iso-8601'],
 }
 
 SIMPLE_JWT = {
@@ -158,12 +187,51 @@ SIMPLE_JWT = {
     'BLACKLIST_AFTER_ROTATION': True,
 }
 
+# Embed role names, organization id and account flags in access tokens (see core_apps.user.authentication)
+JWT_ROLE_CLAIMS = env.bool('JWT_ROLE_CLAIMS', default=False)
+
 CORS_ORIGIN_ALLOW_ALL = True
 CORS_ALLOW_HEADERS = ["*"]
 
 MEDIA_URL = '/media/'
 MEDIA_ROOT = os.path.join(BASE_DIR, 'media')
 
+# Where uploaded files live: 'local' (MEDIA_ROOT, served by the app) or 's3', an S3 compatible bucket (AWS, MinIO)
+# that clients download from and upload to directly with short lived presigned URLs.
+MEDIA_STORAGE = env('MEDIA_STORAGE', default='local')
+# Lifetime in seconds of download URLs, presigned on the bucket or signed for the app's media view
+MEDIA_URL_EXPIRE = env.int('MEDIA_URL_EXPIRE', default=300)
+# How the media view hands a local file over once access is checked: '' streams it from Django (with Range
+# support), 'nginx' answers with X-Accel-Redirect to MEDIA_ACCEL_PREFIX (an internal location aliasing
+# MEDIA_ROOT), 'apache' with X-Sendfile (mod_xsendfile). The proxy then serves the bytes and Range requests.
+MEDIA_SENDFILE = env('MEDIA_SENDFILE', default='')
+MEDIA_ACCEL_PREFIX = env('MEDIA_ACCEL_PREFIX', default='/protected-media/')
+if MEDIA_STORAGE == 's3':
+    STORAGES = {
+        'default': {'BACKEND': 'storages.backends.s3.S3Storage'},
+        'staticfiles': {'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage'},
+    }
+    AWS_STORAGE_BUCKET_NAME = env('AWS_STORAGE_BUCKET_NAME')
+    # Credentials fall back to boto3's own chain (environment, instance role) when unset
+    AWS_S3_ACCESS_KEY_ID = env('AWS_S3_ACCESS_KEY_ID', default=None)
+    AWS_S3_SECRET_ACCESS_KEY = env('AWS_S3_SECRET_ACCESS_KEY', default=None)
+    AWS_S3_REGION_NAME = env('AWS_S3_REGION_NAME', default=None)
+    # Set for MinIO and other S3 compatible servers, with AWS_S3_ADDRESSING_STYLE=path
+    AWS_S3_ENDPOINT_URL = env('AWS_S3_ENDPOINT_URL', default=None)
+    AWS_S3_ADDRESSING_STYLE = env('AWS_S3_ADDRESSING_STYLE', default=None)
+    AWS_S3_SIGNATURE_VERSION = 's3v4'
+    AWS_DEFAULT_ACL = None
+    AWS_S3_FILE_OVERWRITE = False
+    AWS_QUERYSTRING_AUTH = True
+    AWS_QUERYSTRING_EXPIRE = MEDIA_URL_EXPIRE
+# Lifetime in seconds of presigned upload forms
+MEDIA_UPLOAD_URL_EXPIRE = env.int('MEDIA_UPLOAD_URL_EXPIRE', default=900)
+
+# Largest request accepted by the multipart upload endpoint (core_apps/upload)
+UPLOAD_MAX_SIZE = env.int('UPLOAD_MAX_SIZE', default=50 * 1024 * 1024)
+# Largest decoded file still accepted as base64 inside JSON bodies
+BASE64_UPLOAD_MAX_SIZE = env.int('BASE64_UPLOAD_MAX_SIZE', default=5 * 1024 * 1024)
+
 EMAIL_BACKEND = env('EMAIL_BACKEND')
 EMAIL_HOST = env('EMAIL_HOST')
 EMAIL_USE_TLS = env('EMAIL_USE_TLS')
@@ -172,13 +240,15 @@ EMAIL_HOST_USER = env('EMAIL_HOST_USER')
 EMAIL_HOST_PASSWORD = env('EMAIL_HOST_PASSWORD')
 DEFAULT_FROM_EMAIL = env('DEFAULT_FROM_EMAIL')
 
-# CELERY_BROKER_URL = env('CELERY_BROKER')
-# CELERY_RESULT_BACKEND = CELERY_BROKER_URL
-# CELERY_ACCEPT_CONTENT = ['json']
-# CELERY_TASK_SERIALIZER = 'json'
-# CELERY_RESULT_SERIALIZER = 'json'
-# CELERY_RESULT_BACKEND_MAX_RETRIES = 10
-# CELERY_TASK_SEND_SENT_EVENT = True
+CELERY_BROKER_URL = env('CELERY_BROKER', default='redis://localhost:6379/0')
+CELERY_ACCEPT_CONTENT = ['json']
+CELERY_TASK_SERIALIZER = 'json'
+# Tasks are fire and forget (emails), nobody reads their results
+CELERY_TASK_IGNORE_RESULT = True
+CELERY_TASK_SEND_SENT_EVENT = True
+# Eager mode runs tasks inline in the caller, for tests and runs without a broker or worker
+CELERY_TASK_ALWAYS_EAGER = env.bool('CELERY_TASK_ALWAYS_EAGER', default=False)
+CELERY_TASK_EAGER_PROPAGATES = CELERY_TASK_ALWAYS_EAGER
 
 if USE_TZ:
     CELERY_TIMEZONE = TIME_ZONE
@@ -186,3 +256,10 @@ if USE_TZ:
 WEB_URL = env('WEB_URL')
 BACKEND_URL = env('BACKEND_URL')
 MONGO_DB_HOST = env('MONGO_DB_HOST')
+MONGO_DB_NAME = env('MONGO_DB_NAME', default='PearsChatDB')
+# One pooled client per process (common/base_mongo.py), sized per worker process
+MONGO_MAX_POOL_SIZE = env.int('MONGO_MAX_POOL_SIZE', default=50)
+MONGO_MIN_POOL_SIZE = env.int('MONGO_MIN_POOL_SIZE', default=0)
+MONGO_SERVER_SELECTION_TIMEOUT_MS = env.int('MONGO_SERVER_SELECTION_TIMEOUT_MS', default=5000)
+MONGO_CONNECT_TIMEOUT_MS = env.int('MONGO_CONNECT_TIMEOUT_MS', default=5000)
+MONGO_SOCKET_TIMEOUT_MS = env.int('MONGO_SOCKET_TIMEOUT_MS', default=10000)
@@ -15,7 +15,6 @@ Including another URLconf
     2. Add a URL to urlpatterns:  path('blog/', include('blog.urls'))
 """
 from django.conf import settings
-from django.conf.urls.static import static
 from django.contrib import admin
 from django.urls import path
 
@@ -24,11 +23,17 @@ from rest_framework_simplejwt.views import (
     TokenRefreshView,
 )
 
+from core_apps.upload.views.views import MediaView
 from core_apps.user.views.custom_token_refresh_view import CustomTokenRefreshView
 
 urlpatterns = [
                   path('api/v1/', include('core_apps.user.urls')),
                   path('api/v1/', include('core_apps.task.urls')),
                   path('api/v1/', include('core_apps.bid.urls')),
+                  path('api/v1/', include('core_apps.upload.urls')),
                   path('api/v1/token/refresh/', CustomTokenRefreshView.as_view(), name='token_refresh')
-              ] + static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
+              ]
+
+if settings.MEDIA_STORAGE == 'local':
+    # Local files are only served after an access check, see MediaView
+    urlpatterns.append(re_path(rf'^{settings.MEDIA_URL.lstrip("/")}(?P<name>.+)$', MediaView.as_view(), name='media'))
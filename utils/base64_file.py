@@ -0,0 +1,32 @@
+import base64
+import binascii
+import secrets
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from rest_framework.exceptions import ValidationError
+
+
+def decode_base64_file(value):
+    """
+    Decodes a "data:<type>/<extension>;base64,<data>" string into a ContentFile with a random name. Kept for
+    clients that have not moved to the upload endpoint; payloads over BASE64_UPLOAD_MAX_SIZE decoded bytes are
+    refused before decoding, as the whole file sits in memory several times over.
+    """
+    try:
+        file_format, file_str = value.split(';base64,')
+    except (AttributeError, ValueError):
+        raise ValidationError("Invalid file")
+
+    if len(file_str) * 3 // 4 > settings.BASE64_UPLOAD_MAX_SIZE:
+        raise ValidationError(
+            f"File larger than {settings.BASE64_UPLOAD_MAX_SIZE} bytes, send it to the upload endpoint instead"
+        )
+
+    try:
+        file_data = base64.b64decode(file_str)
+    except (binascii.Error, ValueError):
+        raise ValidationError("Invalid file")
+
+    file_extension = file_format.split('/')[-1]
+    return ContentFile(file_data, name=f'{secrets.token_hex(8)}.{file_extension}')
@@ -3,13 +3,17 @@ import datetime
 from datetime import timedelta, time, date
 import calendar
 
+from django.utils import timezone
+
 
 def naive_datetime(datetime_str):
     # List of datetime formats we want to support
     formats = [
         "%Y-%m-%d",
         "%Y-%m-%d %H:%M",
-        "%Y-%m-%dT%H:%M"
+        "%Y-%m-%dT%H:%M",
+        "%Y-%m-%d %H:%M:%S",
+        "%Y-%m-%dT%H:%M:%S"
     ]
     # Try each format until one successfully parses the datetime_str
     for fmt in formats:
@@ -33,6 +37,10 @@ def get_formatted_current_time():
     return datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
 
+def get_current_datetime():
+    return timezone.now()
+
+
 def get_timestamp():
     ts = datetime.datetime.now().timestamp()
     return str(ts)
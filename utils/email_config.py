@@ -7,7 +7,11 @@ env = environ.Env(
 )
 
 
-def send_email(email, subject, values, template):
+def send_email(email, subject, values, template, fail_silently=True):
+    """
+    Sends the rendered template as an HTML email. Failures are printed and reported as False, unless fail_silently
+    is False (Celery tasks), then they are raised so the task can retry.
+    """
     try:
         # from_email = "Sparetan {0}".format(env("DEFAULT_FROM_EMAIL"))
         from_email = env("DEFAULT_FROM_EMAIL")
@@ -21,5 +25,7 @@ def send_email(email, subject, values, template):
         return True
 
     except Exception as ex:
+        if not fail_silently:
+            raise
         print("Email failed to send " + str(ex))
         return False
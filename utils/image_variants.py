@@ -0,0 +1,71 @@
+import io
+import re
+
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from PIL import Image, ImageOps
+
+# Longest side in pixels of the resized copies kept next to each profile image and logo
+VARIANT_SIZES = (64, 256)
+VARIANT_FORMATS = {
+    'webp': ('WEBP', {'quality': 80, 'method': 4}),
+    'jpeg': ('JPEG', {'quality': 82, 'optimize': True, 'progressive': True}),
+}
+VARIANT_NAME = re.compile(r'^(?P<source>.+)\.(?P<size>\d+)\.(?P<extension>webp|jpeg)$')
+
+
+def variant_name(name, size, extension):
+    return f'{name}.{size}.{extension}'
+
+
+def source_name(name):
+    """
+    Storage name of the original a variant was made from, the name itself when it is not a variant.
+    """
+    match = VARIANT_NAME.match(name)
+    if match and int(match['size']) in VARIANT_SIZES:
+        return match['source']
+    return name
+
+
+def make_variants(name, storage=default_storage):
+    """
+    Writes the resized copies of the stored image in every size and format, returns their storage names as
+    {size: {extension: name}}. The copies are re-encoded from the pixels only, so EXIF (GPS position, camera) and
+    other metadata are dropped, with the EXIF orientation applied first. Images are only ever shrunk.
+    """
+    with storage.open(name, 'rb') as file:
+        image = Image.open(file)
+        # JPEGs are decoded at a reduced scale straight away, close to the largest size needed
+        image.draft('RGB', (max(VARIANT_SIZES), max(VARIANT_SIZES)))
+        image = ImageOps.exif_transpose(image)
+
+    has_alpha = image.mode in ('RGBA', 'LA', 'PA') or 'transparency' in image.info
+    image = image.convert('RGBA' if has_alpha else 'RGB')
+
+    variants = {}
+    for size in sorted(VARIANT_SIZES, reverse=True):
+        # Each size is resized from the previous, larger one
+        image.thumbnail((size, size), Image.Resampling.LANCZOS)
+        opaque = flatten(image) if has_alpha else image
+        for extension, (image_format, options) in VARIANT_FORMATS.items():
+            buffer = io.BytesIO()
+            (image if extension == 'webp' else opaque).save(buffer, image_format, **options)
+            target = variant_name(name, size, extension)
+            # Names are fixed so access checks can map them back to the original, a stale copy is replaced
+            storage.delete(target)
+            variants.setdefault(str(size), {})[extension] = storage.save(target, ContentFile(buffer.getvalue()))
+    return variants
+
+
+def delete_variants(variants, storage=default_storage):
+    for size, names in variants.items():
+        if isinstance(names, dict):
+            for name in names.values():
+                storage.delete(name)
+
+
+def flatten(image):
+    background = Image.new('RGB', image.size, (255, 255, 255))
+    background.paste(image, mask=image.getchannel('A'))
+    return background